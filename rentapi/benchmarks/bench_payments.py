@@ -0,0 +1,110 @@
+"""Benchmark of the payment gateway client under a slow gateway.
+
+Authorizes and captures charges concurrently against the local stand-in
+gateway with added latency and transient failures, while a ticker
+measures how late the event loop wakes it up. Run from the `rentapi`
+directory:
+
+    python -m benchmarks.bench_payments --payments 500 --latency 0.2
+
+The run time stays close to a few round-trips of the gateway and the
+loop lag stays in milliseconds, i.e. waiting for payments does not
+stall unrelated requests.
+"""
+
+import argparse
+import asyncio
+import logging
+import statistics
+import time
+
+import httpx
+
+from src.infrastructure.payments.fake import create_fake_gateway
+from src.infrastructure.payments.http import HttpPaymentGateway
+
+
+async def measure_lag(interval: float, lags: list[float]) -> None:
+    """A function recording how late the event loop runs a sleeper.
+
+    Args:
+        interval (float): The sleep between samples in seconds.
+        lags (list[float]): The collected delays in seconds.
+    """
+    while True:
+        started = time.perf_counter()
+        await asyncio.sleep(interval)
+        lags.append(time.perf_counter() - started - interval)
+
+
+async def run(args: argparse.Namespace) -> None:
+    """A function paying concurrently and reporting the measurements.
+
+    Args:
+        args (argparse.Namespace): The command line arguments.
+    """
+    gateway = HttpPaymentGateway(
+        base_url="http://payment-gateway",
+        api_key=None,
+        timeout=10.0,
+        connect_timeout=2.0,
+        retries=args.retries,
+        base_delay=0.05,
+        max_delay=0.5,
+        max_connections=args.concurrency,
+        transport=httpx.ASGITransport(
+            app=create_fake_gateway(args.latency, args.failure_rate),
+        ),
+    )
+    semaphore = asyncio.Semaphore(args.concurrency)
+    lags: list[float] = []
+    failures = 0
+
+    async def pay(i: int) -> None:
+        nonlocal failures
+        async with semaphore:
+            try:
+                charge = await gateway.authorize(
+                    amount=100.0,
+                    currency="pln",
+                    payment_method="pm_card_visa",
+                    idempotency_key=f"bench-{i}-authorize",
+                )
+                await gateway.capture(charge.id, f"bench-{i}-capture")
+            except RuntimeError:
+                failures += 1
+
+    ticker = asyncio.create_task(measure_lag(0.01, lags))
+    started = time.perf_counter()
+    await asyncio.gather(*(pay(i) for i in range(args.payments)))
+    elapsed = time.perf_counter() - started
+    ticker.cancel()
+    await gateway.aclose()
+
+    print(f"payments:        {args.payments} ({failures} failed)")
+    print(f"elapsed:         {elapsed:.3f} s")
+    print(f"sequential est.: {args.payments * 2 * args.latency:.3f} s")
+    print(f"loop lag p50:    {statistics.median(lags) * 1000:.3f} ms")
+    print(f"loop lag max:    {max(lags) * 1000:.3f} ms")
+
+
+def main() -> None:
+    """The entry point of the benchmark."""
+    parser = argparse.ArgumentParser(
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("--payments", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=100)
+    parser.add_argument("--latency", type=float, default=0.2)
+    parser.add_argument("--failure-rate", type=float, default=0.1)
+    parser.add_argument("--retries", type=int, default=5)
+    args = parser.parse_args()
+
+    # Retried gateway failures are expected here, not worth a log line.
+    logging.disable(logging.WARNING)
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
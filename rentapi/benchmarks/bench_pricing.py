@@ -0,0 +1,132 @@
+"""Micro-benchmark of pricing a rental.
+
+Compares the compiled `PricingEngine` with walking the rules for every
+rented day. Run from the `rentapi` directory:
+
+    python -m benchmarks.bench_pricing --seasons 50 --stays 10
+"""
+
+import argparse
+import random
+import timeit
+from datetime import date, datetime, timedelta, timezone
+
+from src.core.domain.pricing import PricingRules, SeasonRule, StayDiscount
+from src.infrastructure.utils.pricing import PricingEngine, rental_days
+
+
+def make_rules(seasons: int, stays: int) -> PricingRules:
+    """A function generating random season and length-of-stay rules.
+
+    Args:
+        seasons (int): The number of season rules.
+        stays (int): The number of length-of-stay rules.
+
+    Returns:
+        PricingRules: The rules.
+    """
+    year = date.today().year
+    rules = []
+
+    for i in range(seasons):
+        start = date(year, 1, 1) + timedelta(days=random.randint(0, 364))
+        rules.append(SeasonRule(
+            name=f"season-{i}",
+            start=start,
+            end=start + timedelta(days=random.randint(1, 60)),
+            multiplier=random.uniform(0.8, 1.5),
+            yearly=random.random() < 0.5,
+        ))
+
+    return PricingRules(
+        seasons=rules,
+        stay_discounts=[
+            StayDiscount(min_days=days, discount=min(0.5, days / 100))
+            for days in random.sample(range(2, 60), stays)
+        ],
+    )
+
+
+def naive_price(
+        rules: PricingRules,
+        price_per_day: float,
+        start: datetime,
+        end: datetime,
+) -> float:
+    """A function pricing a rental by checking every rule for every day.
+
+    Args:
+        rules (PricingRules): The rules.
+        price_per_day (float): The base rate of the car.
+        start (datetime): The start of the rental.
+        end (datetime): The end of the rental.
+
+    Returns:
+        float: The price rounded to cents.
+    """
+    days = rental_days(start, end)
+    first = start.astimezone(timezone.utc).date()
+    units = 0.0
+
+    for offset in range(days):
+        day = first + timedelta(days=offset)
+        multiplier = 1.0
+        for season in rules.seasons:
+            if season.yearly:
+                try:
+                    season_start = season.start.replace(year=day.year)
+                except ValueError:
+                    season_start = date(day.year, 2, 28)
+                candidates = (
+                    season_start,
+                    season_start.replace(year=day.year - 1),
+                )
+                length = season.end - season.start
+                if any(s <= day <= s + length for s in candidates):
+                    multiplier *= season.multiplier
+            elif season.start <= day <= season.end:
+                multiplier *= season.multiplier
+        units += multiplier
+
+    factor = 1.0
+    for stay in rules.stay_discounts:
+        if days >= stay.min_days:
+            factor = min(factor, 1 - stay.discount)
+
+    return round(price_per_day * units * factor, 2)
+
+
+def main() -> None:
+    """The entry point of the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--seasons", type=int, default=50)
+    parser.add_argument("--stays", type=int, default=10)
+    parser.add_argument("--days", type=int, default=14)
+    parser.add_argument("--number", type=int, default=2000)
+    args = parser.parse_args()
+
+    random.seed(7)
+    rules = make_rules(args.seasons, args.stays)
+    compile_ms = min(timeit.repeat(lambda: PricingEngine(rules), number=1,
+                                   repeat=3)) * 1000
+    engine = PricingEngine(rules)
+
+    start = datetime.now(timezone.utc) + timedelta(days=30)
+    end = start + timedelta(days=args.days)
+    assert abs(
+        engine.total_price(80.0, start, end)
+        - naive_price(rules, 80.0, start, end)
+    ) < 0.01
+
+    results = {
+        "compiled": lambda: engine.total_price(80.0, start, end),
+        "naive": lambda: naive_price(rules, 80.0, start, end),
+    }
+    print(f"{'compile':>10}: {compile_ms:8.2f} ms")
+    for name, work in results.items():
+        best = min(timeit.repeat(work, number=args.number, repeat=5))
+        print(f"{name:>10}: {best / args.number * 1e6:8.2f} us/quote")
+
+
+if __name__ == "__main__":
+    main()
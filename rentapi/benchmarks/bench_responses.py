@@ -0,0 +1,108 @@
+"""Benchmark of bytes on the wire and CPU per car listing response.
+
+Compares the stdlib JSON rendering FastAPI used by default with the
+orjson default response class and the pre-serialized page, each with
+the codings negotiated by `CompressionMiddleware`. Run from the
+`rentapi` directory:
+
+    python -m benchmarks.bench_responses --rows 10000
+"""
+
+import argparse
+import time
+from typing import Callable
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, ORJSONResponse
+
+from benchmarks.bench_cardto import make_records
+from src.api.utils.compression import CompressionMiddleware, brotli
+from src.config import config
+from src.infrastructure.dto.cardto import CarDTO
+from src.infrastructure.dto.pagedto import PageDTO
+
+
+def renderers(page: PageDTO[CarDTO]) -> dict[str, Callable[[], bytes]]:
+    """A function building the compared ways of rendering a page.
+
+    Args:
+        page (PageDTO[CarDTO]): The page of cars.
+
+    Returns:
+        dict[str, Callable[[], bytes]]: The renderers by name.
+    """
+    return {
+        "stdlib json": lambda: JSONResponse(
+            jsonable_encoder(page.model_dump()),
+        ).body,
+        "orjson": lambda: ORJSONResponse(page.model_dump()).body,
+        "pre-serialized": lambda: page.model_dump_json().encode(),
+    }
+
+
+def codings() -> dict[str, Callable[[bytes], bytes]]:
+    """A function building the compared content codings.
+
+    Returns:
+        dict[str, Callable[[bytes], bytes]]: The encoders by name.
+    """
+    middleware = CompressionMiddleware(
+        None,  # type: ignore
+        gzip_level=config.COMPRESSION_GZIP_LEVEL,
+        brotli_quality=config.COMPRESSION_BROTLI_QUALITY,
+    )
+
+    def encoder(coding: str) -> Callable[[bytes], bytes]:
+        def encode(body: bytes) -> bytes:
+            compress, flush = middleware.compressor(coding)
+            return compress(body) + flush(True)
+        return encode
+
+    encoders = {"identity": lambda body: body, "gzip": encoder("gzip")}
+    if brotli is not None:
+        encoders["br"] = encoder("br")
+
+    return encoders
+
+
+def cpu_ms(work: Callable[[], bytes], repeat: int) -> float:
+    """A function returning the best CPU time of a call in milliseconds.
+
+    Args:
+        work (Callable[[], bytes]): The measured call.
+        repeat (int): The number of repetitions.
+
+    Returns:
+        float: The CPU time in milliseconds.
+    """
+    best = float("inf")
+
+    for _ in range(repeat):
+        started = time.process_time()
+        work()
+        best = min(best, time.process_time() - started)
+
+    return best * 1000
+
+
+def main() -> None:
+    """The entry point of the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    page = PageDTO[CarDTO](
+        items=CarDTO.from_records(make_records(args.rows)),
+    )
+
+    print(f"{'renderer':>15} {'coding':>8} {'bytes':>10} {'cpu ms':>8}")
+    for name, render in renderers(page).items():
+        for coding, encode in codings().items():
+            size = len(encode(render()))
+            cost = cpu_ms(lambda: encode(render()), args.repeat)
+            print(f"{name:>15} {coding:>8} {size:>10} {cost:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,307 @@
+"""Load-test harness for the car and user endpoints.
+
+The app runs in-process behind an ASGI transport against the Postgres
+database configured with the usual `DB_*` variables. The database is
+truncated and seeded, so point it at a disposable instance, e.g. the
+Compose `db` service, with the schema migrated first:
+
+    DB_HOST=localhost DB_NAME=app DB_USER=postgres DB_PASSWORD=pass \\
+        python -m src.migrate upgrade head
+    DB_HOST=localhost DB_NAME=app DB_USER=postgres DB_PASSWORD=pass \\
+        python -m benchmarks.loadtest --fleet-size 10000 \\
+        --output results.json --baseline benchmarks/baseline.json
+
+The fleet and the request mix are drawn from `--seed`, so runs with the
+same options replay the same workload.
+
+With `--baseline` the run fails when throughput drops or p99 latency
+grows by more than `--tolerance` for any endpoint.
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import platform
+import random
+import statistics
+import sys
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from typing import Awaitable, Callable
+
+import httpx
+
+from src.db import database
+from src.infrastructure.repositories.cardb import IMPORT_COLUMNS
+from src.main import app
+
+Scenario = Callable[[httpx.AsyncClient], Awaitable[httpx.Response]]
+
+BENCH_EMAIL = "bench@example.com"
+BENCH_PASSWORD = "bench-password"
+
+
+@dataclass
+class Result:
+    """Measurements of a single scenario."""
+    requests: int
+    errors: int
+    rps: float
+    p50_ms: float
+    p99_ms: float
+
+
+async def seed(fleet_size: int, rng: random.Random) -> None:
+    """A function resetting the database and loading the fleet.
+
+    Args:
+        fleet_size (int): The number of cars to create.
+        rng (random.Random): The source of the car attributes.
+    """
+    async with database.connection() as connection:
+        raw = connection.raw_connection
+        await raw.execute(
+            "TRUNCATE cars, reservations, users RESTART IDENTITY CASCADE"
+        )
+        await raw.copy_records_to_table(
+            "cars",
+            records=[
+                (
+                    rng.choice(("Toyota", "Skoda", "Ford", "Kia")),
+                    rng.choice(("Corolla", "Octavia", "Focus", "Ceed")),
+                    str(rng.randint(2010, 2024)),
+                    float(rng.randint(30, 200)),
+                    f"BENCH{i:07d}",
+                    rng.randint(0, 200_000),
+                    rng.choice(("petrol", "diesel", "electric")),
+                    rng.choice(("manual", "automatic")),
+                    rng.choice(("2", "5", "7")),
+                    "Seeded by the load test",
+                )
+                for i in range(fleet_size)
+            ],
+            columns=IMPORT_COLUMNS,
+        )
+
+
+def scenarios(fleet_size: int, rng: random.Random) -> dict[str, Scenario]:
+    """A function building the measured requests.
+
+    Args:
+        fleet_size (int): The number of seeded cars.
+        rng (random.Random): The source of the request parameters.
+
+    Returns:
+        dict[str, Scenario]: The request factories by scenario name.
+    """
+    counter = itertools.count()
+
+    def new_car() -> dict:
+        return {
+            "brand": "Bench",
+            "model": "Load",
+            "year": "2024",
+            "price_per_day": 99.0,
+            "registration_number": f"NEW{rng.getrandbits(48):012x}",
+            "mileage": 0,
+            "fuel_type": "petrol",
+            "gearbox": "manual",
+            "seats": "5",
+            "description": None,
+        }
+
+    return {
+        "car_all": lambda client: client.get("/car/all", params={"limit": 50}),
+        "car_by_id": lambda client: client.get(
+            f"/car/{rng.randint(1, fleet_size)}",
+        ),
+        "car_create": lambda client: client.post(
+            "/car/create",
+            json=new_car(),
+        ),
+        "register": lambda client: client.post("/register", json={
+            "email": f"user{next(counter)}@example.com",
+            "user_password": BENCH_PASSWORD,
+        }),
+        "token": lambda client: client.post("/token", json={
+            "email": BENCH_EMAIL,
+            "user_password": BENCH_PASSWORD,
+        }),
+    }
+
+
+async def run_scenario(
+        client: httpx.AsyncClient,
+        scenario: Scenario,
+        requests: int,
+        concurrency: int,
+) -> Result:
+    """A function issuing requests concurrently and measuring them.
+
+    Args:
+        client (httpx.AsyncClient): The in-process client.
+        scenario (Scenario): The request factory.
+        requests (int): The number of requests.
+        concurrency (int): The number of requests in flight.
+
+    Returns:
+        Result: The scenario measurements.
+    """
+    latencies: list[float] = []
+    errors = 0
+    remaining = iter(range(requests))
+
+    async def worker() -> None:
+        nonlocal errors
+        for _ in remaining:
+            started = time.perf_counter()
+            response = await scenario(client)
+            latencies.append(time.perf_counter() - started)
+            if response.status_code >= 400:
+                errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    percentiles = statistics.quantiles(latencies, n=100, method="inclusive")
+
+    return Result(
+        requests=requests,
+        errors=errors,
+        rps=round(requests / elapsed, 2),
+        p50_ms=round(percentiles[49] * 1000, 3),
+        p99_ms=round(percentiles[98] * 1000, 3),
+    )
+
+
+def compare(
+        results: dict[str, Result],
+        baseline: dict,
+        tolerance: float,
+) -> list[str]:
+    """A function listing regressions against a stored baseline.
+
+    Args:
+        results (dict[str, Result]): The current measurements.
+        baseline (dict): The stored run.
+        tolerance (float): The allowed relative slowdown.
+
+    Returns:
+        list[str]: The regression descriptions.
+    """
+    regressions = []
+
+    for name, previous in baseline.get("results", {}).items():
+        if (current := results.get(name)) is None:
+            continue
+
+        if current.rps < previous["rps"] * (1 - tolerance):
+            regressions.append(
+                f"{name}: {current.rps} req/s < {previous['rps']} req/s"
+            )
+        if current.p99_ms > previous["p99_ms"] * (1 + tolerance):
+            regressions.append(
+                f"{name}: p99 {current.p99_ms} ms > {previous['p99_ms']} ms"
+            )
+        if current.errors > previous.get("errors", 0):
+            regressions.append(f"{name}: {current.errors} errors")
+
+    return regressions
+
+
+async def run(args: argparse.Namespace) -> dict:
+    """A function seeding the database and running all scenarios.
+
+    Args:
+        args (argparse.Namespace): The command line arguments.
+
+    Returns:
+        dict: The run metadata and results.
+    """
+    results: dict[str, Result] = {}
+    rng = random.Random(args.seed)
+    selected = scenarios(args.fleet_size, rng)
+
+    async with app.router.lifespan_context(app):
+        await seed(args.fleet_size, rng)
+
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(
+            transport=transport,
+            base_url="http://bench",
+        ) as client:
+            await client.post("/register", json={
+                "email": BENCH_EMAIL,
+                "user_password": BENCH_PASSWORD,
+            })
+
+            for name in args.endpoints:
+                scenario = selected[name]
+                for _ in range(args.warmup):
+                    await scenario(client)
+                results[name] = await run_scenario(
+                    client,
+                    scenario,
+                    args.requests,
+                    args.concurrency,
+                )
+                print(f"{name:>12}: {results[name]}")
+
+    return {
+        "meta": {
+            "fleet_size": args.fleet_size,
+            "requests": args.requests,
+            "concurrency": args.concurrency,
+            "seed": args.seed,
+            "python": platform.python_version(),
+            "recorded_at": datetime.now(timezone.utc).isoformat(),
+        },
+        "results": {name: asdict(result) for name, result in results.items()},
+    }
+
+
+def main() -> None:
+    """The entry point of the load test."""
+    parser = argparse.ArgumentParser(
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("--fleet-size", type=int, default=10_000)
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--warmup", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--endpoints",
+        nargs="+",
+        default=["car_all", "car_by_id", "car_create", "register", "token"],
+        choices=["car_all", "car_by_id", "car_create", "register", "token"],
+    )
+    parser.add_argument("--output", default="bench_results.json")
+    parser.add_argument("--baseline")
+    parser.add_argument("--tolerance", type=float, default=0.15)
+    args = parser.parse_args()
+
+    report = asyncio.run(run(args))
+
+    with open(args.output, "w", encoding="utf-8") as file:
+        json.dump(report, file, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as file:
+            baseline = json.load(file)
+
+        results = {
+            name: Result(**values)
+            for name, values in report["results"].items()
+        }
+        if regressions := compare(results, baseline, args.tolerance):
+            print("Regressions against baseline:", *regressions, sep="\n  ")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,76 +1,377 @@
 """A module containing car endpoints."""
 
-from typing import Iterable
+import logging
+from datetime import datetime, timezone
+from typing import Annotated, AsyncIterator
 from dependency_injector.wiring import inject, Provide
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
 from starlette import status
 
+from src.api.utils.conditional import (
+    car_etag,
+    if_match_versions,
+    is_not_modified,
+    not_modified,
+    page_etag,
+    validators,
+)
 from src.infrastructure.utils import consts
 from src.container import Container
-from src.core.domain.car import Car, CarIn
-from src.infrastructure.dto.cardto import CarDTO
+from src.core.domain.car import (
+    Car,
+    CarIn,
+    CarRegistrationNotUniqueError,
+    CarSearch,
+    CarVersionConflictError,
+    ImportMode,
+)
+from src.core.domain.pricing import Quote
+from src.infrastructure.dto.cardto import (
+    CarDTO,
+    CarImportReportDTO,
+    CarRatingDTO,
+)
+from src.infrastructure.dto.pagedto import PageDTO
 from src.infrastructure.services.icar import ICarService
+from src.infrastructure.utils.bulk import iter_lines, parse_csv, parse_ndjson
 
 router = APIRouter()
+logger = logging.getLogger(__name__)
 
 @router.post("/create", response_model=Car, status_code=201)
 @inject
 async def create_car(
       car: CarIn,
+      response: Response,
       service: ICarService = Depends(Provide[Container.car_service]),
 ) -> dict:
     """An endpoint for adding new car.
 
     Args:
         car (CarIn): The car data.
+        response (Response): The response receiving the validators.
         service (ICarService, optional): The injected service dependency.
 
+    Raises:
+        HTTPException: 409 if the registration number is taken.
+
     Returns:
         dict: The new car attributes.
     """
 
-    new_car = await service.add_car(car)
+    if new_car := await service.add_car(car):
+        response.headers.update(validators(
+            car_etag(new_car),
+            new_car.updated_at,
+        ))
+        return new_car.model_dump()
+
+    raise HTTPException(
+        status_code=409,
+        detail="car with this registration number already exists",
+    )
+
+@router.post("/import", response_model=CarImportReportDTO, status_code=200)
+@inject
+async def import_cars(
+        request: Request,
+        mode: ImportMode = ImportMode.INSERT,
+        service: ICarService = Depends(Provide[Container.car_service]),
+) -> dict:
+    """An endpoint bulk loading cars from a streamed CSV or NDJSON body.
+
+    Args:
+        request (Request): The request with a `text/csv` or
+            `application/x-ndjson` body.
+        mode (ImportMode): Whether existing registrations are updated.
+        service (ICarService, optional): The injected service dependency.
+
+    Raises:
+        HTTPException: 415 if the content type is not supported, 503 if
+            the database was not migrated to unique registrations.
+
+    Returns:
+        dict: The counts and per-row errors.
+    """
+
+    content_type = request.headers.get("content-type", "")
+    lines = iter_lines(request.stream())
+
+    if content_type.startswith("text/csv"):
+        rows = parse_csv(lines)
+    elif content_type.startswith(
+        ("application/x-ndjson", "application/jsonl"),
+    ):
+        rows = parse_ndjson(lines)
+    else:
+        raise HTTPException(
+            status_code=415,
+            detail="expected text/csv or application/x-ndjson",
+        )
+
+    try:
+        report = await service.import_cars(rows, mode)
+    except CarRegistrationNotUniqueError as e:
+        logger.error(
+            "car import needs a unique constraint on "
+            "cars.registration_number, run the migrations",
+            extra={"error": str(e)},
+        )
+        raise HTTPException(
+            status_code=503,
+            detail="car import is unavailable until the database "
+            "enforces unique registration numbers",
+        ) from e
+
+    return report.model_dump()
+
+@router.get("/export", status_code=200)
+@inject
+async def export_cars(
+        service: ICarService = Depends(Provide[Container.car_service]),
+) -> StreamingResponse:
+    """An endpoint streaming the whole fleet as CSV.
 
-    return new_car.model_dump() if new_car else {}
+    Args:
+        service (ICarService, optional): The injected service dependency.
+
+    Returns:
+        StreamingResponse: The CSV stream produced by COPY TO.
+    """
 
-@router.get("/all", response_model=Iterable[Car], status_code=200)
+    return StreamingResponse(
+        service.export_cars(),
+        media_type="text/csv",
+        headers={"Content-Disposition": 'attachment; filename="cars.csv"'},
+    )
+
+@router.get(
+    "/all",
+    response_model=PageDTO[CarRatingDTO] | PageDTO[Car],
+    status_code=200,
+)
 @inject
 async def get_all_cars(
+        request: Request,
+        limit: int = Query(
+            consts.DEFAULT_PAGE_SIZE,
+            ge=1,
+            le=consts.MAX_PAGE_SIZE,
+        ),
+        after: str | None = None,
+        with_ratings: bool = False,
         service: ICarService = Depends(Provide[Container.car_service]),
-) -> Iterable:
-    """An endpoint for getting all cars.
+) -> Response:
+    """An endpoint for getting a page of cars.
+
+    Args:
+        request (Request): The incoming HTTP request.
+        limit (int): The maximum number of cars on the page.
+        after (str | None): The cursor returned with the previous page.
+        with_ratings (bool): Whether to include the review count, the
+            average rating and the histogram of ratings of each car.
+        service (ICarService, optional): The injected service dependency.
+
+    Raises:
+        HTTPException: 400 if the cursor is malformed.
+
+    Returns:
+        Response: The serialized page of cars with the next cursor, or
+            304 if the client's copy is current.
+    """
+
+    try:
+        page = await service.get_cars(
+            limit=limit,
+            cursor=after,
+            with_ratings=with_ratings,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+
+    return _page_response(request, page)
+
+@router.get("/stream", status_code=200)
+@inject
+async def stream_cars(
+        service: ICarService = Depends(Provide[Container.car_service]),
+) -> StreamingResponse:
+    """An endpoint streaming all cars as newline-delimited JSON.
 
     Args:
         service (ICarService, optional): The injected service dependency.
 
     Returns:
-        Iterable: The car attributes collection.
+        StreamingResponse: The NDJSON stream of car attributes.
     """
 
-    cars = await service.get_cars()
+    async def serialize() -> AsyncIterator[bytes]:
+        chunk: list[str] = []
 
-    return cars
+        async for car in service.stream_cars():
+            chunk.append(car.model_dump_json())
+
+            if len(chunk) >= consts.STREAM_CHUNK_ROWS:
+                yield ("\n".join(chunk) + "\n").encode()
+                chunk = []
+
+        if chunk:
+            yield ("\n".join(chunk) + "\n").encode()
+
+    return StreamingResponse(
+        serialize(),
+        media_type="application/x-ndjson",
+    )
+
+@router.get("/search", response_model=PageDTO[Car], status_code=200)
+@inject
+async def search_cars(
+        request: Request,
+        filters: Annotated[CarSearch, Depends()],
+        limit: int = Query(
+            consts.DEFAULT_PAGE_SIZE,
+            ge=1,
+            le=consts.MAX_PAGE_SIZE,
+        ),
+        after: str | None = None,
+        service: ICarService = Depends(Provide[Container.car_service]),
+) -> Response:
+    """An endpoint for searching cars by combined filters.
+
+    Sorting by price or year leaves out cars without that value.
+
+    Args:
+        request (Request): The incoming HTTP request.
+        filters (CarSearch): The search filters and sorting.
+        limit (int): The maximum number of cars on the page.
+        after (str | None): The cursor returned with the previous page.
+        service (ICarService, optional): The injected service dependency.
+
+    Raises:
+        HTTPException: 400 if the cursor is malformed.
+
+    Returns:
+        Response: The serialized page of matching cars.
+    """
+
+    try:
+        page = await service.search_cars(
+            filters=filters,
+            limit=limit,
+            cursor=after,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+
+    return _page_response(request, page)
+
+@router.get("/available", response_model=PageDTO[Car], status_code=200)
+@inject
+async def get_available_cars(
+        request: Request,
+        start: datetime,
+        end: datetime,
+        limit: int = Query(
+            consts.DEFAULT_PAGE_SIZE,
+            ge=1,
+            le=consts.MAX_PAGE_SIZE,
+        ),
+        after: str | None = None,
+        service: ICarService = Depends(Provide[Container.car_service]),
+) -> Response:
+    """An endpoint for getting cars free for the whole period.
+
+    Args:
+        request (Request): The incoming HTTP request.
+        start (datetime): The start of the period, UTC if naive.
+        end (datetime): The end of the period, UTC if naive.
+        limit (int): The maximum number of cars on the page.
+        after (str | None): The cursor returned with the previous page.
+        service (ICarService, optional): The injected service dependency.
+
+    Raises:
+        HTTPException: 400 if the period or the cursor is invalid.
+
+    Returns:
+        Response: The serialized page of free cars.
+    """
+
+    start, end = _utc_period(start, end)
+
+    try:
+        page = await service.get_available_cars(
+            start=start,
+            end=end,
+            limit=limit,
+            cursor=after,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+
+    return _page_response(request, page)
+
+@router.get("/quote", response_model=list[Quote], status_code=200)
+@inject
+async def quote_cars(
+        start: datetime,
+        end: datetime,
+        car_id: list[int] = Query(
+            min_length=1,
+            max_length=consts.MAX_PAGE_SIZE,
+        ),
+        service: ICarService = Depends(Provide[Container.car_service]),
+) -> list[dict]:
+    """An endpoint pricing a rental of many cars for one period.
+
+    Args:
+        start (datetime): The start of the period, UTC if naive.
+        end (datetime): The end of the period, UTC if naive.
+        car_id (list[int]): The ids of the cars, repeated.
+        service (ICarService, optional): The injected service dependency.
+
+    Raises:
+        HTTPException: 400 if the period is invalid.
+
+    Returns:
+        list[dict]: The quotes of the existing cars.
+    """
+
+    start, end = _utc_period(start, end)
+    quotes = await service.quote_cars(car_ids=car_id, start=start, end=end)
+
+    return [quote.model_dump() for quote in quotes]
 
 @router.get("/{car_id}", response_model=Car, status_code=200)
 @inject
 async def get_car_by_id(
         car_id: int,
+        request: Request,
+        response: Response,
         service: ICarService = Depends(Provide[Container.car_service]),
-) -> dict:
+) -> dict | Response:
     """An endpoint for getting car details by id.
 
     Args:
         car_id (int): The id of the car.
+        request (Request): The incoming HTTP request.
+        response (Response): The response receiving the validators.
         service (ICarService): The injected service dependency.
 
     Raises:
         HTTPException: 404 if car does not exist.
 
     Returns:
-        dict: The requested car attributes.
+        dict | Response: The requested car attributes, or 304 if the
+            client's copy is current.
     """
 
     if car := await service.get_car_by_id(car_id):
+        headers = validators(car_etag(car), car.updated_at)
+        if is_not_modified(request, headers["ETag"], car.updated_at):
+            return not_modified(headers)
+
+        response.headers.update(headers)
         return car.model_dump()
 
     raise HTTPException(status_code=404, detail="car not found")
@@ -80,29 +381,47 @@ async def get_car_by_id(
 async def update_car(
         car_id: int,
         updated_car: CarIn,
+        request: Request,
+        response: Response,
         service: ICarService = Depends(Provide[Container.car_service]),
 ) -> dict:
     """An endpoint for updating car data.
 
+    With `If-Match` the update only applies to the listed versions.
+
     Args:
         car_id (int): The id of the car.
         updated_car (CarIn): The updated continent details.
+        request (Request): The incoming HTTP request.
+        response (Response): The response receiving the validators.
         service (ICarService, optional): The injected service dependency.
 
     Raises:
-        HTTPException: 404 if car does not exist.
+        HTTPException: 404 if car does not exist, 412 if `If-Match` does
+            not match its current version.
 
     Returns:
         dict: The updated car details.
     """
 
-    if await service.get_car_by_id(car_id=car_id):
+    try:
         new_updated_car = await service.update_car(
             car_id=car_id,
             data=updated_car,
+            versions=if_match_versions(request, car_id),
         )
-        return new_updated_car.model_dump() if new_updated_car \
-            else {}
+    except CarVersionConflictError as e:
+        raise HTTPException(
+            status_code=412,
+            detail="car was modified by another request",
+        ) from e
+
+    if new_updated_car:
+        response.headers.update(validators(
+            car_etag(new_updated_car),
+            new_updated_car.updated_at,
+        ))
+        return new_updated_car.model_dump()
 
     raise HTTPException(status_code=404, detail="car not found")
 
@@ -125,9 +444,56 @@ async def delete_car(
         dict: Empty if operation finished.
     """
 
-    if await service.get_car_by_id(car_id=car_id):
-        await service.delete_car(car_id)
+    if await service.delete_car(car_id):
         return
 
     raise HTTPException(status_code=404, detail="car not found")
 
+def _utc_period(start: datetime, end: datetime) -> tuple[datetime, datetime]:
+    """A function validating a requested period.
+
+    Args:
+        start (datetime): The start of the period, UTC if naive.
+        end (datetime): The end of the period, UTC if naive.
+
+    Raises:
+        HTTPException: 400 if the period ends before it starts.
+
+    Returns:
+        tuple[datetime, datetime]: The aware start and end.
+    """
+
+    start, end = (
+        date if date.tzinfo else date.replace(tzinfo=timezone.utc)
+        for date in (start, end)
+    )
+    if end <= start:
+        raise HTTPException(status_code=400, detail="end must be after start")
+
+    return start, end
+
+def _page_response(request: Request, page: PageDTO[CarDTO]) -> Response:
+    """A function serializing a page of cars exactly once.
+
+    The rows were already validated when read from the DB, so the
+    response skips re-validation against `response_model`. A page the
+    client already has is answered with 304 without serializing it.
+
+    Args:
+        request (Request): The incoming HTTP request.
+        page (PageDTO[CarDTO]): The page of cars.
+
+    Returns:
+        Response: The JSON response.
+    """
+
+    headers = validators(page_etag(page.items, page.next_cursor))
+
+    if is_not_modified(request, headers["ETag"]):
+        return not_modified(headers)
+
+    return Response(
+        content=page.model_dump_json(),
+        media_type="application/json",
+        headers=headers,
+    )
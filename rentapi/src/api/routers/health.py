@@ -0,0 +1,67 @@
+"""A module containing the liveness and readiness endpoints."""
+
+import asyncio
+
+from fastapi import APIRouter, Request, Response
+from fastapi.responses import JSONResponse
+
+from src.db import database
+
+READY_CHECK_TIMEOUT = 1.0
+
+router = APIRouter()
+
+
+@router.get("/health/live", include_in_schema=False)
+async def live() -> dict:
+    """An endpoint reporting that the worker's event loop is responsive.
+
+    Returns:
+        dict: The liveness status.
+    """
+
+    return {"status": "ok"}
+
+
+@router.get("/health/ready", include_in_schema=False)
+async def ready(request: Request) -> Response:
+    """An endpoint reporting whether the worker should receive traffic.
+
+    The worker is ready once startup finished and its pool can serve a
+    query, and stops being ready as soon as shutdown begins.
+
+    Args:
+        request (Request): The incoming HTTP request.
+
+    Returns:
+        Response: 200 when ready, 503 otherwise.
+    """
+
+    if not getattr(request.app.state, "ready", False):
+        return _not_ready("starting or shutting down")
+
+    try:
+        await asyncio.wait_for(
+            database.fetch_val("SELECT 1"),
+            timeout=READY_CHECK_TIMEOUT,
+        )
+    except Exception as e:  # pylint: disable=broad-except
+        return _not_ready(type(e).__name__)
+
+    return JSONResponse({"status": "ok"})
+
+
+def _not_ready(reason: str) -> Response:
+    """A function building the 503 readiness response.
+
+    Args:
+        reason (str): Why the worker is not ready.
+
+    Returns:
+        Response: The 503 HTTP response.
+    """
+
+    return JSONResponse(
+        status_code=503,
+        content={"status": "unavailable", "reason": reason},
+    )
@@ -0,0 +1,36 @@
+"""A module containing the metrics endpoint."""
+
+from fastapi import APIRouter, Response
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    generate_latest,
+)
+from prometheus_client.multiprocess import MultiProcessCollector
+
+from src.infrastructure.workers.metrics import is_multiprocess
+
+router = APIRouter()
+
+
+@router.get("/metrics", include_in_schema=False)
+async def get_metrics() -> Response:
+    """An endpoint exporting metrics in the Prometheus text format.
+
+    Under several workers the metrics of all of them are aggregated, so
+    every scrape sees the same counters whichever worker answers it.
+
+    Returns:
+        Response: The current values of all registered metrics.
+    """
+
+    registry = REGISTRY
+    if is_multiprocess():
+        registry = CollectorRegistry()
+        MultiProcessCollector(registry)
+
+    return Response(
+        content=generate_latest(registry),
+        media_type=CONTENT_TYPE_LATEST,
+    )
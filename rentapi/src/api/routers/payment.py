@@ -0,0 +1,126 @@
+"""A module containing payment endpoints."""
+
+from dependency_injector.wiring import inject, Provide
+from fastapi import APIRouter, Depends, HTTPException
+
+from src.api.utils.auth import get_current_user
+from src.container import Container
+from src.core.domain.payment import (
+    PaymentDeclinedError,
+    PaymentGatewayError,
+    PaymentGatewayUnavailableError,
+    PaymentMethodIn,
+    ReservationNotPayableError,
+)
+from src.infrastructure.dto.paymentdto import PaymentDTO
+from src.infrastructure.dto.userdto import UserDTO
+from src.infrastructure.services.ipayment import IPaymentService
+from src.infrastructure.services.ireservation import IReservationService
+
+router = APIRouter()
+
+@router.post(
+    "/reservation/{reservation_id}",
+    response_model=PaymentDTO,
+    status_code=201,
+)
+@inject
+async def pay_reservation(
+        reservation_id: int,
+        method: PaymentMethodIn,
+        user: UserDTO = Depends(get_current_user),
+        service: IPaymentService = Depends(
+            Provide[Container.payment_service],
+        ),
+        reservation_service: IReservationService = Depends(
+            Provide[Container.reservation_service],
+        ),
+) -> dict:
+    """An endpoint paying for a reservation of the authenticated user.
+
+    Retrying after a failure resumes the same payment, so the customer
+    is never charged twice.
+
+    Args:
+        reservation_id (int): The id of the reservation.
+        method (PaymentMethodIn): The payment method token.
+        user (UserDTO): The user resolved from the bearer token.
+        service (IPaymentService, optional): The injected service
+            dependency.
+        reservation_service (IReservationService, optional): The injected
+            reservation service dependency.
+
+    Raises:
+        HTTPException: 404 if the user has no such reservation, 409 if it
+            does not await a payment, 402 if the payment was declined,
+            502 if the gateway rejected the call and 503 if it is
+            unavailable.
+
+    Returns:
+        dict: The payment attributes.
+    """
+
+    reservation = await reservation_service.get_by_id(reservation_id)
+
+    if not reservation or reservation.user.id != user.id:
+        raise HTTPException(status_code=404, detail="reservation not found")
+
+    try:
+        payment = await service.pay_reservation(
+            reservation,
+            method.payment_method,
+        )
+    except ReservationNotPayableError as e:
+        raise HTTPException(
+            status_code=409,
+            detail="reservation does not await a payment",
+        ) from e
+    except PaymentDeclinedError as e:
+        raise HTTPException(
+            status_code=402,
+            detail="payment was declined",
+        ) from e
+    except PaymentGatewayUnavailableError as e:
+        raise HTTPException(
+            status_code=503,
+            detail="payment gateway is unavailable",
+            headers={"Retry-After": "1"},
+        ) from e
+    except PaymentGatewayError as e:
+        raise HTTPException(
+            status_code=502,
+            detail="payment gateway rejected the payment",
+        ) from e
+
+    return payment.model_dump()
+
+@router.get("/{payment_id}", response_model=PaymentDTO, status_code=200)
+@inject
+async def get_payment_by_id(
+        payment_id: int,
+        user: UserDTO = Depends(get_current_user),
+        service: IPaymentService = Depends(
+            Provide[Container.payment_service],
+        ),
+) -> dict:
+    """An endpoint for getting payment details by id.
+
+    Args:
+        payment_id (int): The id of the payment.
+        user (UserDTO): The user resolved from the bearer token.
+        service (IPaymentService, optional): The injected service
+            dependency.
+
+    Raises:
+        HTTPException: 404 if the user has no such payment.
+
+    Returns:
+        dict: The requested payment attributes.
+    """
+
+    payment = await service.get_by_id(payment_id)
+
+    if payment and payment.user_id == user.id:
+        return payment.model_dump()
+
+    raise HTTPException(status_code=404, detail="payment not found")
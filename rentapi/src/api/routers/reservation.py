@@ -0,0 +1,318 @@
+"""A module containing reservation endpoints."""
+
+from typing import Annotated
+
+from dependency_injector.wiring import inject, Provide
+from fastapi import APIRouter, Depends, Header, HTTPException, Query
+
+from src.api.utils.auth import get_current_user
+from src.container import Container
+from src.core.domain.reservation import (
+    IdempotencyKeyBusyError,
+    IdempotencyKeyExpiredError,
+    IdempotencyKeyReusedError,
+    ReservationBroker,
+    ReservationConflictError,
+    ReservationFilter,
+    ReservationIn,
+    ReservationNotEditableError,
+)
+from src.infrastructure.dto.pagedto import PageDTO
+from src.infrastructure.dto.reservationdto import ReservationDTO
+from src.infrastructure.dto.userdto import UserDTO
+from src.infrastructure.services.ireservation import IReservationService
+from src.infrastructure.utils import consts
+
+router = APIRouter()
+
+@router.post("/create", response_model=ReservationDTO, status_code=201)
+@inject
+async def create_reservation(
+        reservation: ReservationIn,
+        idempotency_key: Annotated[
+            str | None,
+            Header(min_length=1, max_length=255),
+        ] = None,
+        user: UserDTO = Depends(get_current_user),
+        service: IReservationService = Depends(
+            Provide[Container.reservation_service],
+        ),
+) -> dict:
+    """An endpoint booking a car for the authenticated user.
+
+    Retrying with the same `Idempotency-Key` returns the reservation
+    created by the first attempt instead of booking again.
+
+    Args:
+        reservation (ReservationIn): The car and the period.
+        idempotency_key (str | None): The client's retry key.
+        user (UserDTO): The user resolved from the bearer token.
+        service (IReservationService, optional): The injected service
+            dependency.
+
+    Raises:
+        HTTPException: 404 if the car does not exist, 409 if it is booked
+            in the period or the key is still being claimed, 410 if the
+            reservation made with the key was deleted, 422 if the key was
+            used for another request.
+
+    Returns:
+        dict: The new reservation attributes.
+    """
+
+    try:
+        new_reservation = await service.add_reservation(
+            ReservationBroker(**reservation.model_dump(), user_id=user.id),
+            idempotency_key,
+        )
+    except ReservationConflictError as e:
+        raise HTTPException(
+            status_code=409,
+            detail="car is already reserved in this period",
+        ) from e
+    except IdempotencyKeyReusedError as e:
+        raise HTTPException(
+            status_code=422,
+            detail="idempotency key was used for a different request",
+        ) from e
+    except IdempotencyKeyBusyError as e:
+        raise HTTPException(
+            status_code=409,
+            detail="request with this idempotency key is in progress, "
+            "retry it",
+        ) from e
+    except IdempotencyKeyExpiredError as e:
+        raise HTTPException(
+            status_code=410,
+            detail="reservation made with this idempotency key was deleted",
+        ) from e
+
+    if new_reservation:
+        return new_reservation.model_dump()
+
+    raise HTTPException(status_code=404, detail="car not found")
+
+@router.get(
+    "/mine",
+    response_model=PageDTO[ReservationDTO],
+    status_code=200,
+)
+@inject
+async def get_my_reservations(
+        filters: Annotated[ReservationFilter, Depends()],
+        limit: int = Query(
+            consts.DEFAULT_PAGE_SIZE,
+            ge=1,
+            le=consts.MAX_PAGE_SIZE,
+        ),
+        after: str | None = None,
+        user: UserDTO = Depends(get_current_user),
+        service: IReservationService = Depends(
+            Provide[Container.reservation_service],
+        ),
+) -> dict:
+    """An endpoint for getting a page of the user's reservations.
+
+    Args:
+        filters (ReservationFilter): The status and the window of
+            reservation starts.
+        limit (int): The maximum number of reservations on the page.
+        after (str | None): The cursor returned with the previous page.
+        user (UserDTO): The user resolved from the bearer token.
+        service (IReservationService, optional): The injected service
+            dependency.
+
+    Raises:
+        HTTPException: 400 if the cursor is malformed.
+
+    Returns:
+        dict: The page of reservations ordered by start with the next
+            cursor.
+    """
+
+    try:
+        page = await service.get_user_history(
+            user_id=user.id,
+            filters=filters,
+            limit=limit,
+            cursor=after,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+
+    return page.model_dump()
+
+@router.get(
+    "/{reservation_id}",
+    response_model=ReservationDTO,
+    status_code=200,
+)
+@inject
+async def get_reservation_by_id(
+        reservation_id: int,
+        user: UserDTO = Depends(get_current_user),
+        service: IReservationService = Depends(
+            Provide[Container.reservation_service],
+        ),
+) -> dict:
+    """An endpoint for getting reservation details by id.
+
+    Args:
+        reservation_id (int): The id of the reservation.
+        user (UserDTO): The user resolved from the bearer token.
+        service (IReservationService, optional): The injected service
+            dependency.
+
+    Raises:
+        HTTPException: 404 if the user has no such reservation.
+
+    Returns:
+        dict: The requested reservation attributes.
+    """
+
+    reservation = await service.get_by_id(reservation_id)
+
+    if reservation and reservation.user.id == user.id:
+        return reservation.model_dump()
+
+    raise HTTPException(status_code=404, detail="reservation not found")
+
+@router.put(
+    "/{reservation_id}",
+    response_model=ReservationDTO,
+    status_code=201,
+)
+@inject
+async def update_reservation(
+        reservation_id: int,
+        updated_reservation: ReservationIn,
+        user: UserDTO = Depends(get_current_user),
+        service: IReservationService = Depends(
+            Provide[Container.reservation_service],
+        ),
+) -> dict:
+    """An endpoint for rebooking a reservation awaiting its payment.
+
+    Args:
+        reservation_id (int): The id of the reservation.
+        updated_reservation (ReservationIn): The new car and period.
+        user (UserDTO): The user resolved from the bearer token.
+        service (IReservationService, optional): The injected service
+            dependency.
+
+    Raises:
+        HTTPException: 404 if the user has no such reservation or the car
+            does not exist, 409 if the car is booked in the period or the
+            reservation is no longer pending.
+
+    Returns:
+        dict: The updated reservation details.
+    """
+
+    reservation = await service.get_by_id(reservation_id)
+
+    if reservation and reservation.user.id == user.id:
+        try:
+            if updated := await service.update_reservation(
+                reservation_id=reservation_id,
+                data=updated_reservation,
+            ):
+                return updated.model_dump()
+        except ReservationConflictError as e:
+            raise HTTPException(
+                status_code=409,
+                detail="car is already reserved in this period",
+            ) from e
+        except ReservationNotEditableError as e:
+            raise HTTPException(
+                status_code=409,
+                detail="only a pending reservation can be changed",
+            ) from e
+
+    raise HTTPException(status_code=404, detail="reservation not found")
+
+@router.post(
+    "/{reservation_id}/cancel",
+    response_model=ReservationDTO,
+    status_code=200,
+)
+@inject
+async def cancel_reservation(
+        reservation_id: int,
+        user: UserDTO = Depends(get_current_user),
+        service: IReservationService = Depends(
+            Provide[Container.reservation_service],
+        ),
+) -> dict:
+    """An endpoint for cancelling a reservation before it starts.
+
+    The reservation and its payment are kept, and an authorized charge
+    is released.
+
+    Args:
+        reservation_id (int): The id of the reservation.
+        user (UserDTO): The user resolved from the bearer token.
+        service (IReservationService, optional): The injected service
+            dependency.
+
+    Raises:
+        HTTPException: 404 if the user has no such reservation, 409 if it
+            has started or ended.
+
+    Returns:
+        dict: The cancelled reservation details.
+    """
+
+    reservation = await service.get_by_id(reservation_id)
+
+    if reservation and reservation.user.id == user.id:
+        try:
+            if cancelled := await service.cancel_reservation(reservation_id):
+                return cancelled.model_dump()
+        except ReservationNotEditableError as e:
+            raise HTTPException(
+                status_code=409,
+                detail="reservation can no longer be cancelled",
+            ) from e
+
+    raise HTTPException(status_code=404, detail="reservation not found")
+
+@router.delete("/{reservation_id}", status_code=204)
+@inject
+async def delete_reservation(
+        reservation_id: int,
+        user: UserDTO = Depends(get_current_user),
+        service: IReservationService = Depends(
+            Provide[Container.reservation_service],
+        ),
+) -> None:
+    """An endpoint for deleting reservations awaiting their payment.
+
+    A paid reservation is cancelled instead, so its payment keeps its
+    booking.
+
+    Args:
+        reservation_id (int): The id of the reservation.
+        user (UserDTO): The user resolved from the bearer token.
+        service (IReservationService, optional): The injected service
+            dependency.
+
+    Raises:
+        HTTPException: 404 if the user has no such reservation, 409 if it
+            is no longer pending.
+    """
+
+    reservation = await service.get_by_id(reservation_id)
+
+    if reservation and reservation.user.id == user.id:
+        try:
+            if await service.delete_reservation(reservation_id):
+                return
+        except ReservationNotEditableError as e:
+            raise HTTPException(
+                status_code=409,
+                detail="only a pending reservation can be deleted, "
+                "cancel it instead",
+            ) from e
+
+    raise HTTPException(status_code=404, detail="reservation not found")
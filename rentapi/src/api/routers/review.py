@@ -0,0 +1,198 @@
+"""A module containing review endpoints."""
+
+from typing import Iterable
+
+from dependency_injector.wiring import inject, Provide
+from fastapi import APIRouter, Depends, HTTPException
+from pydantic import UUID4
+
+from src.api.utils.auth import get_current_user
+from src.container import Container
+from src.core.domain.review import (
+    ReviewBroker,
+    ReviewExistsError,
+    ReviewIn,
+    ReviewUpdate,
+)
+from src.infrastructure.dto.reviewdto import ReviewDTO
+from src.infrastructure.dto.userdto import UserDTO
+from src.infrastructure.services.ireview import IReviewService
+
+router = APIRouter()
+
+@router.post("/create", response_model=ReviewDTO, status_code=201)
+@inject
+async def create_review(
+        review: ReviewIn,
+        user: UserDTO = Depends(get_current_user),
+        service: IReviewService = Depends(Provide[Container.review_service]),
+) -> dict:
+    """An endpoint reviewing a reservation of the authenticated user.
+
+    Args:
+        review (ReviewIn): The reviewed reservation, body and rating.
+        user (UserDTO): The user resolved from the bearer token.
+        service (IReviewService, optional): The injected service
+            dependency.
+
+    Raises:
+        HTTPException: 404 if the user has no such reservation of the
+            car, 409 if the reservation is already reviewed.
+
+    Returns:
+        dict: The new review attributes.
+    """
+
+    try:
+        new_review = await service.add_review(
+            ReviewBroker(**review.model_dump(), user_id=user.id),
+        )
+    except ReviewExistsError as e:
+        raise HTTPException(
+            status_code=409,
+            detail="reservation is already reviewed",
+        ) from e
+
+    if new_review:
+        return new_review.model_dump()
+
+    raise HTTPException(status_code=404, detail="reservation not found")
+
+@router.get("/car/{car_id}", response_model=list[ReviewDTO], status_code=200)
+@inject
+async def get_reviews_by_car(
+        car_id: int,
+        service: IReviewService = Depends(Provide[Container.review_service]),
+) -> Iterable:
+    """An endpoint for getting reviews of the car.
+
+    Args:
+        car_id (int): The id of the car.
+        service (IReviewService, optional): The injected service
+            dependency.
+
+    Returns:
+        Iterable: The reviews of the car.
+    """
+
+    reviews = await service.get_by_car(car_id)
+
+    return [review.model_dump() for review in reviews]
+
+@router.get(
+    "/user/{user_id}",
+    response_model=list[ReviewDTO],
+    status_code=200,
+)
+@inject
+async def get_reviews_by_user(
+        user_id: UUID4,
+        service: IReviewService = Depends(Provide[Container.review_service]),
+) -> Iterable:
+    """An endpoint for getting reviews written by the user.
+
+    Args:
+        user_id (UUID4): The id of the user.
+        service (IReviewService, optional): The injected service
+            dependency.
+
+    Returns:
+        Iterable: The reviews of the user.
+    """
+
+    reviews = await service.get_by_user(user_id)
+
+    return [review.model_dump() for review in reviews]
+
+@router.get("/{review_id}", response_model=ReviewDTO, status_code=200)
+@inject
+async def get_review_by_id(
+        review_id: int,
+        service: IReviewService = Depends(Provide[Container.review_service]),
+) -> dict:
+    """An endpoint for getting review details by id.
+
+    Args:
+        review_id (int): The id of the review.
+        service (IReviewService, optional): The injected service
+            dependency.
+
+    Raises:
+        HTTPException: 404 if no such review exists.
+
+    Returns:
+        dict: The requested review attributes.
+    """
+
+    if review := await service.get_by_id(review_id):
+        return review.model_dump()
+
+    raise HTTPException(status_code=404, detail="review not found")
+
+@router.put("/{review_id}", response_model=ReviewDTO, status_code=201)
+@inject
+async def update_review(
+        review_id: int,
+        updated_review: ReviewUpdate,
+        user: UserDTO = Depends(get_current_user),
+        service: IReviewService = Depends(Provide[Container.review_service]),
+) -> dict:
+    """An endpoint for editing the body and rating of a review.
+
+    Args:
+        review_id (int): The id of the review.
+        updated_review (ReviewUpdate): The new body and rating.
+        user (UserDTO): The user resolved from the bearer token.
+        service (IReviewService, optional): The injected service
+            dependency.
+
+    Raises:
+        HTTPException: 404 if the user has no such review.
+
+    Returns:
+        dict: The updated review details.
+    """
+
+    review = await service.get_by_id(review_id)
+
+    if (
+        review
+        and review.user_id == user.id
+        and (updated := await service.update_review(
+            review_id=review_id,
+            data=updated_review,
+        ))
+    ):
+        return updated.model_dump()
+
+    raise HTTPException(status_code=404, detail="review not found")
+
+@router.delete("/{review_id}", status_code=204)
+@inject
+async def delete_review(
+        review_id: int,
+        user: UserDTO = Depends(get_current_user),
+        service: IReviewService = Depends(Provide[Container.review_service]),
+) -> None:
+    """An endpoint for deleting reviews.
+
+    Args:
+        review_id (int): The id of the review.
+        user (UserDTO): The user resolved from the bearer token.
+        service (IReviewService, optional): The injected service
+            dependency.
+
+    Raises:
+        HTTPException: 404 if the user has no such review.
+    """
+
+    review = await service.get_by_id(review_id)
+
+    if (
+        review
+        and review.user_id == user.id
+        and await service.delete_review(review_id)
+    ):
+        return
+
+    raise HTTPException(status_code=404, detail="review not found")
@@ -1,8 +1,12 @@
 """A module containing user-related routers."""
 
+import logging
+
 from dependency_injector.wiring import inject, Provide
 from fastapi import APIRouter, Depends, HTTPException
 
+from src.api.utils.auth import get_current_user
+from src.config import config
 from src.container import Container
 from src.core.domain.user import UserIn
 from src.infrastructure.dto.tokendto import TokenDTO
@@ -10,6 +14,7 @@ from src.infrastructure.dto.userdto import UserDTO
 from src.infrastructure.services.iuser import IUserService
 
 router = APIRouter()
+logger = logging.getLogger(__name__)
 
 
 @router.post("/register", response_model=UserDTO, status_code=201)
@@ -37,6 +42,20 @@ async def register_user(
     )
 
 
+@router.get("/me", response_model=UserDTO, status_code=200)
+async def get_me(user: UserDTO = Depends(get_current_user)) -> dict:
+    """A router coroutine returning the authenticated user.
+
+    Args:
+        user (UserDTO): The user resolved from the bearer token.
+
+    Returns:
+        dict: The user DTO details.
+    """
+
+    return user.model_dump()
+
+
 @router.post("/token", response_model=TokenDTO, status_code=200)
 @inject
 async def authenticate_user(
@@ -54,7 +73,10 @@ async def authenticate_user(
     """
 
     if token_details := await service.authenticate_user(user):
-        print("user confirmed")
+        logger.info(
+            "user authenticated",
+            extra={"sample_rate": config.LOG_AUTH_SAMPLE_RATE},
+        )
         return token_details.model_dump()
 
     raise HTTPException(
@@ -0,0 +1,78 @@
+"""A module containing authentication dependencies."""
+
+from dependency_injector.wiring import inject, Provide
+from fastapi import Depends, HTTPException
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+
+from src.container import Container
+from src.infrastructure.dto.tokendto import TokenPayloadDTO
+from src.infrastructure.dto.userdto import UserDTO
+from src.infrastructure.services.iuser import IUserService
+from src.infrastructure.utils.token import decode_user_token
+
+bearer_scheme = HTTPBearer(auto_error=False)
+
+
+def get_token_payload(
+    credentials: HTTPAuthorizationCredentials | None = Depends(bearer_scheme),
+) -> TokenPayloadDTO:
+    """A dependency verifying the bearer token without touching the DB.
+
+    Args:
+        credentials (HTTPAuthorizationCredentials | None): The bearer token.
+
+    Raises:
+        HTTPException: 401 if the token is missing or invalid.
+
+    Returns:
+        TokenPayloadDTO: The verified token claims.
+    """
+
+    if credentials is None:
+        raise _unauthorized("Not authenticated")
+
+    try:
+        return decode_user_token(credentials.credentials)
+    except ValueError as e:
+        raise _unauthorized(str(e)) from e
+
+
+@inject
+async def get_current_user(
+    payload: TokenPayloadDTO = Depends(get_token_payload),
+    service: IUserService = Depends(Provide[Container.user_service]),
+) -> UserDTO:
+    """A dependency loading the full record of the authenticated user.
+
+    Args:
+        payload (TokenPayloadDTO): The verified token claims.
+        service (IUserService, optional): The injected user service.
+
+    Raises:
+        HTTPException: 401 if the user no longer exists.
+
+    Returns:
+        UserDTO: The authenticated user.
+    """
+
+    if user := await service.get_by_uuid(payload.sub):
+        return UserDTO(**dict(user))
+
+    raise _unauthorized("user not found")
+
+
+def _unauthorized(detail: str) -> HTTPException:
+    """A function building the 401 exception with the bearer challenge.
+
+    Args:
+        detail (str): The reason of the failure.
+
+    Returns:
+        HTTPException: The exception to raise.
+    """
+
+    return HTTPException(
+        status_code=401,
+        detail=detail,
+        headers={"WWW-Authenticate": "Bearer"},
+    )
@@ -0,0 +1,230 @@
+"""A module containing the response compression middleware."""
+
+import re
+import zlib
+from typing import Callable
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli  # type: ignore
+except ImportError:  # pragma: no cover - brotli is optional
+    brotli = None
+
+COMPRESSIBLE_TYPES = (
+    "application/json",
+    "application/x-ndjson",
+    "text/",
+)
+
+_TOKEN = re.compile(r"^\s*([\w*-]+)\s*(?:;\s*q\s*=\s*([\d.]+))?\s*$")
+_CODED_ETAG = re.compile(r'-(?:br|gzip)"')
+
+
+def negotiate(accept_encoding: str) -> str | None:
+    """A function picking the content coding for `Accept-Encoding`.
+
+    Brotli is preferred over gzip at equal quality, and codings with
+    `q=0` are never chosen.
+
+    Args:
+        accept_encoding (str): The header value.
+
+    Returns:
+        str | None: `br`, `gzip` or None for identity.
+    """
+
+    weights: dict[str, float] = {}
+
+    for item in accept_encoding.split(","):
+        if match := _TOKEN.match(item):
+            try:
+                weights[match.group(1).lower()] = float(match.group(2) or 1)
+            except ValueError:
+                continue
+
+    wildcard = weights.get("*", 0.0)
+    offered = ("br", "gzip") if brotli is not None else ("gzip",)
+    best = max(offered, key=lambda coding: weights.get(coding, wildcard))
+
+    return best if weights.get(best, wildcard) > 0 else None
+
+
+class CompressionMiddleware:
+    """An ASGI middleware compressing responses with brotli or gzip.
+
+    Bodies sent in one piece are compressed only from `minimum_size`
+    bytes up; streamed bodies are compressed chunk by chunk and flushed
+    after every chunk, so clients still receive data incrementally.
+
+    Entity tags get a `-br`/`-gzip` suffix, as each coding is a distinct
+    representation, and the suffix is stripped again from conditional
+    request headers.
+    """
+
+    def __init__(
+            self,
+            app: ASGIApp,
+            minimum_size: int = 1024,
+            gzip_level: int = 6,
+            brotli_quality: int = 4,
+    ) -> None:
+        """The initializer of the `compression middleware`.
+
+        Args:
+            app (ASGIApp): The wrapped application.
+            minimum_size (int): The smallest body worth compressing.
+            gzip_level (int): The zlib compression level.
+            brotli_quality (int): The brotli quality.
+        """
+
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        headers = Headers(scope=scope)
+        coding = negotiate(headers.get("accept-encoding", ""))
+        revalidated = coding is not None and (
+            f'-{coding}"' in headers.get("if-none-match", "")
+        )
+        _strip_coded_etags(scope, headers)
+
+        if coding is None:
+            await self.app(scope, receive, send)
+            return
+
+        sender = _CompressingSender(self, coding, revalidated, send)
+        await self.app(scope, receive, sender)
+
+    def compressor(self, coding: str) -> tuple[Callable, Callable]:
+        """A method creating the chunk and flush functions of a coding.
+
+        Args:
+            coding (str): `br` or `gzip`.
+
+        Returns:
+            tuple[Callable, Callable]: Functions compressing a chunk and
+                flushing (with `final`) the compressor.
+        """
+
+        if coding == "br":
+            engine = brotli.Compressor(quality=self.brotli_quality)
+
+            return engine.process, lambda final: (
+                engine.finish() if final else engine.flush()
+            )
+
+        engine = zlib.compressobj(self.gzip_level, zlib.DEFLATED, 31)
+
+        return engine.compress, lambda final: engine.flush(
+            zlib.Z_FINISH if final else zlib.Z_SYNC_FLUSH,
+        )
+
+
+class _CompressingSender:
+    """A `send` wrapper deciding on and applying the compression."""
+
+    def __init__(
+            self,
+            middleware: CompressionMiddleware,
+            coding: str,
+            revalidated: bool,
+            send: Send,
+    ) -> None:
+        self.middleware = middleware
+        self.coding = coding
+        self.revalidated = revalidated
+        self.send = send
+        self.start: Message | None = None
+        self.compress: Callable | None = None
+        self.flush: Callable | None = None
+
+    async def __call__(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            self.start = message
+        elif message["type"] != "http.response.body":
+            await self.send(message)
+        elif self.start is not None:
+            await self._begin(message)
+        elif self.compress is None:
+            await self.send(message)
+        else:
+            more_body = message.get("more_body", False)
+            await self.send({
+                "type": "http.response.body",
+                "body": self._chunk(message.get("body", b""), not more_body),
+                "more_body": more_body,
+            })
+
+    async def _begin(self, message: Message) -> None:
+        start, self.start = self.start, None
+        headers = MutableHeaders(scope=start)
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if start["status"] == 304:
+            if self.revalidated and (etag := headers.get("etag")):
+                headers["ETag"] = f'{etag[:-1]}-{self.coding}"'
+            await self.send(start)
+            await self.send(message)
+            return
+
+        if "content-encoding" in headers or not headers.get(
+            "content-type", "",
+        ).startswith(COMPRESSIBLE_TYPES):
+            await self.send(start)
+            await self.send(message)
+            return
+
+        headers.add_vary_header("Accept-Encoding")
+
+        if not more_body and len(body) < self.middleware.minimum_size:
+            await self.send(start)
+            await self.send(message)
+            return
+
+        self.compress, self.flush = self.middleware.compressor(self.coding)
+        headers["Content-Encoding"] = self.coding
+        if etag := headers.get("etag"):
+            headers["ETag"] = f'{etag[:-1]}-{self.coding}"'
+
+        body = self._chunk(body, not more_body)
+        if more_body:
+            del headers["Content-Length"]
+        else:
+            headers["Content-Length"] = str(len(body))
+
+        await self.send(start)
+        await self.send({
+            "type": "http.response.body",
+            "body": body,
+            "more_body": more_body,
+        })
+
+    def _chunk(self, body: bytes, final: bool) -> bytes:
+        return self.compress(body) + self.flush(final)
+
+
+def _strip_coded_etags(scope: Scope, headers: Headers) -> None:
+    """A function removing coding suffixes from conditional headers.
+
+    Args:
+        scope (Scope): The ASGI scope, updated in place.
+        headers (Headers): The request headers.
+    """
+
+    if "if-none-match" not in headers and "if-match" not in headers:
+        return
+
+    scope["headers"] = [
+        (name, _CODED_ETAG.sub('"', value.decode("latin-1")).encode("latin-1"))
+        if name in (b"if-none-match", b"if-match") else (name, value)
+        for name, value in scope["headers"]
+    ]
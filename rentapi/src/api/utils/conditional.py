@@ -0,0 +1,159 @@
+"""A module containing HTTP conditional request helpers for cars.
+
+Validators are computed from the `version` and `updated_at` columns of
+the rows, so a request can be answered with 304 before anything is
+serialized.
+"""
+
+import hashlib
+import re
+from datetime import datetime
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Iterable
+
+from fastapi import Request, Response
+
+from src.core.domain.car import Car
+
+_CAR_ETAG = re.compile(r'^"(\d+)-(\d+)"$')
+
+
+def car_etag(car: Car) -> str:
+    """A function building the strong ETag of a car.
+
+    Args:
+        car (Car): The car.
+
+    Returns:
+        str: The quoted entity tag.
+    """
+
+    return f'"{car.id}-{car.version}"'
+
+
+def page_etag(cars: Iterable[Car], next_cursor: str | None) -> str:
+    """A function building the strong ETag of a page of cars.
+
+    The tag changes when any car on the page is updated, added or
+    removed, when the page boundary moves, or when the ratings of a car
+    listed with its reviews change.
+
+    Args:
+        cars (Iterable[Car]): The cars on the page.
+        next_cursor (str | None): The cursor of the next page.
+
+    Returns:
+        str: The quoted entity tag.
+    """
+
+    digest = hashlib.blake2b(digest_size=16)
+
+    for car in cars:
+        digest.update(f"{car.id}-{car.version}".encode())
+        if histogram := getattr(car, "rating_histogram", None):
+            digest.update(f"-{histogram}".encode())
+        digest.update(b";")
+    digest.update((next_cursor or "").encode())
+
+    return f'"{digest.hexdigest()}"'
+
+
+def validators(etag: str, last_modified: datetime | None = None) -> dict:
+    """A function building the validator headers of a response.
+
+    Args:
+        etag (str): The entity tag.
+        last_modified (datetime | None): The modification time.
+
+    Returns:
+        dict: The `ETag` and, if known, `Last-Modified` headers.
+    """
+
+    headers = {"ETag": etag}
+
+    if last_modified is not None:
+        headers["Last-Modified"] = format_datetime(last_modified, usegmt=True)
+
+    return headers
+
+
+def is_not_modified(
+        request: Request,
+        etag: str,
+        last_modified: datetime | None = None,
+) -> bool:
+    """A function evaluating `If-None-Match` and `If-Modified-Since`.
+
+    `If-Modified-Since` is only considered without `If-None-Match`.
+
+    Args:
+        request (Request): The incoming HTTP request.
+        etag (str): The current entity tag.
+        last_modified (datetime | None): The current modification time.
+
+    Returns:
+        bool: Whether the client's copy is still current.
+    """
+
+    if (if_none_match := request.headers.get("if-none-match")) is not None:
+        tags = {
+            tag.strip().removeprefix("W/") for tag in if_none_match.split(",")
+        }
+
+        return "*" in tags or etag in tags
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since is None or last_modified is None:
+        return False
+
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+
+    if since.tzinfo is None:
+        return False
+
+    return last_modified.replace(microsecond=0) <= since
+
+
+def not_modified(headers: dict) -> Response:
+    """A function building the 304 response.
+
+    Args:
+        headers (dict): The validator headers.
+
+    Returns:
+        Response: The empty 304 HTTP response.
+    """
+
+    return Response(status_code=304, headers=headers)
+
+
+def if_match_versions(request: Request, car_id: int) -> list[int] | None:
+    """A function reading the car versions accepted by `If-Match`.
+
+    Weak tags and tags of other cars never match, as `If-Match` uses the
+    strong comparison.
+
+    Args:
+        request (Request): The incoming HTTP request.
+        car_id (int): The id of the updated car.
+
+    Returns:
+        list[int] | None: The accepted versions, None if unconditional.
+    """
+
+    if_match = request.headers.get("if-match")
+    if if_match is None or if_match.strip() == "*":
+        return None
+
+    versions = []
+
+    for tag in if_match.split(","):
+        if (match := _CAR_ETAG.match(tag.strip())) and int(
+            match.group(1),
+        ) == car_id:
+            versions.append(int(match.group(2)))
+
+    return versions
@@ -0,0 +1,71 @@
+"""A module containing the request correlation middleware."""
+
+import logging
+import time
+import uuid
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.config import config
+from src.log import request_id
+
+HEADER = "X-Request-ID"
+MAX_ID_LENGTH = 128
+
+logger = logging.getLogger("src.access")
+
+
+class RequestIdMiddleware:
+    """An ASGI middleware binding a correlation id to each request.
+
+    The id is taken from the `X-Request-ID` header when the client sends
+    one, generated otherwise, echoed back in the response and attached to
+    every log record emitted while the request is handled.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        """The initializer of the `request id middleware`.
+
+        Args:
+            app (ASGIApp): The wrapped application.
+        """
+
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        rid = Headers(scope=scope).get(HEADER, "")[:MAX_ID_LENGTH]
+        rid = rid or uuid.uuid4().hex
+        token = request_id.set(rid)
+        started = time.perf_counter()
+        status = 500
+
+        async def send_with_id(message: Message) -> None:
+            nonlocal status
+
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                MutableHeaders(scope=message)[HEADER] = rid
+
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_id)
+        finally:
+            logger.info(
+                "request completed",
+                extra={
+                    "method": scope["method"],
+                    "path": scope["path"],
+                    "status": status,
+                    "duration_ms": round(
+                        (time.perf_counter() - started) * 1000, 3,
+                    ),
+                    "sample_rate": config.LOG_ACCESS_SAMPLE_RATE,
+                },
+            )
+            request_id.reset(token)
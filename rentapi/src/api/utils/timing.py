@@ -0,0 +1,105 @@
+"""A module containing the request timing middleware."""
+
+import time
+
+from prometheus_client import Histogram
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.infrastructure.utils.timing import RequestTimings, current_timings
+
+REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "Time until the response headers were sent, per route.",
+    ["method", "route", "status"],
+)
+REQUEST_DB_QUERIES = Histogram(
+    "http_request_db_queries",
+    "Number of DB queries issued per request.",
+    ["route"],
+    buckets=(0, 1, 2, 3, 5, 8, 13, 21, 50),
+)
+REQUEST_DB_DURATION = Histogram(
+    "http_request_db_seconds",
+    "Total DB time per request.",
+    ["route"],
+)
+
+
+class TimingMiddleware:
+    """An ASGI middleware measuring requests and their DB/crypto work.
+
+    Results are exported as Prometheus histograms and returned to the
+    client in the `Server-Timing` header.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        """The initializer of the `timing middleware`.
+
+        Args:
+            app (ASGIApp): The wrapped application.
+        """
+
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        timings = RequestTimings()
+        token = current_timings.set(timings)
+        started = time.perf_counter()
+        status = 500
+
+        async def send_with_timing(message: Message) -> None:
+            nonlocal status
+
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                headers = MutableHeaders(scope=message)
+                headers.append(
+                    "Server-Timing",
+                    _server_timing(timings, time.perf_counter() - started),
+                )
+
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            current_timings.reset(token)
+            route = getattr(scope.get("route"), "path", "unmatched")
+            REQUEST_DURATION.labels(
+                scope["method"],
+                route,
+                str(status),
+            ).observe(time.perf_counter() - started)
+            REQUEST_DB_QUERIES.labels(route).observe(timings.db_queries)
+            REQUEST_DB_DURATION.labels(route).observe(timings.db_seconds)
+
+
+def _server_timing(timings: RequestTimings, total: float) -> str:
+    """A function formatting timings as a `Server-Timing` header value.
+
+    Args:
+        timings (RequestTimings): The timings of the request.
+        total (float): Seconds since the request arrived.
+
+    Returns:
+        str: The header value.
+    """
+
+    metrics = [
+        f'db;dur={timings.db_seconds * 1000:.3f};'
+        f'desc="{timings.db_queries} queries"',
+    ]
+
+    if timings.bcrypt_seconds:
+        metrics.append(f"bcrypt;dur={timings.bcrypt_seconds * 1000:.3f}")
+    if timings.jwt_seconds:
+        metrics.append(f"jwt;dur={timings.jwt_seconds * 1000:.3f}")
+
+    metrics.append(f"app;dur={total * 1000:.3f}")
+
+    return ", ".join(metrics)
@@ -1,6 +1,8 @@
 """A module providing configuration variables."""
 
+import os
 from typing import Optional
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -16,5 +18,90 @@ class AppConfig(BaseConfig):
     DB_USER: Optional[str] = None
     DB_PASSWORD: Optional[str] = None
 
+    DB_POOL_MIN_SIZE: int = 2
+    DB_POOL_MAX_SIZE: int = 10
+    DB_CONNECTION_BUDGET: Optional[int] = None
+    DB_POOL_ACQUIRE_TIMEOUT: float = 5.0
+    DB_STATEMENT_CACHE_SIZE: int = 1024
+    DB_CONNECTION_MAX_QUERIES: int = 50_000
+    DB_CONNECTION_MAX_IDLE: float = 300.0
+    DB_CONNECT_RETRIES: int = 8
+    DB_CONNECT_BASE_DELAY: float = 0.25
+    DB_CONNECT_MAX_DELAY: float = 5.0
+
+    WEB_CONCURRENCY: Optional[int] = None
+    WEB_GRACEFUL_TIMEOUT: int = 30
+
+    TEST_MODE: bool = False
+    DB_ECHO: bool = False
+
+    CAR_CACHE_BACKEND: str = "memory"
+    CAR_CACHE_SIZE: int = 10_000
+    CAR_CACHE_TTL: int = 300
+    CACHE_URL: Optional[str] = None
+
+    PASSWORD_EXECUTOR: str = "thread"
+    PASSWORD_WORKERS: int = 4
+    PASSWORD_QUEUE_LIMIT: int = 64
+
+    TOKEN_CACHE_SIZE: int = 10_000
+
+    PRICING_RULES_FILE: Optional[str] = None
+    PRICING_HORIZON_YEARS: int = 5
+
+    PAYMENT_GATEWAY_BACKEND: str = "http"
+    PAYMENT_GATEWAY_URL: str = "https://api.stripe.com"
+    PAYMENT_GATEWAY_API_KEY: Optional[str] = None
+    PAYMENT_GATEWAY_TIMEOUT: float = 10.0
+    PAYMENT_GATEWAY_CONNECT_TIMEOUT: float = 2.0
+    PAYMENT_GATEWAY_RETRIES: int = 3
+    PAYMENT_GATEWAY_BASE_DELAY: float = 0.2
+    PAYMENT_GATEWAY_MAX_DELAY: float = 2.0
+    PAYMENT_GATEWAY_MAX_CONNECTIONS: int = 50
+    PAYMENT_CURRENCY: str = "pln"
+
+    OUTBOX_DISPATCHER_ENABLED: bool = True
+    OUTBOX_BATCH_SIZE: int = 100
+    OUTBOX_LEASE: float = 60.0
+    OUTBOX_MAX_ATTEMPTS: int = 10
+    OUTBOX_RETRY_BASE_DELAY: float = 1.0
+    OUTBOX_RETRY_MAX_DELAY: float = 300.0
+    OUTBOX_POLL_INTERVAL: float = 1.0
+
+    RESERVATION_HOLD_TTL: int = 900
+    LIFECYCLE_SCHEDULER_ENABLED: bool = True
+    LIFECYCLE_BATCH_SIZE: int = 1000
+    LIFECYCLE_TICK_INTERVAL: float = 5.0
+
+    METRICS_ENABLED: bool = True
+    METRICS_PUBLISH_INTERVAL: float = 5.0
+
+    COMPRESSION_MINIMUM_SIZE: int = 1024
+    COMPRESSION_GZIP_LEVEL: int = 6
+    COMPRESSION_BROTLI_QUALITY: int = 4
+
+    LOG_LEVEL: str = "INFO"
+    LOG_SQL_LEVEL: str = "WARNING"
+    LOG_ACCESS_SAMPLE_RATE: float = 1.0
+    LOG_AUTH_SAMPLE_RATE: float = 0.1
+
+    @property
+    def workers(self) -> int:
+        """Number of worker processes, defaulting to the CPU count."""
+        return self.WEB_CONCURRENCY or os.cpu_count() or 1
+
+    @property
+    def pool_max_size(self) -> int:
+        """Per-worker pool size, a share of `DB_CONNECTION_BUDGET` if set."""
+        if self.DB_CONNECTION_BUDGET is None:
+            return self.DB_POOL_MAX_SIZE
+
+        return max(1, self.DB_CONNECTION_BUDGET // self.workers)
+
+    @property
+    def pool_min_size(self) -> int:
+        """Per-worker warm connections, never above `pool_max_size`."""
+        return min(self.DB_POOL_MIN_SIZE, self.pool_max_size)
+
 
 config = AppConfig()
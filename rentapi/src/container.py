@@ -1,28 +1,175 @@
 """Module providing containers injecting dependencies."""
 
 from dependency_injector.containers import DeclarativeContainer
-from dependency_injector.providers import Factory, Singleton
+import httpx
+from dependency_injector.providers import Dict, Factory, Selector, Singleton
 
+from src.config import config
+from src.core.domain.outbox import OutboxTopic
+from src.infrastructure.cache.fake import FakeSharedClient
+from src.infrastructure.cache.memory import MemoryCache
+from src.infrastructure.cache.shared import SharedCache, create_redis_client
+from src.infrastructure.dto.cardto import CarDTO
+from src.infrastructure.payments.fake import create_fake_gateway
+from src.infrastructure.payments.http import HttpPaymentGateway
 from src.infrastructure.repositories.cardb import \
     CarRepository
+from src.infrastructure.repositories.outboxdb import \
+    OutboxRepository
+from src.infrastructure.repositories.paymentdb import \
+    PaymentRepository
+from src.infrastructure.repositories.reservationdb import \
+    ReservationRepository
+from src.infrastructure.repositories.reviewdb import \
+    ReviewRepository
 from src.infrastructure.repositories.userdb import \
     UserRepository
 
 from src.infrastructure.services.car import CarService
+from src.infrastructure.services.payment import PaymentService
+from src.infrastructure.services.reservation import ReservationService
+from src.infrastructure.services.review import ReviewService
+from src.infrastructure.utils.pricing import PricingEngine
 from src.infrastructure.services.user import UserService
+from src.infrastructure.workers.notifications import (
+    invite_review,
+    notify_reservation_confirmed,
+)
+from src.infrastructure.workers.lifecycle import \
+    ReservationLifecycleScheduler
+from src.infrastructure.workers.outbox import OutboxDispatcher
 
 
 class Container(DeclarativeContainer):
     """Container class for dependency injecting purposes."""
+    pricing_engine = Singleton(
+        PricingEngine.from_file,
+        path=config.PRICING_RULES_FILE,
+        horizon_years=config.PRICING_HORIZON_YEARS,
+    )
+
     car_repository = Singleton(CarRepository)
     user_repository = Singleton(UserRepository)
+    outbox_repository = Singleton(OutboxRepository)
+    reservation_repository = Singleton(
+        ReservationRepository,
+        pricing=pricing_engine,
+        outbox=outbox_repository,
+        hold_ttl=config.RESERVATION_HOLD_TTL,
+    )
+    review_repository = Singleton(ReviewRepository)
+    payment_repository = Singleton(
+        PaymentRepository,
+        outbox=outbox_repository,
+    )
+
+    car_cache = Selector(
+        lambda: config.CAR_CACHE_BACKEND,
+        memory=Singleton(
+            MemoryCache,
+            max_size=config.CAR_CACHE_SIZE,
+            ttl=config.CAR_CACHE_TTL,
+        ),
+        shared=Singleton(
+            SharedCache,
+            client=Singleton(create_redis_client, url=config.CACHE_URL),
+            model=CarDTO,
+            namespace="rentapi",
+            ttl=config.CAR_CACHE_TTL,
+        ),
+        fake=Singleton(
+            SharedCache,
+            client=Singleton(FakeSharedClient),
+            model=CarDTO,
+            namespace="rentapi",
+            ttl=config.CAR_CACHE_TTL,
+        ),
+    )
+
+    payment_gateway = Selector(
+        lambda: config.PAYMENT_GATEWAY_BACKEND,
+        http=Singleton(
+            HttpPaymentGateway,
+            base_url=config.PAYMENT_GATEWAY_URL,
+            api_key=config.PAYMENT_GATEWAY_API_KEY,
+            timeout=config.PAYMENT_GATEWAY_TIMEOUT,
+            connect_timeout=config.PAYMENT_GATEWAY_CONNECT_TIMEOUT,
+            retries=config.PAYMENT_GATEWAY_RETRIES,
+            base_delay=config.PAYMENT_GATEWAY_BASE_DELAY,
+            max_delay=config.PAYMENT_GATEWAY_MAX_DELAY,
+            max_connections=config.PAYMENT_GATEWAY_MAX_CONNECTIONS,
+        ),
+        fake=Singleton(
+            HttpPaymentGateway,
+            base_url="http://payment-gateway",
+            api_key=None,
+            timeout=config.PAYMENT_GATEWAY_TIMEOUT,
+            connect_timeout=config.PAYMENT_GATEWAY_CONNECT_TIMEOUT,
+            retries=config.PAYMENT_GATEWAY_RETRIES,
+            base_delay=config.PAYMENT_GATEWAY_BASE_DELAY,
+            max_delay=config.PAYMENT_GATEWAY_MAX_DELAY,
+            max_connections=config.PAYMENT_GATEWAY_MAX_CONNECTIONS,
+            transport=Singleton(
+                httpx.ASGITransport,
+                app=Singleton(create_fake_gateway),
+            ),
+        ),
+    )
 
     car_service = Factory(
         CarService,
-        repository=car_repository
+        repository=car_repository,
+        cache=car_cache,
+        pricing=pricing_engine,
     )
 
     user_service = Factory(
         UserService,
         repository=user_repository
     )
+
+    reservation_service = Factory(
+        ReservationService,
+        repository=reservation_repository,
+    )
+
+    review_service = Factory(
+        ReviewService,
+        repository=review_repository,
+    )
+
+    payment_service = Factory(
+        PaymentService,
+        repository=payment_repository,
+        gateway=payment_gateway,
+        currency=config.PAYMENT_CURRENCY,
+    )
+
+    outbox_dispatcher = Singleton(
+        OutboxDispatcher,
+        repository=outbox_repository,
+        handlers=Dict({
+            OutboxTopic.PAYMENT_CAPTURE.value:
+                payment_service.provided.handle_capture,
+            OutboxTopic.PAYMENT_VOID.value:
+                payment_service.provided.handle_void,
+            OutboxTopic.PAYMENT_REFUND.value:
+                payment_service.provided.handle_refund,
+            OutboxTopic.RESERVATION_CONFIRMED.value:
+                notify_reservation_confirmed,
+            OutboxTopic.REVIEW_INVITATION.value: invite_review,
+        }),
+        batch_size=config.OUTBOX_BATCH_SIZE,
+        lease=config.OUTBOX_LEASE,
+        max_attempts=config.OUTBOX_MAX_ATTEMPTS,
+        base_delay=config.OUTBOX_RETRY_BASE_DELAY,
+        max_delay=config.OUTBOX_RETRY_MAX_DELAY,
+        poll_interval=config.OUTBOX_POLL_INTERVAL,
+    )
+
+    lifecycle_scheduler = Singleton(
+        ReservationLifecycleScheduler,
+        repository=reservation_repository,
+        batch_size=config.LIFECYCLE_BATCH_SIZE,
+        tick_interval=config.LIFECYCLE_TICK_INTERVAL,
+    )
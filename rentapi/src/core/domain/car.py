@@ -1,5 +1,7 @@
 """Modul containing car-related domain models."""
 
+from datetime import datetime
+from enum import Enum
 from typing import Optional
 
 from pydantic import BaseModel, ConfigDict
@@ -22,5 +24,49 @@ class CarIn(BaseModel):
 class Car(CarIn):
     """Model representing car's attributes in the database."""
     id: int
+    version: int = 1
+    updated_at: Optional[datetime] = None
 
     model_config = ConfigDict(from_attributes=True, extra="ignore")
+
+
+class CarSortField(str, Enum):
+    """Columns the car search can be sorted by."""
+    ID = "id"
+    PRICE_PER_DAY = "price_per_day"
+    YEAR = "year"
+
+
+class SortOrder(str, Enum):
+    """Direction of sorting."""
+    ASC = "asc"
+    DESC = "desc"
+
+
+class CarSearch(BaseModel):
+    """Model representing car search filters."""
+    brand: Optional[str] = None
+    model: Optional[str] = None
+    fuel_type: Optional[str] = None
+    gearbox: Optional[str] = None
+    seats: Optional[str] = None
+    year_from: Optional[str] = None
+    year_to: Optional[str] = None
+    price_from: Optional[float] = None
+    price_to: Optional[float] = None
+    sort_by: CarSortField = CarSortField.ID
+    order: SortOrder = SortOrder.ASC
+
+
+class ImportMode(str, Enum):
+    """Handling of cars whose registration number already exists."""
+    INSERT = "insert"
+    UPSERT = "upsert"
+
+
+class CarVersionConflictError(RuntimeError):
+    """Raised when a conditional update targets an outdated car version."""
+
+
+class CarRegistrationNotUniqueError(RuntimeError):
+    """Raised when the schema lacks the unique registration constraint."""
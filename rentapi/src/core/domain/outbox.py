@@ -0,0 +1,38 @@
+"""Modul containing outbox-related domain models."""
+
+import json
+from datetime import datetime
+from enum import Enum
+from typing import Any, Optional
+
+from pydantic import BaseModel, ConfigDict, field_validator
+
+
+class OutboxTopic(str, Enum):
+    """Kind of the side effect recorded in the outbox."""
+    PAYMENT_CAPTURE = "payment.capture"
+    PAYMENT_VOID = "payment.void"
+    PAYMENT_REFUND = "payment.refund"
+    RESERVATION_CONFIRMED = "reservation.confirmed"
+    REVIEW_INVITATION = "review.invitation"
+
+
+class OutboxEventIn(BaseModel):
+    """Model representing a side effect to be dispatched."""
+    topic: OutboxTopic
+    payload: dict[str, Any]
+    available_at: Optional[datetime] = None
+
+    @field_validator("payload", mode="before")
+    @classmethod
+    def decode_payload(cls, payload: Any) -> Any:
+        """Decode the payload if the driver returned raw JSON text."""
+        return json.loads(payload) if isinstance(payload, str) else payload
+
+
+class OutboxEvent(OutboxEventIn):
+    """Model representing a claimed outbox event."""
+    id: int
+    attempts: int
+
+    model_config = ConfigDict(from_attributes=True, extra="ignore")
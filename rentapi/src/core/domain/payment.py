@@ -1,13 +1,19 @@
 """Modul containing payment-related domain models."""
 
 from enum import Enum
-from pydantic import BaseModel, ConfigDict, UUID1
+from typing import Optional
+
+from pydantic import BaseModel, ConfigDict, UUID4
 
 
 class PaymentStatus(str, Enum):
     """Status of the payment."""
     PENDING = "Pending"
+    AUTHORIZED = "Authorized"
     COMPLETED = "Completed"
+    FAILED = "Failed"
+    VOIDED = "Voided"
+    REFUNDED = "Refunded"
 
 
 class PaymentIn(BaseModel):
@@ -15,11 +21,39 @@ class PaymentIn(BaseModel):
     price: float
     status: PaymentStatus
     reservation_id: int
-    user_id: UUID1
+    user_id: UUID4
 
 
 class Payment(PaymentIn):
     """Model representing payment's attributes in the database."""
     id: int
+    gateway_id: Optional[str] = None
 
     model_config = ConfigDict(from_attributes=True, extra="ignore")
+
+
+class PaymentMethodIn(BaseModel):
+    """Model representing the payment method tokenized by the gateway."""
+    payment_method: str
+
+
+class GatewayCharge(BaseModel):
+    """Model representing a charge as reported by the payment gateway."""
+    id: str
+    status: PaymentStatus
+
+
+class PaymentGatewayError(RuntimeError):
+    """Raised when the payment gateway rejects or cannot serve a call."""
+
+
+class PaymentGatewayUnavailableError(PaymentGatewayError):
+    """Raised when the payment gateway still fails after all retries."""
+
+
+class PaymentDeclinedError(PaymentGatewayError):
+    """Raised when the payment method was declined."""
+
+
+class ReservationNotPayableError(RuntimeError):
+    """Raised when the reservation is not awaiting a payment."""
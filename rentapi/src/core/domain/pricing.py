@@ -0,0 +1,45 @@
+"""Modul containing pricing-related domain models."""
+
+from datetime import date
+from typing import Optional, Self
+
+from pydantic import BaseModel, Field, model_validator
+
+
+class SeasonRule(BaseModel):
+    """Model representing a price multiplier for a range of days.
+
+    With `yearly` the month and day of the range repeat every year,
+    e.g. a summer season; otherwise the dates are absolute.
+    """
+    name: str
+    start: date
+    end: date
+    multiplier: float = Field(gt=0)
+    yearly: bool = False
+
+    @model_validator(mode="after")
+    def validate_season_period(self) -> Self:
+        if self.end < self.start:
+            raise ValueError("end must not be before start")
+        return self
+
+
+class StayDiscount(BaseModel):
+    """Model representing a discount from a rental length on."""
+    min_days: int = Field(ge=1)
+    discount: float = Field(ge=0, lt=1)
+
+
+class PricingRules(BaseModel):
+    """Model representing all pricing rules."""
+    seasons: list[SeasonRule] = []
+    stay_discounts: list[StayDiscount] = []
+
+
+class Quote(BaseModel):
+    """Model representing the price of renting a car for a period."""
+    car_id: Optional[int] = None
+    price_per_day: float
+    days: int
+    total_price: float
@@ -3,7 +3,7 @@
 from enum import Enum
 from pydantic import BaseModel, ConfigDict, field_validator, model_validator, UUID4
 from typing import Self, Optional
-from datetime import datetime
+from datetime import datetime, timezone
 
 
 class ReservationStatus(str, Enum):
@@ -24,7 +24,11 @@ class ReservationIn(BaseModel):
     @field_validator("reservation_start", "reservation_end")
     @classmethod
     def validate_reservation_date(cls, date: datetime) -> datetime:
-        if date < datetime.now():
+        date = (
+            date.replace(tzinfo=timezone.utc) if date.tzinfo is None
+            else date.astimezone(timezone.utc)
+        )
+        if date < datetime.now(timezone.utc):
             raise ValueError("reservation date cannot be in the past")
         return date
 
@@ -49,3 +53,37 @@ class Reservation(ReservationBroker):
     created_at: Optional[datetime] = None
 
     model_config = ConfigDict(from_attributes=True, extra="ignore")
+
+
+class ReservationFilter(BaseModel):
+    """Model representing filters of a reservation history."""
+    status: Optional[ReservationStatus] = None
+    start_from: Optional[datetime] = None
+    start_to: Optional[datetime] = None
+
+    @field_validator("start_from", "start_to")
+    @classmethod
+    def validate_window_date(cls, date: Optional[datetime]) -> Optional[datetime]:
+        if date is None or date.tzinfo is not None:
+            return date
+        return date.replace(tzinfo=timezone.utc)
+
+
+class ReservationConflictError(RuntimeError):
+    """Raised when the car is already booked for an overlapping period."""
+
+
+class IdempotencyKeyReusedError(RuntimeError):
+    """Raised when an idempotency key is replayed with another request."""
+
+
+class IdempotencyKeyExpiredError(RuntimeError):
+    """Raised when the reservation made with an idempotency key is gone."""
+
+
+class IdempotencyKeyBusyError(RuntimeError):
+    """Raised when the claim of an idempotency key keeps changing."""
+
+
+class ReservationNotEditableError(RuntimeError):
+    """Raised when the status of the reservation does not allow a change."""
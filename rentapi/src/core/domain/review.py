@@ -5,10 +5,8 @@ from typing import Optional
 from datetime import datetime
 
 
-class ReviewIn(BaseModel):
-    """Model representing review's attributes."""
-    car_id: int
-    reservation_id: int
+class ReviewUpdate(BaseModel):
+    """Model representing editable review's attributes."""
     body: str
     rating: int
 
@@ -21,6 +19,12 @@ class ReviewIn(BaseModel):
         return rating
 
 
+class ReviewIn(ReviewUpdate):
+    """Model representing review's attributes."""
+    car_id: int
+    reservation_id: int
+
+
 class ReviewBroker(ReviewIn):
     """Broker class including user in the model."""
     user_id: UUID4
@@ -32,3 +36,7 @@ class Review(ReviewBroker):
     created_at: Optional[datetime] = None
 
     model_config = ConfigDict(from_attributes=True, extra="ignore")
+
+
+class ReviewExistsError(RuntimeError):
+    """Raised when the reservation has already been reviewed."""
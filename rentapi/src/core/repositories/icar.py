@@ -1,22 +1,41 @@
 """Module containing car repository abstractions."""
 
 from abc import ABC, abstractmethod
-from typing import Any, Iterable
+from datetime import datetime
+from typing import Any, AsyncIterator, Collection, Iterable
 
-from src.core.domain.car import CarIn
+from src.core.domain.car import CarIn, CarSearch, ImportMode
 
 
 class ICarRepository(ABC):
     """An abstract class representing protocol of car repository."""
 
     @abstractmethod
-    async def get_all_cars(self) -> Iterable[Any]:
-        """The abstract getting all cars from the data storage.
+    async def get_all_cars(
+            self,
+            limit: int,
+            after_id: int | None = None,
+            with_ratings: bool = False,
+    ) -> Iterable[Any]:
+        """The abstract getting a page of cars ordered by id.
+
+        Args:
+            limit (int): The maximum number of cars to return.
+            after_id (int | None): The id after which the page starts.
+            with_ratings (bool): Whether to include the review aggregate.
 
         Returns:
             Iterable[Any]: Cars in the data storage
         """
 
+    @abstractmethod
+    def iterate_cars(self) -> AsyncIterator[Any]:
+        """The abstract iterating over all cars row by row.
+
+        Returns:
+            AsyncIterator[Any]: Cars in the data storage.
+        """
+
     @abstractmethod
     async def get_car_by_id(self, car_id: int) -> Any | None:
         """The abstract getting car provided id.
@@ -50,6 +69,56 @@ class ICarRepository(ABC):
             Iterable[Any]: The car details associated with the car model.
         """
 
+    @abstractmethod
+    async def search_cars(
+            self,
+            filters: CarSearch,
+            limit: int,
+            after: tuple[Any, int] | None = None,
+    ) -> Iterable[Any]:
+        """The abstract searching cars matching all provided filters.
+
+        Args:
+            filters (CarSearch): The search filters and sorting.
+            limit (int): The maximum number of cars to return.
+            after (tuple[Any, int] | None): The sort value and id of the
+                last car of the previous page.
+
+        Returns:
+            Iterable[Any]: The matching cars.
+        """
+
+    @abstractmethod
+    async def get_available_cars(
+            self,
+            start: datetime,
+            end: datetime,
+            limit: int,
+            after_id: int | None = None,
+    ) -> Iterable[Any]:
+        """The abstract getting cars without reservations in the period.
+
+        Args:
+            start (datetime): The start of the period.
+            end (datetime): The end of the period.
+            limit (int): The maximum number of cars to return.
+            after_id (int | None): The id after which the page starts.
+
+        Returns:
+            Iterable[Any]: The free cars.
+        """
+
+    @abstractmethod
+    async def get_prices(self, car_ids: Iterable[int]) -> dict[int, float]:
+        """The abstract getting the daily rates of many cars at once.
+
+        Args:
+            car_ids (Iterable[int]): The ids of the cars.
+
+        Returns:
+            dict[int, float]: The daily rates of the existing cars by id.
+        """
+
     @abstractmethod
     async def add_car(self, data: CarIn) -> Any | None:
         """The abstract adding new car to the data storage.
@@ -61,20 +130,54 @@ class ICarRepository(ABC):
             Any | None: The newly added car.
         """
 
+    @abstractmethod
+    async def import_cars(
+            self,
+            batches: AsyncIterator[list[CarIn]],
+            mode: ImportMode,
+    ) -> tuple[int, int]:
+        """The abstract bulk loading cars into the data storage.
+
+        The batches are consumed inside one transaction, so they should
+        already be available locally.
+
+        Args:
+            batches (AsyncIterator[list[CarIn]]): The validated cars.
+            mode (ImportMode): Whether existing registrations are updated.
+
+        Raises:
+            CarRegistrationNotUniqueError: If the data storage does not
+                enforce unique registration numbers.
+
+        Returns:
+            tuple[int, int]: The number of received and written cars.
+        """
+
+    @abstractmethod
+    def export_cars(self) -> AsyncIterator[bytes]:
+        """The abstract streaming all cars as CSV.
+
+        Returns:
+            AsyncIterator[bytes]: The CSV chunks.
+        """
+
     @abstractmethod
     async def update_car(
             self,
             car_id: int,
-            data: CarIn
+            data: CarIn,
+            versions: Collection[int] | None = None,
     ) -> Any | None:
         """The abstract updating car data in the data storage.
 
         Args:
             car_id (int): The id of the car
             data (CarIn): The details of the update car.
+            versions (Collection[int] | None): The versions the car must
+                currently have, any if None.
 
         Returns:
-            Any | None: The updated car details.
+            Any | None: The updated car details, None if no car matched.
         """
 
     @abstractmethod
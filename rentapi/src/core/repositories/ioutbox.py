@@ -0,0 +1,67 @@
+"""Module containing outbox repository abstractions."""
+
+from abc import ABC, abstractmethod
+from typing import Any, Collection, Iterable
+
+from src.core.domain.outbox import OutboxEventIn
+
+
+class IOutboxRepository(ABC):
+    """An abstract class representing protocol of outbox repository."""
+
+    @abstractmethod
+    async def add_events(self, events: Iterable[OutboxEventIn]) -> None:
+        """The abstract recording side effects to be dispatched.
+
+        Must run inside the transaction of the change causing them.
+
+        Args:
+            events (Iterable[OutboxEventIn]): The side effects.
+        """
+
+    @abstractmethod
+    async def claim_events(self, limit: int, lease: float) -> Iterable[Any]:
+        """The abstract claiming due events for a dispatcher.
+
+        Claimed events are hidden from other dispatchers for the lease,
+        and reappear if they are not completed by then.
+
+        Args:
+            limit (int): The maximum number of events.
+            lease (float): The time to process them in seconds.
+
+        Returns:
+            Iterable[Any]: The claimed events.
+        """
+
+    @abstractmethod
+    async def complete_events(self, event_ids: Collection[int]) -> None:
+        """The abstract marking events as processed.
+
+        Args:
+            event_ids (Collection[int]): The ids of the events.
+        """
+
+    @abstractmethod
+    async def retry_event(
+            self,
+            event_id: int,
+            error: str,
+            delay: float,
+    ) -> None:
+        """The abstract scheduling another attempt of a failed event.
+
+        Args:
+            event_id (int): The id of the event.
+            error (str): The description of the failure.
+            delay (float): The backoff in seconds.
+        """
+
+    @abstractmethod
+    async def fail_event(self, event_id: int, error: str) -> None:
+        """The abstract giving up on an event.
+
+        Args:
+            event_id (int): The id of the event.
+            error (str): The description of the last failure.
+        """
@@ -0,0 +1,58 @@
+"""Module containing payment repository abstractions."""
+
+from abc import ABC, abstractmethod
+from typing import Any
+
+from src.core.domain.payment import PaymentIn, PaymentStatus
+
+
+class IPaymentRepository(ABC):
+    """An abstract class representing protocol of payment repository."""
+
+    @abstractmethod
+    async def get_by_id(self, payment_id: int) -> Any | None:
+        """The abstract getting payment provided by id.
+
+        Args:
+            payment_id (int): The id of the payment.
+
+        Returns:
+            Any | None: The payment details.
+        """
+
+    @abstractmethod
+    async def open_payment(self, data: PaymentIn) -> Any:
+        """The abstract getting the reservation's payment in flight.
+
+        The payment is created if the reservation has none, or only
+        failed or voided ones.
+
+        Args:
+            data (PaymentIn): The attributes of a new payment.
+
+        Returns:
+            Any: The open payment of the reservation.
+        """
+
+    @abstractmethod
+    async def update_payment(
+            self,
+            payment_id: int,
+            status: PaymentStatus,
+            gateway_id: str | None = None,
+    ) -> Any | None:
+        """The abstract recording the outcome of a gateway call.
+
+        An authorized or completed payment also confirms its
+        reservation and records the side effects in the outbox. If the
+        reservation no longer awaits a payment, the payment is voided or
+        refunded and the release of the charge is recorded instead.
+
+        Args:
+            payment_id (int): The id of the payment.
+            status (PaymentStatus): The new status.
+            gateway_id (str | None): The id of the charge at the gateway.
+
+        Returns:
+            Any | None: The updated payment.
+        """
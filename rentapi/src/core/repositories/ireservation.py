@@ -1,11 +1,17 @@
 """Module containing reservation repository abstractions."""
 
 from abc import ABC, abstractmethod
+from datetime import datetime
 from typing import Any, Iterable
 
-from pydantic import UUID1
+from pydantic import UUID4
 
-from src.core.domain.reservation import ReservationIn
+from src.core.domain.reservation import (
+    ReservationBroker,
+    ReservationFilter,
+    ReservationIn,
+    ReservationStatus,
+)
 
 
 class IReservationRepository(ABC):
@@ -27,11 +33,11 @@ class IReservationRepository(ABC):
             car_id (int): The id of the car.
 
         Returns:
-            Any | None: The reservation details.
+            Iterable[Any]: The reservations of the car.
         """
 
     @abstractmethod
-    async def get_by_id(self, reservation_id: int) -> Any:
+    async def get_by_id(self, reservation_id: int) -> Any | None:
         """The abstract getting reservation provided by id.
 
         Args:
@@ -42,28 +48,84 @@ class IReservationRepository(ABC):
         """
 
     @abstractmethod
-    async def get_by_user(self,
-                          user_id: UUID1
-                          ) -> Iterable[Any]:
+    async def get_by_user(self, user_id: UUID4) -> Iterable[Any]:
         """The abstract getting all provided user's reservation
             from the data storage.
 
         Args:
-            user_id (int): The id of the user.
+            user_id (UUID4): The id of the user.
 
         Returns:
             Iterable[Any]: The collection of the reservations.
         """
 
     @abstractmethod
-    async def add_reservation(self, data: ReservationIn) -> Any | None:
+    async def get_page_by_user(
+        self,
+        user_id: UUID4,
+        filters: ReservationFilter,
+        limit: int,
+        after: tuple[datetime, int] | None = None,
+    ) -> Iterable[Any]:
+        """The abstract getting a page of the user's reservations.
+
+        Args:
+            user_id (UUID4): The id of the user.
+            filters (ReservationFilter): The status and start window.
+            limit (int): The maximum number of reservations to return.
+            after (tuple[datetime, int] | None): The start and id of the
+                last reservation of the previous page.
+
+        Returns:
+            Iterable[Any]: The reservations ordered by start.
+        """
+
+    @abstractmethod
+    async def get_page_by_car(
+        self,
+        car_id: int,
+        filters: ReservationFilter,
+        limit: int,
+        after: tuple[datetime, int] | None = None,
+    ) -> Iterable[Any]:
+        """The abstract getting a page of the car's reservations.
+
+        Args:
+            car_id (int): The id of the car.
+            filters (ReservationFilter): The status and start window.
+            limit (int): The maximum number of reservations to return.
+            after (tuple[datetime, int] | None): The start and id of the
+                last reservation of the previous page.
+
+        Returns:
+            Iterable[Any]: The reservations ordered by start.
+        """
+
+    @abstractmethod
+    async def add_reservation(
+            self,
+            data: ReservationBroker,
+            idempotency_key: str | None = None,
+    ) -> Any | None:
         """The abstract adding new reservation to the data storage.
 
         Args:
-            data (ReservationIn): The attributes of the reservation.
+            data (ReservationBroker): The attributes of the reservation.
+            idempotency_key (str | None): The client's key making retries
+                return the original reservation.
+
+        Raises:
+            ReservationConflictError: If the car is booked in the period.
+            IdempotencyKeyReusedError: If the key was used for another
+                request.
+            IdempotencyKeyExpiredError: If the reservation made with the
+                key was deleted.
+            IdempotencyKeyBusyError: If the claim of the key kept being
+                released while it was read.
 
         Returns:
-            Any | None: The newly created reservation.
+            Any | None: The newly created reservation, None if the car
+                does not exist.
         """
 
     @abstractmethod
@@ -74,10 +136,17 @@ class IReservationRepository(ABC):
     ) -> Any | None:
         """The abstract updating reservation data in the data storage.
 
+        Only a pending reservation can be rebooked.
+
         Args:
             reservation_id (int): The reservation id.
             data (ReservationIn): The attributes of the reservation.
 
+        Raises:
+            ReservationConflictError: If the car is booked in the period.
+            ReservationNotEditableError: If the reservation is no longer
+                pending.
+
         Returns:
             Any | None: The updated reservation.
         """
@@ -86,12 +155,56 @@ class IReservationRepository(ABC):
     async def delete_reservation(self, reservation_id: int) -> bool:
         """The abstract updating removing reservation from the data storage.
 
+        Only a pending reservation can be removed.
+
         Args:
             reservation_id (int): The reservation id.
 
+        Raises:
+            ReservationNotEditableError: If the reservation is no longer
+                pending.
+
         Returns:
             bool: Success of the operation.
         """
 
+    @abstractmethod
+    async def cancel_reservation(self, reservation_id: int) -> Any | None:
+        """The abstract cancelling a pending or confirmed reservation.
+
+        The row is kept with its payment, and an authorized charge is
+        voided.
+
+        Args:
+            reservation_id (int): The reservation id.
+
+        Raises:
+            ReservationNotEditableError: If the reservation has started
+                or ended.
+
+        Returns:
+            Any | None: The cancelled reservation.
+        """
+
+    @abstractmethod
+    async def advance_reservations(
+        self,
+        limit: int,
+    ) -> dict[ReservationStatus, int]:
+        """The abstract applying one batch of each due status transition.
 
+        Args:
+            limit (int): The maximum number of rows per transition.
 
+        Returns:
+            dict[ReservationStatus, int]: The number of reservations
+                moved into each status.
+        """
+
+    @abstractmethod
+    async def get_transition_lag(self) -> float:
+        """The abstract measuring how late the oldest due transition is.
+
+        Returns:
+            float: The delay in seconds, 0 if nothing is overdue.
+        """
@@ -1,69 +1,83 @@
-"""Modul containing review-related domain models."""
-
+"""Module containing review repository abstractions."""
 
 from abc import ABC, abstractmethod
 from typing import Any, Iterable
 
-from pydantic import UUID5
+from pydantic import UUID4
 
-from src.core.domain.review import ReviewIn
+from src.core.domain.review import ReviewBroker, ReviewUpdate
 
 
 class IReviewRepository(ABC):
     """An abstract class representing protocol of review repository."""
 
     @abstractmethod
-    async def get_reviews(self, review_id: int) -> Iterable[Any]:
+    async def get_reviews(self) -> Iterable[Any]:
         """The abstract getting all reviews from the data storage.
 
         Returns:
-            Iterable[Any]: Review in the data storage
+            Iterable[Any]: Reviews in the data storage.
         """
 
     @abstractmethod
-    async def get_review_by_car(self, car_id: int) -> Iterable[Any] | None:
+    async def get_by_id(self, review_id: int) -> Any | None:
+        """The abstract getting review provided by id.
+
+        Args:
+            review_id (int): The id of the review.
+
+        Returns:
+            Any | None: The review details.
+        """
+
+    @abstractmethod
+    async def get_review_by_car(self, car_id: int) -> Iterable[Any]:
         """The abstract getting reviews assigned to particular car.
 
         Args:
             car_id (int): The id of the car.
 
         Returns:
-            Iterable[Any]: Review assigned to a car.
+            Iterable[Any]: Reviews assigned to a car.
         """
 
     @abstractmethod
-    async def get_review_by_user(self, user_id: UUID5) -> Iterable[Any] | None:
+    async def get_review_by_user(self, user_id: UUID4) -> Iterable[Any]:
         """The abstract getting reviews assigned to particular user.
 
         Args:
-            user_id (int): The id of the user.
+            user_id (UUID4): The id of the user.
 
         Returns:
-            Iterable[Any]: Review assigned to a user.
+            Iterable[Any]: Reviews assigned to a user.
         """
 
     @abstractmethod
-    async def add_review(self, data: ReviewIn) -> None:
+    async def add_review(self, data: ReviewBroker) -> Any | None:
         """The abstract adding new review to the data storage.
 
         Args:
-            data (ReviewIn): The details of the new review.
+            data (ReviewBroker): The details of the new review.
+
+        Raises:
+            ReviewExistsError: If the reservation is already reviewed.
 
         Returns:
-            Any | None: The newly added review.
+            Any | None: The newly added review, None if the user has no
+                such reservation of the car.
         """
 
     @abstractmethod
-    async def update_car(
+    async def update_review(
             self,
             review_id: int,
-            data: ReviewIn
+            data: ReviewUpdate,
     ) -> Any | None:
-        """The abstract updating airport data in the data storage.
+        """The abstract updating review data in the data storage.
 
         Args:
-            review_id (int): The id of the car
-            data (ReviewIn): The details of the update review.
+            review_id (int): The id of the review.
+            data (ReviewUpdate): The details of the updated review.
 
         Returns:
             Any | None: The updated review details.
@@ -74,7 +88,7 @@ class IReviewRepository(ABC):
         """The abstract removing review from the data storage.
 
         Args:
-             review_id (int): The id of the review.
+            review_id (int): The id of the review.
 
         Returns:
             bool: Success of the operation.
@@ -1,19 +1,31 @@
 """A module for providing database access."""
 
 import asyncio
+import logging
+import random
 
-import databases
 import sqlalchemy
-from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.exc import OperationalError, DatabaseError
-from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.dialects.postgresql import (
+    ExcludeConstraint,
+    JSONB,
+    TSTZRANGE,
+    UUID,
+)
 from asyncpg.exceptions import (  # type: ignore
     CannotConnectNowError,
     ConnectionDoesNotExistError,
+    PostgresError,
 )
 
+from prometheus_client import REGISTRY
+
 from src.config import config
+from src.core.domain.payment import PaymentStatus
+from src.core.domain.reservation import ReservationStatus
+from src.pool import PoolCollector, TunedDatabase
 
+# Mirrors the schema built by the migrations in `src/migrations`, which
+# is also what `--autogenerate` diffs new revisions against.
 metadata = sqlalchemy.MetaData()
 
 car_table = sqlalchemy.Table(
@@ -24,54 +36,251 @@ car_table = sqlalchemy.Table(
     sqlalchemy.Column("model", sqlalchemy.String),
     sqlalchemy.Column("year", sqlalchemy.String),
     sqlalchemy.Column("price_per_day", sqlalchemy.Float),
-    sqlalchemy.Column("registration_number", sqlalchemy.String),
+    sqlalchemy.Column("registration_number", sqlalchemy.String, unique=True),
     sqlalchemy.Column("mileage", sqlalchemy.Integer, nullable=True),
     sqlalchemy.Column("fuel_type", sqlalchemy.String, nullable=True),
     sqlalchemy.Column("gearbox", sqlalchemy.String, nullable=True),
     sqlalchemy.Column("seats", sqlalchemy.String, nullable=True),
     sqlalchemy.Column("description", sqlalchemy.String, nullable=True),
+    sqlalchemy.Column(
+        "version",
+        sqlalchemy.Integer,
+        nullable=False,
+        server_default="1",
+    ),
+    sqlalchemy.Column(
+        "updated_at",
+        sqlalchemy.DateTime(timezone=True),
+        nullable=False,
+        server_default=sqlalchemy.func.now(),
+    ),
+    sqlalchemy.Index("ix_cars_fuel_type", "fuel_type"),
+    sqlalchemy.Index("ix_cars_gearbox", "gearbox"),
+    sqlalchemy.Index("ix_cars_seats", "seats"),
+    sqlalchemy.Index("ix_cars_year_id", "year", "id"),
+    sqlalchemy.Index("ix_cars_price_per_day_id", "price_per_day", "id"),
+    sqlalchemy.Index(
+        "ix_cars_brand_trgm",
+        "brand",
+        postgresql_using="gin",
+        postgresql_ops={"brand": "gin_trgm_ops"},
+    ),
+    sqlalchemy.Index(
+        "ix_cars_model_trgm",
+        "model",
+        postgresql_using="gin",
+        postgresql_ops={"model": "gin_trgm_ops"},
+    ),
 )
-#
-# reservation_table = sqlalchemy.Table(
-#     "reservations",
-#     metadata,
-#     sqlalchemy.Column("id", sqlalchemy.Integer, primary_key=True),
-#     sqlalchemy.Column(
-#         "user_id",
-#         sqlalchemy.ForeignKey("user.id"),
-#         nullable=False,
-#     ),
-#     sqlalchemy.Column(
-#         "car_id",
-#         sqlalchemy.ForeignKey("cars.id"),
-#         nullable=False,
-#     ),
-#     sqlalchemy.Column(
-#         "payment_id",
-#         sqlalchemy.ForeignKey("payment.id"),
-#         nullable=False,
-#     ),
-#     sqlalchemy.Column("reservation_start", sqlalchemy.DateTime),
-#     sqlalchemy.Column("reservation_end", sqlalchemy.DateTime),
-#     sqlalchemy.Column("reservation_status", sqlalchemy.Enum),  # Do poprawy w domu!!!
-# )
-#
-# review_table = sqlalchemy.Table(
-#     "reviews",
-#     metadata,
-#     sqlalchemy.Column(
-#         "user_id",
-#         sqlalchemy.ForeignKey("user.id"),
-#         nullable=False,
-#     ),
-#     sqlalchemy.Column(
-#         "car_id",
-#         sqlalchemy.ForeignKey("cars.id"),
-#         nullable=False,
-#     ),
-#     sqlalchemy.Column("body", sqlalchemy.String),
-# )
-#
+
+reservation_table = sqlalchemy.Table(
+    "reservations",
+    metadata,
+    sqlalchemy.Column("id", sqlalchemy.Integer, primary_key=True),
+    sqlalchemy.Column(
+        "user_id",
+        sqlalchemy.ForeignKey("users.id"),
+        nullable=False,
+    ),
+    sqlalchemy.Column(
+        "car_id",
+        sqlalchemy.ForeignKey("cars.id"),
+        nullable=False,
+    ),
+    sqlalchemy.Column(
+        "payment_id",
+        sqlalchemy.ForeignKey(
+            "payments.id",
+            ondelete="SET NULL",
+            use_alter=True,
+            name="fk_reservations_payment_id",
+        ),
+        nullable=True,
+    ),
+    sqlalchemy.Column(
+        "reservation_start",
+        sqlalchemy.DateTime(timezone=True),
+        nullable=False,
+    ),
+    sqlalchemy.Column(
+        "reservation_end",
+        sqlalchemy.DateTime(timezone=True),
+        nullable=False,
+    ),
+    sqlalchemy.Column(
+        "period",
+        TSTZRANGE,
+        sqlalchemy.Computed(
+            "tstzrange(reservation_start, reservation_end, '[)')",
+            persisted=True,
+        ),
+    ),
+    sqlalchemy.Column(
+        "status",
+        sqlalchemy.String,
+        nullable=False,
+        server_default=ReservationStatus.PENDING.value,
+    ),
+    sqlalchemy.Column("total_price", sqlalchemy.Float, nullable=False),
+    sqlalchemy.Column(
+        "created_at",
+        sqlalchemy.DateTime(timezone=True),
+        server_default=sqlalchemy.func.now(),
+    ),
+    # When the status is due to change on its own, NULL once it is final.
+    sqlalchemy.Column(
+        "next_transition_at",
+        sqlalchemy.DateTime(timezone=True),
+        nullable=True,
+    ),
+    # Histories of a user or a car are keyset-scanned in start order, with
+    # the status filter answered from the index alone.
+    sqlalchemy.Index(
+        "ix_reservations_user_id_start_id",
+        "user_id",
+        "reservation_start",
+        "id",
+        postgresql_include=["status"],
+    ),
+    sqlalchemy.Index(
+        "ix_reservations_car_id_start_id",
+        "car_id",
+        "reservation_start",
+        "id",
+        postgresql_include=["status"],
+    ),
+    sqlalchemy.Index(
+        "ix_reservations_next_transition_at",
+        "next_transition_at",
+        postgresql_where=sqlalchemy.text("next_transition_at IS NOT NULL"),
+    ),
+    sqlalchemy.CheckConstraint(
+        "reservation_end > reservation_start",
+        name="ck_reservations_period",
+    ),
+    ExcludeConstraint(
+        ("car_id", "="),
+        ("period", "&&"),
+        name="ex_reservations_car_period",
+        using="gist",
+        where=sqlalchemy.text(
+            f"status <> '{ReservationStatus.CANCELLED.value}'",
+        ),
+    ),
+)
+
+payment_table = sqlalchemy.Table(
+    "payments",
+    metadata,
+    sqlalchemy.Column("id", sqlalchemy.Integer, primary_key=True),
+    # Payments are financial records and outlive their reservation.
+    sqlalchemy.Column(
+        "reservation_id",
+        sqlalchemy.ForeignKey("reservations.id", ondelete="SET NULL"),
+        nullable=True,
+    ),
+    sqlalchemy.Column(
+        "user_id",
+        sqlalchemy.ForeignKey("users.id"),
+        nullable=False,
+    ),
+    sqlalchemy.Column("price", sqlalchemy.Float, nullable=False),
+    sqlalchemy.Column(
+        "status",
+        sqlalchemy.String,
+        nullable=False,
+        server_default=PaymentStatus.PENDING.value,
+    ),
+    sqlalchemy.Column("gateway_id", sqlalchemy.String, nullable=True),
+    sqlalchemy.Column(
+        "created_at",
+        sqlalchemy.DateTime(timezone=True),
+        server_default=sqlalchemy.func.now(),
+    ),
+    sqlalchemy.Index("ix_payments_reservation_id", "reservation_id"),
+    # A reservation has at most one payment in flight, so retried payment
+    # requests reuse its idempotency keys at the gateway.
+    sqlalchemy.Index(
+        "ux_payments_reservation_open",
+        "reservation_id",
+        unique=True,
+        postgresql_where=sqlalchemy.text(
+            f"status NOT IN ('{PaymentStatus.FAILED.value}', "
+            f"'{PaymentStatus.VOIDED.value}')",
+        ),
+    ),
+)
+
+review_table = sqlalchemy.Table(
+    "reviews",
+    metadata,
+    sqlalchemy.Column("id", sqlalchemy.Integer, primary_key=True),
+    sqlalchemy.Column(
+        "user_id",
+        sqlalchemy.ForeignKey("users.id", ondelete="SET NULL"),
+        nullable=True,
+    ),
+    sqlalchemy.Column(
+        "car_id",
+        sqlalchemy.ForeignKey("cars.id", ondelete="CASCADE"),
+        nullable=False,
+    ),
+    sqlalchemy.Column(
+        "reservation_id",
+        sqlalchemy.ForeignKey("reservations.id", ondelete="SET NULL"),
+        nullable=True,
+        unique=True,
+    ),
+    sqlalchemy.Column("body", sqlalchemy.String, nullable=False),
+    sqlalchemy.Column("rating", sqlalchemy.SmallInteger, nullable=False),
+    sqlalchemy.Column(
+        "created_at",
+        sqlalchemy.DateTime(timezone=True),
+        server_default=sqlalchemy.func.now(),
+    ),
+    sqlalchemy.CheckConstraint(
+        "rating BETWEEN 1 AND 5",
+        name="ck_reviews_rating",
+    ),
+    sqlalchemy.Index("ix_reviews_car_id_id", "car_id", "id"),
+    sqlalchemy.Index("ix_reviews_user_id_id", "user_id", "id"),
+)
+
+RATINGS = range(1, 6)
+
+# Maintained by the review repository in the transaction of every review
+# write, so listings read ratings without aggregating `reviews`.
+car_review_stats_table = sqlalchemy.Table(
+    "car_review_stats",
+    metadata,
+    sqlalchemy.Column(
+        "car_id",
+        sqlalchemy.ForeignKey("cars.id", ondelete="CASCADE"),
+        primary_key=True,
+    ),
+    sqlalchemy.Column(
+        "review_count",
+        sqlalchemy.Integer,
+        nullable=False,
+        server_default="0",
+    ),
+    sqlalchemy.Column(
+        "rating_sum",
+        sqlalchemy.Integer,
+        nullable=False,
+        server_default="0",
+    ),
+    *(
+        sqlalchemy.Column(
+            f"rating_{rating}",
+            sqlalchemy.Integer,
+            nullable=False,
+            server_default="0",
+        )
+        for rating in RATINGS
+    ),
+)
+
 user_table = sqlalchemy.Table(
     "users",
     metadata,
@@ -85,6 +294,71 @@ user_table = sqlalchemy.Table(
     sqlalchemy.Column("password", sqlalchemy.String),
 )
 
+idempotency_key_table = sqlalchemy.Table(
+    "idempotency_keys",
+    metadata,
+    sqlalchemy.Column(
+        "user_id",
+        sqlalchemy.ForeignKey("users.id", ondelete="CASCADE"),
+        primary_key=True,
+    ),
+    sqlalchemy.Column("key", sqlalchemy.String(255), primary_key=True),
+    sqlalchemy.Column("request_hash", sqlalchemy.String(64), nullable=False),
+    sqlalchemy.Column(
+        "reservation_id",
+        # A deleted reservation leaves its key claimed, so a retry of the
+        # original request cannot book again.
+        sqlalchemy.ForeignKey("reservations.id", ondelete="SET NULL"),
+        nullable=True,
+    ),
+    sqlalchemy.Column(
+        "created_at",
+        sqlalchemy.DateTime(timezone=True),
+        nullable=False,
+        server_default=sqlalchemy.func.now(),
+    ),
+)
+
+# Side effects written in the transaction of the change causing them and
+# dispatched later by `OutboxDispatcher`.
+outbox_table = sqlalchemy.Table(
+    "outbox_events",
+    metadata,
+    sqlalchemy.Column("id", sqlalchemy.BigInteger, primary_key=True),
+    sqlalchemy.Column("topic", sqlalchemy.String, nullable=False),
+    sqlalchemy.Column("payload", JSONB, nullable=False),
+    sqlalchemy.Column(
+        "created_at",
+        sqlalchemy.DateTime(timezone=True),
+        nullable=False,
+        server_default=sqlalchemy.func.now(),
+    ),
+    sqlalchemy.Column(
+        "available_at",
+        sqlalchemy.DateTime(timezone=True),
+        nullable=False,
+        server_default=sqlalchemy.func.now(),
+    ),
+    sqlalchemy.Column(
+        "attempts",
+        sqlalchemy.Integer,
+        nullable=False,
+        server_default="0",
+    ),
+    sqlalchemy.Column("last_error", sqlalchemy.String, nullable=True),
+    sqlalchemy.Column(
+        "processed_at",
+        sqlalchemy.DateTime(timezone=True),
+        nullable=True,
+    ),
+    sqlalchemy.Index(
+        "ix_outbox_events_pending",
+        "available_at",
+        "id",
+        postgresql_where=sqlalchemy.text("processed_at IS NULL"),
+    ),
+)
+
 """Engine of the database"""
 
 db_uri = (
@@ -92,39 +366,70 @@ db_uri = (
     f"@{config.DB_HOST}/{config.DB_NAME}"
 )
 
-engine = create_async_engine(
+database = TunedDatabase(
     db_uri,
-    echo=True,
-    future=True,
-    pool_pre_ping=True,
+    force_rollback=config.TEST_MODE,
+    min_size=config.pool_min_size,
+    max_size=config.pool_max_size,
+    acquire_timeout=config.DB_POOL_ACQUIRE_TIMEOUT,
+    statement_cache_size=config.DB_STATEMENT_CACHE_SIZE,
+    max_queries=config.DB_CONNECTION_MAX_QUERIES,
+    max_inactive_connection_lifetime=config.DB_CONNECTION_MAX_IDLE,
 )
 
-database = databases.Database(
-    db_uri,
-    force_rollback=True,
-)
+pool_collector = PoolCollector(database)
+REGISTRY.register(pool_collector)
+
+logger = logging.getLogger(__name__)
 
 
-async def init_db(retries: int = 5, delay: int = 5) -> None:
-    """Function initializing the DB.
+async def wait_for_db(
+    retries: int = config.DB_CONNECT_RETRIES,
+    base_delay: float = config.DB_CONNECT_BASE_DELAY,
+    max_delay: float = config.DB_CONNECT_MAX_DELAY,
+) -> None:
+    """Function opening the pool once the DB accepts connections.
+
+    The schema is managed by migrations (`python -m src.migrate`), so a
+    worker only opens its pool and checks it with a trivial query. Failed
+    attempts back off exponentially with full jitter, so workers started
+    together do not retry in lockstep.
 
     Args:
-        retries (int, optional): Number of retries of connect to DB.
-            Defaults to 5.
-        delay (int, optional): Delay of connect do DB. Defaults to 2.
+        retries (int, optional): Number of attempts to connect to DB.
+            Defaults to `DB_CONNECT_RETRIES`.
+        base_delay (float, optional): Backoff of the first retry in
+            seconds. Defaults to `DB_CONNECT_BASE_DELAY`.
+        max_delay (float, optional): Upper bound of a single backoff in
+            seconds. Defaults to `DB_CONNECT_MAX_DELAY`.
+
+    Raises:
+        ConnectionError: If DB is still unreachable after all attempts.
     """
+
     for attempt in range(retries):
         try:
-            async with engine.begin() as conn:
-                await conn.run_sync(metadata.create_all)
+            if not database.is_connected:
+                await database.connect()
+            await database.fetch_val("SELECT 1")
             return
         except (
-                OperationalError,
-                DatabaseError,
+                PostgresError,
                 CannotConnectNowError,
                 ConnectionDoesNotExistError,
+                OSError,
         ) as e:
-            print(f"Attempt {attempt + 1} failed: {e}")
+            delay = random.uniform(0, min(max_delay, base_delay * 2 ** attempt))
+            logger.warning(
+                "database not ready",
+                extra={
+                    "attempt": attempt + 1,
+                    "retry_in": round(delay, 3),
+                    "error": str(e),
+                },
+            )
+            if database.is_connected:
+                await database.disconnect()
             await asyncio.sleep(delay)
 
     raise ConnectionError("Could not connect to DB after several retries.")
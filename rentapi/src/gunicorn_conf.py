@@ -0,0 +1,57 @@
+"""Gunicorn settings for the production entry point.
+
+    gunicorn -c src/gunicorn_conf.py src.main:app
+
+Runs `WEB_CONCURRENCY` uvicorn workers (the CPU count by default) on
+uvloop and httptools when they are installed. The app is imported once
+in the master and shared by the forked workers; each worker still opens
+its own DB pool in the lifespan, sized by `AppConfig.pool_max_size`.
+
+The workers share their Prometheus metrics through the files in
+`PROMETHEUS_MULTIPROC_DIR`, a fresh temporary directory unless set, so
+`/metrics` reports the whole server whichever worker answers it.
+"""
+
+import os
+import tempfile
+
+# prometheus_client picks the multiprocess mode when it is imported, so
+# the directory is set and emptied of a previous run before the app is.
+os.environ.setdefault(
+    "PROMETHEUS_MULTIPROC_DIR",
+    tempfile.mkdtemp(prefix="rentapi-metrics-"),
+)
+for _name in os.listdir(os.environ["PROMETHEUS_MULTIPROC_DIR"]):
+    if _name.endswith(".db"):
+        os.remove(os.path.join(os.environ["PROMETHEUS_MULTIPROC_DIR"], _name))
+
+# Every module-level name is read as a setting, and `config` is one.
+from src.config import config as app_config  # noqa: E402
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '8000')}"
+workers = app_config.workers
+worker_class = "uvicorn_worker.UvicornWorker"
+preload_app = True
+
+# On SIGTERM workers stop accepting, finish in-flight requests and run
+# the lifespan shutdown before they are killed.
+graceful_timeout = app_config.WEB_GRACEFUL_TIMEOUT
+timeout = app_config.WEB_GRACEFUL_TIMEOUT * 2
+keepalive = 5
+
+accesslog = None
+errorlog = "-"
+loglevel = app_config.LOG_LEVEL.lower()
+
+
+def child_exit(server, worker) -> None:
+    """A hook dropping the live gauges of an exited worker.
+
+    Args:
+        server (Arbiter): The gunicorn master.
+        worker (Worker): The exited worker.
+    """
+
+    from prometheus_client import multiprocess
+
+    multiprocess.mark_process_dead(worker.pid)
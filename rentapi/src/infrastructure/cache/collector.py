@@ -0,0 +1,51 @@
+"""Module containing the Prometheus exporter of cache counters."""
+
+from typing import Any, Callable
+
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily
+from prometheus_client.registry import Collector
+
+
+class CacheCollector(Collector):
+    """A Prometheus collector exporting cache hit/miss/eviction counters."""
+
+    def __init__(self, sources: dict[str, Callable[[], dict[str, int]]]):
+        """The initializer of the `cache collector`.
+
+        Args:
+            sources (dict[str, Callable[[], dict[str, int]]]): The stats
+                getters by cache name.
+        """
+
+        self._sources = sources
+
+    def collect(self) -> Any:
+        """The method yielding the current cache counters.
+
+        Yields:
+            CounterMetricFamily | GaugeMetricFamily: The cache metrics.
+        """
+
+        counters = {
+            name: CounterMetricFamily(
+                f"cache_{name}",
+                f"Cache {name}.",
+                labels=["cache"],
+            )
+            for name in ("hits", "misses", "evictions")
+        }
+        size = GaugeMetricFamily(
+            "cache_entries",
+            "Entries held by in-process caches.",
+            labels=["cache"],
+        )
+
+        for cache, stats in self._sources.items():
+            values = stats()
+            for name, family in counters.items():
+                family.add_metric([cache], values.get(name, 0))
+            if "size" in values:
+                size.add_metric([cache], values["size"])
+
+        yield from counters.values()
+        yield size
@@ -0,0 +1,79 @@
+"""Module containing a local stand-in for the shared cache store."""
+
+import fnmatch
+import time
+from typing import Any, AsyncIterator
+
+
+class FakeSharedClient:
+    """An in-memory store mimicking the used `redis.asyncio` subset."""
+
+    def __init__(self) -> None:
+        """The initializer of the `fake shared client`."""
+
+        self._data: dict[str, tuple[bytes, float | None]] = {}
+
+    async def get(self, name: str) -> bytes | None:
+        """The method getting a value if not expired.
+
+        Args:
+            name (str): The key of the entry.
+
+        Returns:
+            bytes | None: The stored value.
+        """
+
+        entry = self._data.get(name)
+
+        if entry is None:
+            return None
+
+        value, expires_at = entry
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self._data[name]
+            return None
+
+        return value
+
+    async def set(self, name: str, value: bytes, ex: int | None = None) -> Any:
+        """The method storing a value with an optional lifetime.
+
+        Args:
+            name (str): The key of the entry.
+            value (bytes): The value to store.
+            ex (int | None): The lifetime in seconds.
+
+        Returns:
+            Any: Always True, as Redis does.
+        """
+
+        expires_at = time.monotonic() + ex if ex is not None else None
+        self._data[name] = (value, expires_at)
+
+        return True
+
+    async def delete(self, *names: str) -> int:
+        """The method removing entries.
+
+        Args:
+            *names (str): The keys of the entries.
+
+        Returns:
+            int: The number of removed entries.
+        """
+
+        return sum(self._data.pop(name, None) is not None for name in names)
+
+    async def scan_iter(self, match: str | None = None) -> AsyncIterator[str]:
+        """The method iterating over keys matching a glob pattern.
+
+        Args:
+            match (str | None): The glob pattern.
+
+        Yields:
+            str: The matching keys.
+        """
+
+        for name in list(self._data):
+            if match is None or fnmatch.fnmatchcase(name, match):
+                yield name
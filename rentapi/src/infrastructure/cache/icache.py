@@ -0,0 +1,96 @@
+"""Module containing cache abstractions."""
+
+from abc import ABC, abstractmethod
+from typing import Any, Awaitable, Callable
+
+
+class ICache(ABC):
+    """An abstract class representing protocol of a key-value cache."""
+
+    _generation: int = 0
+
+    @abstractmethod
+    async def get(self, key: str) -> Any | None:
+        """The abstract getting a value from the cache.
+
+        Args:
+            key (str): The key of the entry.
+
+        Returns:
+            Any | None: The cached value if present and fresh.
+        """
+
+    @abstractmethod
+    async def set(self, key: str, value: Any) -> None:
+        """The abstract storing a value in the cache.
+
+        Args:
+            key (str): The key of the entry.
+            value (Any): The value to store.
+        """
+
+    @abstractmethod
+    async def delete(self, key: str) -> None:
+        """The abstract removing a value from the cache.
+
+        Args:
+            key (str): The key of the entry.
+        """
+
+    @abstractmethod
+    async def clear(self) -> None:
+        """The abstract removing all values from the cache."""
+
+    @abstractmethod
+    def stats(self) -> dict[str, int]:
+        """The abstract getting the cache counters.
+
+        Returns:
+            dict[str, int]: The hit, miss and eviction counters.
+        """
+
+    async def get_or_load(
+            self,
+            key: str,
+            loader: Callable[[], Awaitable[Any | None]],
+    ) -> Any | None:
+        """The method reading through the cache into the loader.
+
+        A value loaded concurrently with an invalidation is returned to
+        the caller but not stored, so a write in this process is never
+        followed by a stale read.
+
+        Args:
+            key (str): The key of the entry.
+            loader (Callable[[], Awaitable[Any | None]]): The data source.
+
+        Returns:
+            Any | None: The cached or freshly loaded value.
+        """
+
+        if (value := await self.get(key)) is not None:
+            return value
+
+        generation = self._generation
+        value = await loader()
+
+        if value is not None and generation == self._generation:
+            await self.set(key, value)
+
+        return value
+
+    async def invalidate(self, key: str) -> None:
+        """The method removing a value after its source has changed.
+
+        Args:
+            key (str): The key of the entry.
+        """
+
+        self._generation += 1
+        await self.delete(key)
+
+    async def invalidate_all(self) -> None:
+        """The method removing all values after a bulk change."""
+
+        self._generation += 1
+        await self.clear()
@@ -0,0 +1,168 @@
+"""Module containing in-process cache implementation."""
+
+import time
+from collections import OrderedDict
+from typing import Any
+
+from src.infrastructure.cache.icache import ICache
+
+
+class LRUStore:
+    """A bounded mapping evicting the least recently used entries."""
+
+    def __init__(self, max_size: int, ttl: float | None = None) -> None:
+        """The initializer of the `LRU store`.
+
+        Args:
+            max_size (int): The maximum number of entries.
+            ttl (float | None): The default entry lifetime in seconds.
+        """
+
+        self._entries: OrderedDict[str, tuple[Any, float | None]] = \
+            OrderedDict()
+        self._max_size = max_size
+        self._ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key: str) -> Any | None:
+        """The method getting a fresh entry and marking it as recently used.
+
+        Args:
+            key (str): The key of the entry.
+
+        Returns:
+            Any | None: The stored value if present and not expired.
+        """
+
+        entry = self._entries.get(key)
+
+        if entry is None:
+            self.misses += 1
+            return None
+
+        value, expires_at = entry
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self._entries[key]
+            self.expirations += 1
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+
+        return value
+
+    def set(self, key: str, value: Any, ttl: float | None = None) -> None:
+        """The method storing an entry, evicting the oldest one if full.
+
+        Args:
+            key (str): The key of the entry.
+            value (Any): The value to store.
+            ttl (float | None): The entry lifetime overriding the default.
+        """
+
+        ttl = ttl if ttl is not None else self._ttl
+        expires_at = time.monotonic() + ttl if ttl is not None else None
+
+        self._entries[key] = (value, expires_at)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def delete(self, key: str) -> None:
+        """The method removing an entry.
+
+        Args:
+            key (str): The key of the entry.
+        """
+
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """The method removing all entries."""
+
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> dict[str, int]:
+        """The method getting the store counters.
+
+        Returns:
+            dict[str, int]: The store counters.
+        """
+
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "size": len(self._entries),
+        }
+
+
+class MemoryCache(ICache):
+    """A class implementing the in-process LRU+TTL cache."""
+
+    _store: LRUStore
+
+    def __init__(self, max_size: int, ttl: float | None = None) -> None:
+        """The initializer of the `memory cache`.
+
+        Args:
+            max_size (int): The maximum number of entries.
+            ttl (float | None): The entry lifetime in seconds.
+        """
+
+        self._store = LRUStore(max_size=max_size, ttl=ttl)
+
+    async def get(self, key: str) -> Any | None:
+        """The method getting a value from the cache.
+
+        Args:
+            key (str): The key of the entry.
+
+        Returns:
+            Any | None: The cached value if present and fresh.
+        """
+
+        return self._store.get(key)
+
+    async def set(self, key: str, value: Any) -> None:
+        """The method storing a value in the cache.
+
+        Args:
+            key (str): The key of the entry.
+            value (Any): The value to store.
+        """
+
+        self._store.set(key, value)
+
+    async def delete(self, key: str) -> None:
+        """The method removing a value from the cache.
+
+        Args:
+            key (str): The key of the entry.
+        """
+
+        self._store.delete(key)
+
+    async def clear(self) -> None:
+        """The method removing all values from the cache."""
+
+        self._store.clear()
+
+    def stats(self) -> dict[str, int]:
+        """The method getting the cache counters.
+
+        Returns:
+            dict[str, int]: The hit, miss and eviction counters.
+        """
+
+        return self._store.stats()
@@ -0,0 +1,142 @@
+"""Module containing shared (out-of-process) cache implementation."""
+
+from typing import Any, Protocol
+
+from pydantic import TypeAdapter
+
+from src.infrastructure.cache.icache import ICache
+
+
+class SharedClient(Protocol):
+    """The subset of the `redis.asyncio` client used by the shared cache."""
+
+    async def get(self, name: str) -> bytes | None:
+        ...
+
+    async def set(self, name: str, value: bytes, ex: int | None = None) -> Any:
+        ...
+
+    async def delete(self, *names: str) -> int:
+        ...
+
+    def scan_iter(self, match: str | None = None) -> Any:
+        ...
+
+
+class SharedCache(ICache):
+    """A class implementing the cache on top of a shared key-value store.
+
+    Entries are kept as JSON so every worker process can read them.
+    Staleness across processes is bounded by the entry lifetime.
+    """
+
+    def __init__(
+            self,
+            client: SharedClient,
+            model: Any,
+            namespace: str,
+            ttl: int | None = None,
+    ) -> None:
+        """The initializer of the `shared cache`.
+
+        Args:
+            client (SharedClient): The shared store client.
+            model (Any): The type of the cached values.
+            namespace (str): The prefix of the cache keys.
+            ttl (int | None): The entry lifetime in seconds.
+        """
+
+        self._client = client
+        self._adapter = TypeAdapter(model)
+        self._prefix = f"{namespace}:"
+        self._ttl = ttl
+        self._hits = 0
+        self._misses = 0
+
+    async def get(self, key: str) -> Any | None:
+        """The method getting a value from the shared store.
+
+        Args:
+            key (str): The key of the entry.
+
+        Returns:
+            Any | None: The cached value if present.
+        """
+
+        raw = await self._client.get(self._prefix + key)
+
+        if raw is None:
+            self._misses += 1
+            return None
+
+        self._hits += 1
+
+        return self._adapter.validate_json(raw)
+
+    async def set(self, key: str, value: Any) -> None:
+        """The method storing a value in the shared store.
+
+        Args:
+            key (str): The key of the entry.
+            value (Any): The value to store.
+        """
+
+        await self._client.set(
+            self._prefix + key,
+            self._adapter.dump_json(value),
+            ex=self._ttl,
+        )
+
+    async def delete(self, key: str) -> None:
+        """The method removing a value from the shared store.
+
+        Args:
+            key (str): The key of the entry.
+        """
+
+        await self._client.delete(self._prefix + key)
+
+    async def clear(self) -> None:
+        """The method removing all values of the namespace."""
+
+        keys = [key async for key in self._client.scan_iter(
+            match=f"{self._prefix}*",
+        )]
+
+        if keys:
+            await self._client.delete(*keys)
+
+    def stats(self) -> dict[str, int]:
+        """The method getting the cache counters.
+
+        Evictions happen inside the shared store and are not counted here.
+
+        Returns:
+            dict[str, int]: The hit and miss counters.
+        """
+
+        return {"hits": self._hits, "misses": self._misses, "evictions": 0}
+
+
+def create_redis_client(url: str | None) -> SharedClient:
+    """A function creating the shared store client.
+
+    Args:
+        url (str | None): The URL of the Redis server.
+
+    Raises:
+        RuntimeError: If the URL or the `redis` package is missing.
+
+    Returns:
+        SharedClient: The shared store client.
+    """
+
+    if not url:
+        raise RuntimeError("CACHE_URL is required for the shared cache")
+
+    try:
+        from redis import asyncio as aioredis  # type: ignore
+    except ImportError as e:
+        raise RuntimeError("the shared cache requires `redis`") from e
+
+    return aioredis.from_url(url)
@@ -1,8 +1,9 @@
 """A module containing DTO models for output cars."""
 
-from typing import Optional
+from datetime import datetime
+from typing import Iterable, Optional
 from asyncpg import Record  # type: ignore
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 
 class CarDTO(BaseModel):
@@ -18,6 +19,8 @@ class CarDTO(BaseModel):
     gearbox: Optional[str] = None
     seats: Optional[str] = None
     description: Optional[str] = None
+    version: int = 1
+    updated_at: Optional[datetime] = None
 
     model_config = ConfigDict(
         from_attributes=True,
@@ -48,5 +51,66 @@ class CarDTO(BaseModel):
             fuel_type=record_dict.get("fuel_type"),
             gearbox=record_dict.get("gearbox"),
             seats=record_dict.get("seats"),
-            description=record_dict.get("description")
+            description=record_dict.get("description"),
+            version=record_dict.get("version", 1),
+            updated_at=record_dict.get("updated_at"),
         )
+
+    @classmethod
+    def from_records(cls, records: Iterable[Record]) -> list["CarDTO"]:
+        """A method for preparing DTO instances of a whole result set.
+
+        The rows are validated in one call of a pre-compiled adapter,
+        which avoids per-row Python work in list queries.
+
+        Args:
+            records (Iterable[Record]): The DB records.
+
+        Returns:
+            list[CarDTO]: The final DTO instances.
+        """
+        return _car_list_adapter.validate_python(
+            [dict(getattr(record, "_mapping", record)) for record in records],
+        )
+
+
+_car_list_adapter = TypeAdapter(list[CarDTO])
+
+
+class CarRatingDTO(CarDTO):
+    """A model representing DTO for car data with its review aggregate."""
+    review_count: int = 0
+    average_rating: Optional[float] = None
+    rating_histogram: list[int] = [0, 0, 0, 0, 0]
+
+    @classmethod
+    def from_records(cls, records: Iterable[Record]) -> list["CarDTO"]:
+        """A method for preparing DTO instances of a whole result set.
+
+        Args:
+            records (Iterable[Record]): The DB records.
+
+        Returns:
+            list[CarDTO]: The final DTO instances.
+        """
+        return _car_rating_list_adapter.validate_python(
+            [dict(getattr(record, "_mapping", record)) for record in records],
+        )
+
+
+_car_rating_list_adapter = TypeAdapter(list[CarRatingDTO])
+
+
+class CarImportErrorDTO(BaseModel):
+    """A model representing a rejected row of a bulk import."""
+    line: int
+    error: str
+
+
+class CarImportReportDTO(BaseModel):
+    """A model representing the outcome of a bulk import."""
+    received: int
+    imported: int
+    skipped: int
+    rejected: int
+    errors: list[CarImportErrorDTO]
@@ -0,0 +1,18 @@
+"""A module containing DTO model for paginated collections."""
+
+from typing import Generic, Optional, TypeVar
+
+from pydantic import BaseModel, ConfigDict, SerializeAsAny
+
+ItemT = TypeVar("ItemT")
+
+
+class PageDTO(BaseModel, Generic[ItemT]):
+    """A DTO model representing one page of a keyset-paginated collection."""
+    items: list[SerializeAsAny[ItemT]]
+    next_cursor: Optional[str] = None
+
+    model_config = ConfigDict(
+        from_attributes=True,
+        extra="ignore",
+    )
@@ -1,4 +1,9 @@
 """A module containing DTO models for payment"""
+
+from datetime import datetime
+from typing import Optional
+
+from asyncpg import Record  # type: ignore
 from pydantic import BaseModel, ConfigDict, UUID4  # type: ignore
 
 from src.core.domain.payment import PaymentStatus
@@ -9,11 +14,25 @@ class PaymentDTO(BaseModel):
     id: int
     price: float
     status: PaymentStatus
-    reservation_id: int
+    reservation_id: Optional[int] = None
     user_id: UUID4
+    gateway_id: Optional[str] = None
+    created_at: Optional[datetime] = None
 
     model_config = ConfigDict(
         from_attributes=True,
         extra="ignore",
         arbitrary_types_allowed=True,
     )
+
+    @classmethod
+    def from_record(cls, record: Record) -> "PaymentDTO":
+        """A method for preparing DTO instance based on DB record.
+
+        Args:
+            record (Record): The DB record.
+
+        Returns:
+            PaymentDTO: The final DTO instance.
+        """
+        return cls.model_validate(dict(getattr(record, "_mapping", record)))
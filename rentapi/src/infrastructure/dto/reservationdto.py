@@ -1,22 +1,32 @@
 """A module containing DTO models for output reservations."""
 
-from asyncpg import Record  # type: ignore
-from pydantic import ConfigDict
 from datetime import datetime
+from typing import Iterable, Optional
+
+from asyncpg import Record  # type: ignore
+from pydantic import BaseModel, ConfigDict, TypeAdapter
+
 from src.core.domain.reservation import ReservationStatus
 from src.infrastructure.dto.cardto import CarDTO
+from src.infrastructure.dto.paymentdto import PaymentDTO
 from src.infrastructure.dto.userdto import UserDTO
 
+# Separates the relation from the column in labels of joined columns,
+# e.g. `car__brand`.
+RELATION_SEPARATOR = "__"
+
 
-class ReservationDTO:
+class ReservationDTO(BaseModel):
     """A model representing DTO for reservation data."""
     id: int
     car: CarDTO
+    user: UserDTO
     reservation_start: datetime
     reservation_end: datetime
-    payment: PaymentDTO
     status: ReservationStatus
-    user: UserDTO
+    total_price: float
+    payment: Optional[PaymentDTO] = None
+    created_at: Optional[datetime] = None
 
     model_config = ConfigDict(
         from_attributes=True,
@@ -28,20 +38,60 @@ class ReservationDTO:
     def from_record(cls, record: Record) -> "ReservationDTO":
         """A method for preparing DTO instance based on DB record.
 
+        The record is a row of the reservation joined with its car, user
+        and payment, whose columns are labelled `<relation>__<column>`.
+
         Args:
             record (Record): The DB record.
 
         Returns:
-            CarDTO: The final DTO instance.
+            ReservationDTO: The final DTO instance.
         """
-        record_dict = dict(record)
+        return cls.model_validate(_nest(record))
+
+    @classmethod
+    def from_records(
+            cls,
+            records: Iterable[Record],
+    ) -> list["ReservationDTO"]:
+        """A method for preparing DTO instances of a whole result set.
+
+        Args:
+            records (Iterable[Record]): The DB records.
+
+        Returns:
+            list[ReservationDTO]: The final DTO instances.
+        """
+        return _reservation_list_adapter.validate_python(
+            [_nest(record) for record in records],
+        )
+
+
+_reservation_list_adapter = TypeAdapter(list[ReservationDTO])
+
+
+def _nest(record: Record) -> dict:
+    """A function grouping joined columns by their relation.
+
+    Args:
+        record (Record): The DB record.
+
+    Returns:
+        dict: The reservation attributes with nested relations. A relation
+            missing from an outer join is None.
+    """
+
+    fields: dict = {}
+
+    for key, value in getattr(record, "_mapping", record).items():
+        relation, separator, column = key.partition(RELATION_SEPARATOR)
+        if separator:
+            fields.setdefault(relation, {})[column] = value
+        else:
+            fields[key] = value
 
-        return cls(
-            id=record_dict.get("id"),
-            car=CarDTO(),
-            reservation_start=record_dict.get("reservation_start"),
-            reservation_end=record_dict.get("reservation_end"),
-            payment=PaymentDTO(),
-            status=record_dict.get("status")
+    for relation, value in fields.items():
+        if isinstance(value, dict) and value.get("id") is None:
+            fields[relation] = None
 
-        )
\ No newline at end of file
+    return fields
@@ -1,17 +1,25 @@
-"""A module containing DTO models for output cars."""
+"""A module containing DTO models for output reviews."""
+
+from datetime import datetime
+from typing import Optional
 
 from asyncpg import Record  # type: ignore
-from pydantic import BaseModel, ConfigDict
-from src.infrastructure.dto.cardto import CarDTO
-from src.infrastructure.dto.userdto import UserDTO
+from pydantic import UUID4, BaseModel, ConfigDict
 
 
 class ReviewDTO(BaseModel):
-    """A model representing DTO for review data."""
-
-    user: UserDTO
-    car: CarDTO
+    """A model representing DTO for review data.
+
+    The author and the reservation are kept as nulls after they are
+    deleted, so the car's ratings stay intact.
+    """
+    id: int
+    user_id: Optional[UUID4] = None
+    car_id: int
+    reservation_id: Optional[int] = None
     body: str
+    rating: int
+    created_at: Optional[datetime] = None
 
     model_config = ConfigDict(
         from_attributes=True,
@@ -29,11 +37,4 @@ class ReviewDTO(BaseModel):
         Returns:
             ReviewDTO: The final DTO instance.
         """
-
-        record_dict = dict(record)
-
-        return cls(
-            user=UserDTO(),
-            car=CarDTO(),
-            body=record_dict.get("body")
-        )
\ No newline at end of file
+        return cls.model_validate(dict(getattr(record, "_mapping", record)))
@@ -2,7 +2,7 @@
 
 
 from datetime import datetime
-from pydantic import BaseModel, ConfigDict
+from pydantic import UUID4, BaseModel, ConfigDict
 
 
 class TokenDTO(BaseModel):
@@ -15,3 +15,16 @@ class TokenDTO(BaseModel):
         from_attributes=True,
         extra="ignore",
     )
+
+
+class TokenPayloadDTO(BaseModel):
+    """A DTO model for verified token claims."""
+    sub: UUID4
+    exp: datetime
+    type: str
+
+    model_config = ConfigDict(
+        from_attributes=True,
+        extra="ignore",
+        frozen=True,
+    )
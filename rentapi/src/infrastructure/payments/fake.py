@@ -0,0 +1,187 @@
+"""Module containing a local stand-in for the payment gateway.
+
+It serves the PaymentIntents subset used by `HttpPaymentGateway` with
+configurable latency and transient failures, either in-process through
+`httpx.ASGITransport` or as a server:
+
+    python -m src.infrastructure.payments.fake --port 12111 --latency 0.3
+
+The `pm_card_chargeDeclined` payment method is declined, like the
+Stripe test token of the same name.
+"""
+
+import argparse
+import asyncio
+import itertools
+import random
+from urllib.parse import parse_qsl
+
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+
+DECLINED_PAYMENT_METHOD = "pm_card_chargeDeclined"
+
+
+def create_fake_gateway(
+        latency: float = 0.0,
+        failure_rate: float = 0.0,
+) -> Starlette:
+    """A function building the stand-in gateway app.
+
+    Args:
+        latency (float): The delay of every response in seconds.
+        failure_rate (float): The share of requests failing with 503
+            before they are processed.
+
+    Returns:
+        Starlette: The ASGI app.
+    """
+
+    intents: dict[str, dict] = {}
+    replies: dict[str, JSONResponse] = {}
+    ids = itertools.count(1)
+
+    async def handle(request: Request, process) -> JSONResponse:
+        await asyncio.sleep(latency)
+
+        if random.random() < failure_rate:
+            return _error(503, "api_error", "Try again later.")
+
+        # Nothing is awaited between the lookup and storing the reply, so
+        # concurrent retries with the same key see one outcome.
+        form = dict(parse_qsl((await request.body()).decode()))
+        key = request.headers.get("Idempotency-Key")
+        if key is not None and key in replies:
+            return replies[key]
+
+        response = process(request.path_params, form)
+        if key is not None and response.status_code < 500:
+            replies[key] = response
+
+        return response
+
+    def create(_: dict, form) -> JSONResponse:
+        if form.get("payment_method") == DECLINED_PAYMENT_METHOD:
+            return _error(402, "card_error", "Your card was declined.")
+
+        intent = {
+            "id": f"pi_fake_{next(ids)}",
+            "amount": int(form.get("amount", 0)),
+            "currency": form.get("currency"),
+            "status": (
+                "requires_capture"
+                if form.get("capture_method") == "manual"
+                else "succeeded"
+            ),
+        }
+        intents[intent["id"]] = intent
+
+        return JSONResponse(intent)
+
+    def capture(params: dict, _) -> JSONResponse:
+        if (intent := intents.get(params["intent_id"])) is None:
+            return _error(404, "invalid_request_error", "No such intent.")
+        if intent["status"] != "requires_capture":
+            return _error(400, "invalid_request_error", "Not capturable.")
+
+        intent["status"] = "succeeded"
+
+        return JSONResponse(intent)
+
+    def cancel(params: dict, _) -> JSONResponse:
+        if (intent := intents.get(params["intent_id"])) is None:
+            return _error(404, "invalid_request_error", "No such intent.")
+        if intent["status"] != "requires_capture":
+            return _error(400, "invalid_request_error", "Not cancelable.")
+
+        intent["status"] = "canceled"
+
+        return JSONResponse(intent)
+
+    def refund(_: dict, form) -> JSONResponse:
+        intent = intents.get(form.get("payment_intent"))
+        if intent is None:
+            return _error(404, "invalid_request_error", "No such intent.")
+        if intent["status"] != "succeeded" or intent.get("refunded"):
+            return _error(400, "invalid_request_error", "Not refundable.")
+
+        intent["refunded"] = True
+
+        return JSONResponse({
+            "id": f"re_fake_{next(ids)}",
+            "amount": intent["amount"],
+            "payment_intent": intent["id"],
+            "status": "succeeded",
+        })
+
+    async def create_endpoint(request: Request) -> JSONResponse:
+        return await handle(request, create)
+
+    async def capture_endpoint(request: Request) -> JSONResponse:
+        return await handle(request, capture)
+
+    async def cancel_endpoint(request: Request) -> JSONResponse:
+        return await handle(request, cancel)
+
+    async def refund_endpoint(request: Request) -> JSONResponse:
+        return await handle(request, refund)
+
+    return Starlette(routes=[
+        Route("/v1/payment_intents", create_endpoint, methods=["POST"]),
+        Route(
+            "/v1/payment_intents/{intent_id}/capture",
+            capture_endpoint,
+            methods=["POST"],
+        ),
+        Route(
+            "/v1/payment_intents/{intent_id}/cancel",
+            cancel_endpoint,
+            methods=["POST"],
+        ),
+        Route("/v1/refunds", refund_endpoint, methods=["POST"]),
+    ])
+
+
+def _error(status_code: int, kind: str, message: str) -> JSONResponse:
+    """A function building an error response in the gateway's format.
+
+    Args:
+        status_code (int): The HTTP status.
+        kind (str): The type of the error.
+        message (str): The description of the error.
+
+    Returns:
+        JSONResponse: The error response.
+    """
+
+    return JSONResponse(
+        {"error": {"type": kind, "message": message}},
+        status_code=status_code,
+    )
+
+
+def main() -> None:
+    """The entry point serving the stand-in gateway."""
+    import uvicorn
+
+    parser = argparse.ArgumentParser(
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=12111)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--failure-rate", type=float, default=0.0)
+    args = parser.parse_args()
+
+    uvicorn.run(
+        create_fake_gateway(args.latency, args.failure_rate),
+        host=args.host,
+        port=args.port,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,330 @@
+"""Module containing the HTTP payment gateway client.
+
+The client speaks the PaymentIntents subset of the Stripe API over a
+pooled `httpx.AsyncClient`, so a slow gateway only delays the requests
+waiting for it, never the event loop.
+"""
+
+import asyncio
+import logging
+import random
+from typing import Any, Callable
+
+import httpx
+
+from src.core.domain.payment import (
+    GatewayCharge,
+    PaymentDeclinedError,
+    PaymentGatewayError,
+    PaymentGatewayUnavailableError,
+    PaymentStatus,
+)
+from src.infrastructure.payments.igateway import IPaymentGateway
+
+logger = logging.getLogger(__name__)
+
+# 409 is returned while a request with the same idempotency key is still
+# being processed, so it is safe to retry like the transient errors.
+_RETRIED_STATUSES = frozenset({409, 429, 500, 502, 503, 504})
+
+_STATUSES = {
+    "requires_capture": PaymentStatus.AUTHORIZED,
+    "succeeded": PaymentStatus.COMPLETED,
+    "processing": PaymentStatus.PENDING,
+    "canceled": PaymentStatus.VOIDED,
+}
+
+
+# Refunds are final once accepted, even while the money is on its way.
+_REFUNDED = frozenset({"succeeded", "pending"})
+
+
+class HttpPaymentGateway(IPaymentGateway):
+    """A class implementing the payment gateway over HTTP."""
+
+    _client: httpx.AsyncClient
+    _retries: int
+    _base_delay: float
+    _max_delay: float
+
+    def __init__(
+            self,
+            base_url: str,
+            api_key: str | None,
+            timeout: float,
+            connect_timeout: float,
+            retries: int,
+            base_delay: float,
+            max_delay: float,
+            max_connections: int,
+            transport: httpx.AsyncBaseTransport | None = None,
+    ) -> None:
+        """The initializer of the `HTTP payment gateway`.
+
+        Args:
+            base_url (str): The URL of the gateway API.
+            api_key (str | None): The secret key of the account.
+            timeout (float): The limit of a single attempt in seconds.
+            connect_timeout (float): The limit of opening a connection.
+            retries (int): The number of attempts of a call.
+            base_delay (float): Backoff of the first retry in seconds.
+            max_delay (float): Upper bound of a single backoff.
+            max_connections (int): The size of the connection pool.
+            transport (httpx.AsyncBaseTransport | None): The transport
+                replacing the network, e.g. the local stand-in.
+        """
+
+        self._client = httpx.AsyncClient(
+            base_url=base_url,
+            headers=(
+                {"Authorization": f"Bearer {api_key}"} if api_key else None
+            ),
+            timeout=httpx.Timeout(timeout, connect=connect_timeout),
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+            ),
+            transport=transport,
+        )
+        self._retries = retries
+        self._base_delay = base_delay
+        self._max_delay = max_delay
+
+    async def authorize(
+            self,
+            amount: float,
+            currency: str,
+            payment_method: str,
+            idempotency_key: str,
+            metadata: dict[str, str] | None = None,
+    ) -> GatewayCharge:
+        """The method reserving the amount on the payment method.
+
+        Args:
+            amount (float): The amount in major currency units.
+            currency (str): The ISO 4217 code of the currency.
+            payment_method (str): The payment method token.
+            idempotency_key (str): The key deduplicating retries.
+            metadata (dict[str, str] | None): The references stored
+                with the charge.
+
+        Raises:
+            PaymentDeclinedError: If the payment method was declined.
+            PaymentGatewayError: If the gateway rejected the call.
+
+        Returns:
+            GatewayCharge: The authorized charge.
+        """
+
+        data = {
+            "amount": round(amount * 100),
+            "currency": currency,
+            "payment_method": payment_method,
+            "capture_method": "manual",
+            "confirm": "true",
+        }
+        for key, value in (metadata or {}).items():
+            data[f"metadata[{key}]"] = value
+
+        return await self._call("/v1/payment_intents", data, idempotency_key)
+
+    async def capture(
+            self,
+            charge_id: str,
+            idempotency_key: str,
+    ) -> GatewayCharge:
+        """The method collecting a previously authorized charge.
+
+        Args:
+            charge_id (str): The id of the charge at the gateway.
+            idempotency_key (str): The key deduplicating retries.
+
+        Raises:
+            PaymentGatewayError: If the gateway rejected the call.
+
+        Returns:
+            GatewayCharge: The captured charge.
+        """
+
+        return await self._call(
+            f"/v1/payment_intents/{charge_id}/capture",
+            {},
+            idempotency_key,
+        )
+
+    async def void(
+            self,
+            charge_id: str,
+            idempotency_key: str,
+    ) -> GatewayCharge:
+        """The method releasing a previously authorized charge.
+
+        Args:
+            charge_id (str): The id of the charge at the gateway.
+            idempotency_key (str): The key deduplicating retries.
+
+        Raises:
+            PaymentGatewayError: If the gateway rejected the call.
+
+        Returns:
+            GatewayCharge: The voided charge.
+        """
+
+        return await self._call(
+            f"/v1/payment_intents/{charge_id}/cancel",
+            {},
+            idempotency_key,
+        )
+
+    async def refund(
+            self,
+            charge_id: str,
+            idempotency_key: str,
+    ) -> GatewayCharge:
+        """The method returning the amount of a captured charge.
+
+        Args:
+            charge_id (str): The id of the charge at the gateway.
+            idempotency_key (str): The key deduplicating retries.
+
+        Raises:
+            PaymentGatewayError: If the gateway rejected the call.
+
+        Returns:
+            GatewayCharge: The refunded charge.
+        """
+
+        return await self._call(
+            "/v1/refunds",
+            {"payment_intent": charge_id},
+            idempotency_key,
+            read=_refund,
+        )
+
+    async def aclose(self) -> None:
+        """The method releasing the pooled connections."""
+
+        await self._client.aclose()
+
+    async def _call(
+            self,
+            path: str,
+            data: dict[str, Any],
+            idempotency_key: str,
+            read: Callable[[httpx.Response], GatewayCharge] | None = None,
+    ) -> GatewayCharge:
+        """The method posting to the gateway with retries.
+
+        Every attempt sends the same idempotency key, so a request that
+        timed out after the gateway processed it is not applied twice.
+        Retries back off exponentially with full jitter.
+
+        Args:
+            path (str): The path of the API endpoint.
+            data (dict[str, Any]): The form fields.
+            idempotency_key (str): The key deduplicating retries.
+            read (Callable[[httpx.Response], GatewayCharge] | None): The
+                function reading the charge from the final response,
+                `_charge` by default.
+
+        Raises:
+            PaymentDeclinedError: If the payment method was declined.
+            PaymentGatewayError: If the gateway rejected the call.
+            PaymentGatewayUnavailableError: If all attempts failed.
+
+        Returns:
+            GatewayCharge: The charge in the response.
+        """
+
+        for attempt in range(self._retries):
+            if attempt:
+                await asyncio.sleep(random.uniform(
+                    0,
+                    min(self._max_delay, self._base_delay * 2 ** attempt),
+                ))
+
+            try:
+                response = await self._client.post(
+                    path,
+                    data=data,
+                    headers={"Idempotency-Key": idempotency_key},
+                )
+            except httpx.TransportError as e:
+                logger.warning(
+                    "payment gateway unreachable",
+                    extra={"attempt": attempt + 1, "error": repr(e)},
+                )
+                continue
+
+            if response.status_code in _RETRIED_STATUSES:
+                logger.warning(
+                    "payment gateway failed",
+                    extra={
+                        "attempt": attempt + 1,
+                        "status": response.status_code,
+                    },
+                )
+                continue
+
+            return (read or _charge)(response)
+
+        raise PaymentGatewayUnavailableError(path)
+
+
+def _charge(response: httpx.Response) -> GatewayCharge:
+    """A function reading the charge from a final gateway response.
+
+    Args:
+        response (httpx.Response): The response of the gateway.
+
+    Raises:
+        PaymentDeclinedError: If the payment method was declined.
+        PaymentGatewayError: If the gateway rejected the call.
+
+    Returns:
+        GatewayCharge: The charge.
+    """
+
+    try:
+        body = response.json()
+    except ValueError:
+        body = {}
+
+    if response.status_code == 402:
+        raise PaymentDeclinedError(body.get("error", {}).get("message"))
+    if response.is_error:
+        raise PaymentGatewayError(body.get("error", {}).get("message"))
+
+    if (status := _STATUSES.get(body.get("status"))) is None:
+        raise PaymentDeclinedError(body.get("status"))
+
+    return GatewayCharge(id=body["id"], status=status)
+
+
+def _refund(response: httpx.Response) -> GatewayCharge:
+    """A function reading the refunded charge from a gateway response.
+
+    Args:
+        response (httpx.Response): The response of the gateway.
+
+    Raises:
+        PaymentGatewayError: If the gateway rejected the refund.
+
+    Returns:
+        GatewayCharge: The refunded charge.
+    """
+
+    try:
+        body = response.json()
+    except ValueError:
+        body = {}
+
+    if response.is_error or body.get("status") not in _REFUNDED:
+        raise PaymentGatewayError(
+            body.get("error", {}).get("message", body.get("status")),
+        )
+
+    return GatewayCharge(
+        id=body["payment_intent"],
+        status=PaymentStatus.REFUNDED,
+    )
@@ -0,0 +1,101 @@
+"""Module containing payment gateway abstractions."""
+
+from abc import ABC, abstractmethod
+
+from src.core.domain.payment import GatewayCharge
+
+
+class IPaymentGateway(ABC):
+    """An abstract class representing protocol of payment gateway.
+
+    Every call takes an idempotency key, so it can be retried, also by
+    the caller, without charging twice.
+    """
+
+    @abstractmethod
+    async def authorize(
+            self,
+            amount: float,
+            currency: str,
+            payment_method: str,
+            idempotency_key: str,
+            metadata: dict[str, str] | None = None,
+    ) -> GatewayCharge:
+        """The abstract reserving the amount on the payment method.
+
+        Args:
+            amount (float): The amount in major currency units.
+            currency (str): The ISO 4217 code of the currency.
+            payment_method (str): The payment method token.
+            idempotency_key (str): The key deduplicating retries.
+            metadata (dict[str, str] | None): The references stored
+                with the charge.
+
+        Raises:
+            PaymentDeclinedError: If the payment method was declined.
+            PaymentGatewayError: If the gateway rejected the call.
+
+        Returns:
+            GatewayCharge: The authorized charge.
+        """
+
+    @abstractmethod
+    async def capture(
+            self,
+            charge_id: str,
+            idempotency_key: str,
+    ) -> GatewayCharge:
+        """The abstract collecting a previously authorized charge.
+
+        Args:
+            charge_id (str): The id of the charge at the gateway.
+            idempotency_key (str): The key deduplicating retries.
+
+        Raises:
+            PaymentGatewayError: If the gateway rejected the call.
+
+        Returns:
+            GatewayCharge: The captured charge.
+        """
+
+    @abstractmethod
+    async def void(
+            self,
+            charge_id: str,
+            idempotency_key: str,
+    ) -> GatewayCharge:
+        """The abstract releasing a previously authorized charge.
+
+        Args:
+            charge_id (str): The id of the charge at the gateway.
+            idempotency_key (str): The key deduplicating retries.
+
+        Raises:
+            PaymentGatewayError: If the gateway rejected the call.
+
+        Returns:
+            GatewayCharge: The voided charge.
+        """
+
+    @abstractmethod
+    async def refund(
+            self,
+            charge_id: str,
+            idempotency_key: str,
+    ) -> GatewayCharge:
+        """The abstract returning the amount of a captured charge.
+
+        Args:
+            charge_id (str): The id of the charge at the gateway.
+            idempotency_key (str): The key deduplicating retries.
+
+        Raises:
+            PaymentGatewayError: If the gateway rejected the call.
+
+        Returns:
+            GatewayCharge: The refunded charge.
+        """
+
+    @abstractmethod
+    async def aclose(self) -> None:
+        """The abstract releasing the pooled connections."""
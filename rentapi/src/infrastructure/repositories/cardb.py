@@ -1,30 +1,90 @@
 """Module containing car repository implementation."""
 
-from typing import Any, Iterable
+import asyncio
+from datetime import datetime
+from typing import Any, AsyncIterator, Collection, Iterable
 
-from asyncpg import Record  # type: ignore
+import sqlalchemy
+from asyncpg.exceptions import (  # type: ignore
+    InvalidColumnReferenceError,
+    UniqueViolationError,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, TSTZRANGE, array
 
 from src.core.repositories.icar import ICarRepository
-from src.core.domain.car import Car, CarIn
-from src.db import car_table, database
-from src.infrastructure.dto.cardto import CarDTO
+from src.core.domain.car import (
+    CarIn,
+    CarRegistrationNotUniqueError,
+    CarSearch,
+    ImportMode,
+    SortOrder,
+)
+from src.core.domain.reservation import ReservationStatus
+from src.db import (
+    RATINGS,
+    car_review_stats_table,
+    car_table,
+    database,
+    reservation_table,
+)
+from src.infrastructure.dto.cardto import CarDTO, CarRatingDTO
+from src.infrastructure.utils import consts
+from src.pool import observed_query
+
+IMPORT_COLUMNS = tuple(CarIn.model_fields)
 
 
 class CarRepository(ICarRepository):
     """A class representing car DB repository."""
 
-    async def get_all_cars(self) -> Iterable[Any]:
-        """The abstract getting all cars from the data storage.
+    async def get_all_cars(
+            self,
+            limit: int,
+            after_id: int | None = None,
+            with_ratings: bool = False,
+    ) -> Iterable[Any]:
+        """The method getting a page of cars ordered by id.
+
+        Ratings are read from the per-car aggregate joined in the same
+        query, so their cost does not grow with the number of reviews.
+
+        Args:
+            limit (int): The maximum number of cars to return.
+            after_id (int | None): The id after which the page starts.
+            with_ratings (bool): Whether to include the review aggregate.
 
         Returns:
             Iterable[Any]: Cars in the data storage
         """
 
-        query = car_table.select()
+        if with_ratings:
+            query = _with_ratings(car_table.select())
+        else:
+            query = car_table.select()
+
+        query = query.order_by(car_table.c.id).limit(limit)
+
+        if after_id is not None:
+            query = query.where(car_table.c.id > after_id)
 
         cars = await database.fetch_all(query)
 
-        return [CarDTO.from_record(car) for car in cars]
+        if with_ratings:
+            return CarRatingDTO.from_records(cars)
+
+        return CarDTO.from_records(cars)
+
+    async def iterate_cars(self) -> AsyncIterator[Any]:
+        """The method iterating over all cars using a server-side cursor.
+
+        Yields:
+            CarDTO: Cars in the data storage.
+        """
+
+        query = car_table.select().order_by(car_table.c.id)
+
+        async for car in database.iterate(query):
+            yield CarDTO.from_record(car)
 
     async def get_car_by_id(self, car_id: int) -> Any | None:
         """The abstract getting car provided id.
@@ -58,7 +118,7 @@ class CarRepository(ICarRepository):
 
         cars = await database.fetch_all(query)
 
-        return [CarDTO.from_record(car) for car in cars]
+        return CarDTO.from_records(cars)
 
     async def get_car_by_model(self, name: str) -> Iterable[Any]:
         """The method getting cars provided by model.
@@ -76,53 +136,342 @@ class CarRepository(ICarRepository):
 
         cars = await database.fetch_all(query)
 
-        return [CarDTO.from_record(car) for car in cars]
+        return CarDTO.from_records(cars)
+
+    async def search_cars(
+            self,
+            filters: CarSearch,
+            limit: int,
+            after: tuple[Any, int] | None = None,
+    ) -> Iterable[Any]:
+        """The method searching cars matching all provided filters.
+
+        Cars without a value in the sort column are left out of sorted
+        results, so every page boundary is a comparable keyset.
+
+        Args:
+            filters (CarSearch): The search filters and sorting.
+            limit (int): The maximum number of cars to return.
+            after (tuple[Any, int] | None): The sort value and id of the
+                last car of the previous page.
+
+        Returns:
+            Iterable[Any]: The matching cars.
+        """
+
+        columns = car_table.c
+        conditions = []
+
+        if filters.brand:
+            conditions.append(
+                columns.brand.ilike(_contains(filters.brand), escape="\\")
+            )
+        if filters.model:
+            conditions.append(
+                columns.model.ilike(_contains(filters.model), escape="\\")
+            )
+        if filters.fuel_type:
+            conditions.append(columns.fuel_type == filters.fuel_type)
+        if filters.gearbox:
+            conditions.append(columns.gearbox == filters.gearbox)
+        if filters.seats:
+            conditions.append(columns.seats == filters.seats)
+        if filters.year_from:
+            conditions.append(columns.year >= filters.year_from)
+        if filters.year_to:
+            conditions.append(columns.year <= filters.year_to)
+        if filters.price_from is not None:
+            conditions.append(columns.price_per_day >= filters.price_from)
+        if filters.price_to is not None:
+            conditions.append(columns.price_per_day <= filters.price_to)
+
+        sort_column = columns[filters.sort_by.value]
+        descending = filters.order == SortOrder.DESC
+
+        if sort_column is not columns.id:
+            conditions.append(sort_column.is_not(None))
+
+        if after is not None:
+            if sort_column is columns.id:
+                key, bound = columns.id, after[1]
+            else:
+                key = sqlalchemy.tuple_(sort_column, columns.id)
+                bound = sqlalchemy.tuple_(*after)
+            conditions.append(key < bound if descending else key > bound)
+
+        if sort_column is columns.id:
+            order_by = [columns.id.desc() if descending else columns.id]
+        elif descending:
+            order_by = [sort_column.desc(), columns.id.desc()]
+        else:
+            order_by = [sort_column, columns.id]
+
+        query = (
+            car_table.select()
+            .where(*conditions)
+            .order_by(*order_by)
+            .limit(limit)
+        )
+        cars = await database.fetch_all(query)
+
+        return CarDTO.from_records(cars)
+
+    async def get_available_cars(
+            self,
+            start: datetime,
+            end: datetime,
+            limit: int,
+            after_id: int | None = None,
+    ) -> Iterable[Any]:
+        """The method getting cars without reservations in the period.
+
+        The anti-join probes the GiST exclusion index on
+        `(car_id, period)` once per candidate car.
+
+        Args:
+            start (datetime): The start of the period.
+            end (datetime): The end of the period.
+            limit (int): The maximum number of cars to return.
+            after_id (int | None): The id after which the page starts.
+
+        Returns:
+            Iterable[Any]: The free cars.
+        """
+
+        period = sqlalchemy.func.tstzrange(
+            sqlalchemy.literal(start, sqlalchemy.DateTime(timezone=True)),
+            sqlalchemy.literal(end, sqlalchemy.DateTime(timezone=True)),
+            "[)",
+            type_=TSTZRANGE,
+        )
+        overlapping = (
+            sqlalchemy.select(reservation_table.c.id)
+            .where(
+                reservation_table.c.car_id == car_table.c.id,
+                reservation_table.c.period.op("&&")(period),
+                reservation_table.c.status
+                != ReservationStatus.CANCELLED.value,
+            )
+        )
+        query = (
+            car_table.select()
+            .where(~overlapping.exists())
+            .order_by(car_table.c.id)
+            .limit(limit)
+        )
+
+        if after_id is not None:
+            query = query.where(car_table.c.id > after_id)
+
+        cars = await database.fetch_all(query)
+
+        return CarDTO.from_records(cars)
+
+    async def get_prices(self, car_ids: Iterable[int]) -> dict[int, float]:
+        """The method getting the daily rates of many cars in one query.
+
+        Args:
+            car_ids (Iterable[int]): The ids of the cars.
+
+        Returns:
+            dict[int, float]: The daily rates of the existing cars by id.
+        """
+
+        query = sqlalchemy.select(
+            car_table.c.id,
+            car_table.c.price_per_day,
+        ).where(car_table.c.id == sqlalchemy.any_(
+            sqlalchemy.literal(list(car_ids), ARRAY(sqlalchemy.Integer)),
+        ))
+        cars = await database.fetch_all(query)
+
+        return {car.id: car.price_per_day for car in cars}
 
     async def add_car(self, data: CarIn) -> Any | None:
-        """The abstract adding new car to the data storage.
+        """The method adding new car to the data storage.
 
         Args:
             data (CarIn): The details of the new car.
 
         Returns:
-            Any | None: The newly added car.
+            Any | None: The newly added car, None if the registration
+                number is taken.
+        """
+
+        query = (
+            car_table.insert()
+            .values(**data.model_dump())
+            .returning(*car_table.c)
+        )
+
+        try:
+            new_car = await database.fetch_one(query)
+        except UniqueViolationError:
+            return None
+
+        return CarDTO.from_record(new_car) if new_car else None
+
+    async def import_cars(
+            self,
+            batches: AsyncIterator[list[CarIn]],
+            mode: ImportMode,
+    ) -> tuple[int, int]:
+        """The method bulk loading cars with the COPY protocol.
+
+        Batches are copied into a temporary staging table and merged into
+        `cars` with one INSERT ... SELECT, all in a single transaction.
+        The connection is held while the batches are consumed, so they
+        must not wait on the network.
+
+        Args:
+            batches (AsyncIterator[list[CarIn]]): The validated cars.
+            mode (ImportMode): Whether existing registrations are updated.
+
+        Raises:
+            CarRegistrationNotUniqueError: If `cars` lacks the unique
+                registration constraint the merge relies on.
+
+        Returns:
+            tuple[int, int]: The number of received and written cars.
+        """
+
+        columns = ", ".join(IMPORT_COLUMNS)
+        received = 0
+
+        if mode == ImportMode.UPSERT:
+            updates = ", ".join(
+                [f"{column} = EXCLUDED.{column}" for column in IMPORT_COLUMNS]
+                + ["version = cars.version + 1", "updated_at = now()"]
+            )
+            merge = (
+                f"INSERT INTO cars ({columns}) "
+                f"SELECT DISTINCT ON (registration_number) {columns} "
+                "FROM car_import ORDER BY registration_number, seq DESC "
+                f"ON CONFLICT (registration_number) DO UPDATE SET {updates}"
+            )
+        else:
+            merge = (
+                f"INSERT INTO cars ({columns}) "
+                f"SELECT {columns} FROM car_import ORDER BY seq "
+                "ON CONFLICT (registration_number) DO NOTHING"
+            )
+
+        async with database.connection() as connection:
+            async with connection.transaction():
+                raw = connection.raw_connection
+                with observed_query():
+                    await raw.execute(
+                        "CREATE TEMP TABLE car_import ON COMMIT DROP AS "
+                        f"SELECT {columns} FROM cars WITH NO DATA"
+                    )
+                with observed_query():
+                    await raw.execute(
+                        "ALTER TABLE car_import ADD COLUMN seq bigserial"
+                    )
+
+                async for batch in batches:
+                    with observed_query():
+                        await raw.copy_records_to_table(
+                            "car_import",
+                            records=[
+                                tuple(getattr(car, column)
+                                      for column in IMPORT_COLUMNS)
+                                for car in batch
+                            ],
+                            columns=IMPORT_COLUMNS,
+                        )
+                    received += len(batch)
+
+                try:
+                    with observed_query():
+                        status = await raw.execute(merge)
+                except InvalidColumnReferenceError as e:
+                    raise CarRegistrationNotUniqueError(str(e)) from e
+
+        return received, int(status.rsplit(" ", 1)[-1])
+
+    async def export_cars(self) -> AsyncIterator[bytes]:
+        """The method streaming all cars as CSV with COPY TO.
+
+        The copy runs in its own task holding one connection, and chunks
+        are handed over through a bounded queue for backpressure.
+
+        Yields:
+            bytes: The CSV chunks, starting with the header.
         """
 
-        query = car_table.insert().values(**data.model_dump())
-        new_car_id = await database.execute(query)
-        new_car = await self._get_by_id(new_car_id)
+        # asyncpg wraps the query in COPY (...) TO STDOUT itself.
+        query = f"SELECT id, {', '.join(IMPORT_COLUMNS)} FROM cars ORDER BY id"
+        queue: asyncio.Queue[bytes] = asyncio.Queue(
+            maxsize=consts.EXPORT_QUEUE_CHUNKS,
+        )
 
-        return Car(**dict(new_car)) if new_car else None
+        async def copy() -> None:
+            # The duration includes time blocked on a slow reader.
+            async with database.connection() as connection:
+                with observed_query():
+                    await connection.raw_connection.copy_from_query(
+                        query,
+                        output=queue.put,
+                        format="csv",
+                        header=True,
+                    )
+
+        task = asyncio.create_task(copy())
+
+        try:
+            while not (task.done() and queue.empty()):
+                getter = asyncio.ensure_future(queue.get())
+                await asyncio.wait(
+                    {getter, task},
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                if getter.done():
+                    yield getter.result()
+                else:
+                    getter.cancel()
+
+            task.result()
+        finally:
+            task.cancel()
 
     async def update_car(
             self,
             car_id: int,
-            data: CarIn
+            data: CarIn,
+            versions: Collection[int] | None = None,
     ) -> Any | None:
-        """The abstract updating car data in the data storage.
+        """The method updating car data and bumping its version.
 
         Args:
             car_id (int): The id of the car
             data (CarIn): The details of the update car.
+            versions (Collection[int] | None): The versions the car must
+                currently have, any if None.
 
         Returns:
-            Any | None: The updated car details.
+            Any | None: The updated car details, None if no car matched.
         """
 
-        if self._get_by_id(car_id):
-            query = (
-                car_table.update()
-                .where(car_table.c.id == car_id)
-                .values(**data.model_dump())
+        query = (
+            car_table.update()
+            .where(car_table.c.id == car_id)
+            .values(
+                **data.model_dump(),
+                version=car_table.c.version + 1,
+                updated_at=sqlalchemy.func.now(),
             )
-            await database.execute(query)
+            .returning(*car_table.c)
+        )
 
-            car = await self._get_by_id(car_id)
+        if versions is not None:
+            query = query.where(car_table.c.version.in_(versions))
+        car = await database.fetch_one(query)
 
-            return Car(**dict(car)) if car else None
+        return CarDTO.from_record(car) if car else None
 
     async def delete_car(self, car_id: int) -> bool:
-        """The abstract removing car from the data storage.
+        """The method removing car from the data storage.
 
         Args:
              car_id (int): The id of the car.
@@ -131,29 +480,64 @@ class CarRepository(ICarRepository):
             bool: Success of the operation.
         """
 
-        if self._get_by_id(car_id):
-            query = car_table \
-                .delete() \
-                .where(car_table.c.id == car_id)
-            await database.execute(query)
+        query = (
+            car_table.delete()
+            .where(car_table.c.id == car_id)
+            .returning(car_table.c.id)
+        )
 
-            return True
+        return await database.fetch_one(query) is not None
 
-        return False
 
-    async def _get_by_id(self, car_id: int) -> Record | None:
-        """A private method getting car from the DB based on its ID.
+def _with_ratings(query: sqlalchemy.Select) -> sqlalchemy.Select:
+    """A function extending a car query with the review aggregate.
 
-        Args:
-            car_id (int): The ID of the car.
+    Args:
+        query (sqlalchemy.Select): The query selecting cars.
 
-        Returns:
-            Any | None: car record if exists.
-        """
+    Returns:
+        sqlalchemy.Select: The query also selecting the rating columns.
+    """
 
-        query = (
-            car_table.select()
-            .where(car_table.c.id == car_id)
+    stats = car_review_stats_table.c
+
+    return (
+        query
+        .add_columns(
+            sqlalchemy.func.coalesce(stats.review_count, 0)
+            .label("review_count"),
+            (
+                sqlalchemy.cast(stats.rating_sum, sqlalchemy.Float)
+                / sqlalchemy.func.nullif(stats.review_count, 0)
+            ).label("average_rating"),
+            array([
+                sqlalchemy.func.coalesce(stats[f"rating_{rating}"], 0)
+                for rating in RATINGS
+            ]).label("rating_histogram"),
         )
+        .select_from(
+            car_table.outerjoin(
+                car_review_stats_table,
+                stats.car_id == car_table.c.id,
+            ),
+        )
+    )
+
+
+def _contains(text: str) -> str:
+    """A function building a LIKE pattern matching a literal substring.
+
+    Args:
+        text (str): The searched text.
+
+    Returns:
+        str: The escaped pattern.
+    """
+
+    escaped = (
+        text.replace("\\", "\\\\")
+        .replace("%", "\\%")
+        .replace("_", "\\_")
+    )
 
-        return await database.fetch_one(query)
+    return f"%{escaped}%"
@@ -0,0 +1,134 @@
+"""Module containing outbox repository implementation."""
+
+from datetime import timedelta
+from typing import Any, Collection, Iterable
+
+import sqlalchemy
+
+from src.core.domain.outbox import OutboxEvent, OutboxEventIn
+from src.core.repositories.ioutbox import IOutboxRepository
+from src.db import database, outbox_table
+
+
+class OutboxRepository(IOutboxRepository):
+    """A class representing outbox DB repository."""
+
+    async def add_events(self, events: Iterable[OutboxEventIn]) -> None:
+        """The method recording side effects to be dispatched.
+
+        Must run inside the transaction of the change causing them.
+
+        Args:
+            events (Iterable[OutboxEventIn]): The side effects.
+        """
+
+        rows = [
+            {
+                "topic": event.topic.value,
+                "payload": event.model_dump(mode="json")["payload"],
+                "available_at": event.available_at or sqlalchemy.func.now(),
+            }
+            for event in events
+        ]
+
+        if rows:
+            await database.execute(outbox_table.insert().values(rows))
+
+    async def claim_events(self, limit: int, lease: float) -> Iterable[Any]:
+        """The method claiming due events for a dispatcher.
+
+        The due rows are picked with `FOR UPDATE SKIP LOCKED`, so
+        concurrent dispatchers claim disjoint batches without waiting on
+        each other, and leased by moving `available_at` forward.
+
+        Args:
+            limit (int): The maximum number of events.
+            lease (float): The time to process them in seconds.
+
+        Returns:
+            Iterable[Any]: The claimed events.
+        """
+
+        due = (
+            sqlalchemy.select(outbox_table.c.id)
+            .where(
+                outbox_table.c.processed_at.is_(None),
+                outbox_table.c.available_at <= sqlalchemy.func.now(),
+            )
+            .order_by(outbox_table.c.available_at, outbox_table.c.id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        query = (
+            outbox_table.update()
+            .where(outbox_table.c.id.in_(due.scalar_subquery()))
+            .values(
+                available_at=sqlalchemy.func.now() + timedelta(seconds=lease),
+                attempts=outbox_table.c.attempts + 1,
+            )
+            .returning(
+                outbox_table.c.id,
+                outbox_table.c.topic,
+                outbox_table.c.payload,
+                outbox_table.c.attempts,
+            )
+        )
+        events = await database.fetch_all(query)
+
+        return [OutboxEvent.model_validate(event) for event in events]
+
+    async def complete_events(self, event_ids: Collection[int]) -> None:
+        """The method marking events as processed.
+
+        Args:
+            event_ids (Collection[int]): The ids of the events.
+        """
+
+        if not event_ids:
+            return
+
+        await database.execute(
+            outbox_table.update()
+            .where(outbox_table.c.id.in_(event_ids))
+            .values(processed_at=sqlalchemy.func.now(), last_error=None)
+        )
+
+    async def retry_event(
+            self,
+            event_id: int,
+            error: str,
+            delay: float,
+    ) -> None:
+        """The method scheduling another attempt of a failed event.
+
+        Args:
+            event_id (int): The id of the event.
+            error (str): The description of the failure.
+            delay (float): The backoff in seconds.
+        """
+
+        await database.execute(
+            outbox_table.update()
+            .where(outbox_table.c.id == event_id)
+            .values(
+                available_at=sqlalchemy.func.now() + timedelta(seconds=delay),
+                last_error=error,
+            )
+        )
+
+    async def fail_event(self, event_id: int, error: str) -> None:
+        """The method giving up on an event.
+
+        The event keeps its `last_error`, which tells it apart from the
+        successfully processed ones.
+
+        Args:
+            event_id (int): The id of the event.
+            error (str): The description of the last failure.
+        """
+
+        await database.execute(
+            outbox_table.update()
+            .where(outbox_table.c.id == event_id)
+            .values(processed_at=sqlalchemy.func.now(), last_error=error)
+        )
@@ -0,0 +1,219 @@
+"""Module containing payment repository implementation."""
+
+from typing import Any
+
+import sqlalchemy
+from sqlalchemy.dialects.postgresql import insert
+
+from src.core.domain.outbox import OutboxEventIn, OutboxTopic
+from src.core.domain.payment import PaymentIn, PaymentStatus
+from src.core.domain.reservation import ReservationStatus
+from src.core.repositories.ioutbox import IOutboxRepository
+from src.core.repositories.ipayment import IPaymentRepository
+from src.db import database, payment_table, reservation_table
+from src.infrastructure.dto.paymentdto import PaymentDTO
+
+
+class PaymentRepository(IPaymentRepository):
+    """A class representing payment DB repository.
+
+    Gateway calls happen outside of these transactions, so no connection
+    is held while waiting for the network.
+    """
+
+    _outbox: IOutboxRepository
+
+    def __init__(self, outbox: IOutboxRepository) -> None:
+        """The initializer of the `payment repository`.
+
+        Args:
+            outbox (IOutboxRepository): The repository recording side
+                effects of payments.
+        """
+
+        self._outbox = outbox
+
+    async def get_by_id(self, payment_id: int) -> Any | None:
+        """The method getting payment provided by id.
+
+        Args:
+            payment_id (int): The id of the payment.
+
+        Returns:
+            Any | None: The payment details.
+        """
+
+        query = payment_table.select().where(payment_table.c.id == payment_id)
+        payment = await database.fetch_one(query)
+
+        return PaymentDTO.from_record(payment) if payment else None
+
+    async def open_payment(self, data: PaymentIn) -> Any:
+        """The method getting the reservation's payment in flight.
+
+        Concurrent requests race on the `ux_payments_reservation_open`
+        index, so all of them end up with the same payment.
+
+        Args:
+            data (PaymentIn): The attributes of a new payment.
+
+        Returns:
+            Any: The open payment of the reservation.
+        """
+
+        async with database.transaction():
+            payment = await database.fetch_one(
+                insert(payment_table)
+                .values(**data.model_dump())
+                .on_conflict_do_nothing(
+                    index_elements=[payment_table.c.reservation_id],
+                    # Inferring the partial index needs its literal
+                    # predicate, not a bound parameter.
+                    index_where=sqlalchemy.text(
+                        f"status NOT IN ('{PaymentStatus.FAILED.value}', "
+                        f"'{PaymentStatus.VOIDED.value}')",
+                    ),
+                )
+                .returning(*payment_table.c)
+            )
+
+            if payment is None:
+                payment = await database.fetch_one(
+                    payment_table.select().where(
+                        payment_table.c.reservation_id == data.reservation_id,
+                        payment_table.c.status.not_in(_CLOSED),
+                    )
+                )
+
+        return PaymentDTO.from_record(payment)
+
+    async def update_payment(
+            self,
+            payment_id: int,
+            status: PaymentStatus,
+            gateway_id: str | None = None,
+    ) -> Any | None:
+        """The method recording the outcome of a gateway call.
+
+        The first authorized or completed payment confirms its
+        reservation, and the side effects of the confirmation are put in
+        the outbox in the same transaction. A payment arriving after the
+        hold of the reservation expired is voided instead, or refunded if
+        the gateway already captured it, and the release of the charge
+        is put in the outbox.
+
+        Args:
+            payment_id (int): The id of the payment.
+            status (PaymentStatus): The new status.
+            gateway_id (str | None): The id of the charge at the gateway.
+
+        Returns:
+            Any | None: The updated payment.
+        """
+
+        values: dict[str, Any] = {"status": status.value}
+        if gateway_id is not None:
+            values["gateway_id"] = gateway_id
+
+        async with database.transaction():
+            payment = await database.fetch_one(
+                payment_table.update()
+                .where(payment_table.c.id == payment_id)
+                .values(**values)
+                .returning(*payment_table.c)
+            )
+
+            if payment and status in _PAID:
+                reservation = await database.fetch_one(
+                    reservation_table.update()
+                    .where(
+                        reservation_table.c.id == payment.reservation_id,
+                        reservation_table.c.status
+                        == ReservationStatus.PENDING.value,
+                    )
+                    .values(
+                        status=ReservationStatus.CONFIRMED.value,
+                        payment_id=payment.id,
+                        next_transition_at=reservation_table.c.reservation_start,
+                    )
+                    .returning(
+                        reservation_table.c.id,
+                        reservation_table.c.user_id,
+                    )
+                )
+
+                if reservation:
+                    await self._outbox.add_events(
+                        _confirmation_events(payment.id, status, reservation),
+                    )
+                else:
+                    released, topic = _RELEASES[status]
+                    payment = await database.fetch_one(
+                        payment_table.update()
+                        .where(payment_table.c.id == payment.id)
+                        .values(status=released.value)
+                        .returning(*payment_table.c)
+                    )
+                    await self._outbox.add_events([
+                        OutboxEventIn(
+                            topic=topic,
+                            payload={"payment_id": payment.id},
+                        ),
+                    ])
+
+        return PaymentDTO.from_record(payment) if payment else None
+
+
+_PAID = frozenset({PaymentStatus.AUTHORIZED, PaymentStatus.COMPLETED})
+
+# How a paid payment of a reservation no longer awaiting it is given
+# back: an authorization is voided, a captured charge refunded.
+_RELEASES = {
+    PaymentStatus.AUTHORIZED: (
+        PaymentStatus.VOIDED,
+        OutboxTopic.PAYMENT_VOID,
+    ),
+    PaymentStatus.COMPLETED: (
+        PaymentStatus.REFUNDED,
+        OutboxTopic.PAYMENT_REFUND,
+    ),
+}
+
+# Statuses of payments no longer in flight, left out of
+# `ux_payments_reservation_open`.
+_CLOSED = (PaymentStatus.FAILED.value, PaymentStatus.VOIDED.value)
+
+
+def _confirmation_events(
+        payment_id: int,
+        status: PaymentStatus,
+        reservation: Any,
+) -> list[OutboxEventIn]:
+    """A function listing the side effects of a confirmed reservation.
+
+    Args:
+        payment_id (int): The id of the paying payment.
+        status (PaymentStatus): The status of the paying payment.
+        reservation (Any): The confirmed reservation row.
+
+    Returns:
+        list[OutboxEventIn]: The events to dispatch.
+    """
+
+    events = [
+        OutboxEventIn(
+            topic=OutboxTopic.RESERVATION_CONFIRMED,
+            payload={
+                "reservation_id": reservation.id,
+                "user_id": str(reservation.user_id),
+            },
+        ),
+    ]
+
+    if status == PaymentStatus.AUTHORIZED:
+        events.append(OutboxEventIn(
+            topic=OutboxTopic.PAYMENT_CAPTURE,
+            payload={"payment_id": payment_id},
+        ))
+
+    return events
@@ -0,0 +1,784 @@
+"""Module containing reservation repository implementation."""
+
+import hashlib
+from datetime import datetime, timedelta
+from typing import Any, Iterable
+
+import sqlalchemy
+from asyncpg.exceptions import ExclusionViolationError  # type: ignore
+from pydantic import UUID4
+from sqlalchemy.dialects.postgresql import insert
+
+from src.core.domain.outbox import OutboxEventIn, OutboxTopic
+from src.core.domain.payment import PaymentStatus
+from src.core.domain.reservation import (
+    IdempotencyKeyBusyError,
+    IdempotencyKeyExpiredError,
+    IdempotencyKeyReusedError,
+    ReservationBroker,
+    ReservationConflictError,
+    ReservationFilter,
+    ReservationIn,
+    ReservationNotEditableError,
+    ReservationStatus,
+)
+from src.core.repositories.ioutbox import IOutboxRepository
+from src.core.repositories.ireservation import IReservationRepository
+from src.db import (
+    car_table,
+    database,
+    idempotency_key_table,
+    payment_table,
+    reservation_table,
+    user_table,
+)
+from src.infrastructure.dto.paymentdto import PaymentDTO
+from src.infrastructure.dto.reservationdto import (
+    RELATION_SEPARATOR,
+    ReservationDTO,
+)
+from src.infrastructure.utils.pricing import PricingEngine
+
+# Status changes due with time, applied in this order so a row late for
+# several of them catches up within one run: (from, to, next transition).
+_TRANSITIONS = (
+    (ReservationStatus.PENDING, ReservationStatus.CANCELLED, None),
+    (
+        ReservationStatus.CONFIRMED,
+        ReservationStatus.IN_PROGRESS,
+        reservation_table.c.reservation_end,
+    ),
+    (ReservationStatus.IN_PROGRESS, ReservationStatus.COMPLETED, None),
+)
+
+# Claims of an idempotency key tried before giving up on a key whose
+# conflicting claim keeps being released.
+_CLAIM_ATTEMPTS = 2
+
+# Statuses in which the owner may still rebook or remove a reservation,
+# and in which it may still be cancelled.
+_EDITABLE = (ReservationStatus.PENDING.value,)
+_CANCELLABLE = (
+    ReservationStatus.PENDING.value,
+    ReservationStatus.CONFIRMED.value,
+)
+
+# Own columns of the reservation read into the DTO; the range `period`
+# only backs the exclusion constraint.
+_RESERVATION_COLUMNS = frozenset(ReservationDTO.model_fields) - {
+    "car",
+    "user",
+    "payment",
+}
+
+
+class ReservationRepository(IReservationRepository):
+    """A class representing reservation DB repository.
+
+    Overlapping bookings of a car are rejected by the
+    `ex_reservations_car_period` exclusion constraint, which Postgres
+    enforces atomically even between concurrent transactions.
+    """
+
+    _pricing: PricingEngine
+    _outbox: IOutboxRepository
+    _hold: timedelta
+
+    def __init__(
+            self,
+            pricing: PricingEngine,
+            outbox: IOutboxRepository,
+            hold_ttl: int,
+    ) -> None:
+        """The initializer of the `reservation repository`.
+
+        Args:
+            pricing (PricingEngine): The engine pricing the rentals.
+            outbox (IOutboxRepository): The repository recording side
+                effects of status changes.
+            hold_ttl (int): The seconds an unpaid reservation holds the
+                car.
+        """
+
+        self._pricing = pricing
+        self._outbox = outbox
+        self._hold = timedelta(seconds=hold_ttl)
+
+    async def get_reservations(self) -> Iterable[Any]:
+        """The method getting all reservations from the data storage.
+
+        Returns:
+            Iterable[Any]: Reservations in the data storage.
+        """
+
+        query = _hydrated(reservation_table).order_by(reservation_table.c.id)
+        reservations = await database.fetch_all(query)
+
+        return ReservationDTO.from_records(reservations)
+
+    async def get_by_car(self, car_id: int) -> Iterable[Any]:
+        """The method getting reservations provided by car id.
+
+        Args:
+            car_id (int): The id of the car.
+
+        Returns:
+            Iterable[Any]: The reservations of the car.
+        """
+
+        query = (
+            _hydrated(reservation_table)
+            .where(reservation_table.c.car_id == car_id)
+            .order_by(reservation_table.c.reservation_start)
+        )
+        reservations = await database.fetch_all(query)
+
+        return ReservationDTO.from_records(reservations)
+
+    async def get_by_id(self, reservation_id: int) -> Any | None:
+        """The method getting reservation provided by id.
+
+        Args:
+            reservation_id (int): The id of the reservation.
+
+        Returns:
+            Any | None: The reservation details.
+        """
+
+        query = _hydrated(reservation_table).where(
+            reservation_table.c.id == reservation_id,
+        )
+        reservation = await database.fetch_one(query)
+
+        return ReservationDTO.from_record(reservation) if reservation else None
+
+    async def get_by_user(self, user_id: UUID4) -> Iterable[Any]:
+        """The method getting all reservations of the user.
+
+        Args:
+            user_id (UUID4): The id of the user.
+
+        Returns:
+            Iterable[Any]: The collection of the reservations.
+        """
+
+        query = (
+            _hydrated(reservation_table)
+            .where(reservation_table.c.user_id == user_id)
+            .order_by(reservation_table.c.reservation_start)
+        )
+        reservations = await database.fetch_all(query)
+
+        return ReservationDTO.from_records(reservations)
+
+    async def get_page_by_user(
+            self,
+            user_id: UUID4,
+            filters: ReservationFilter,
+            limit: int,
+            after: tuple[datetime, int] | None = None,
+    ) -> Iterable[Any]:
+        """The method getting a page of the user's reservations.
+
+        Args:
+            user_id (UUID4): The id of the user.
+            filters (ReservationFilter): The status and start window.
+            limit (int): The maximum number of reservations to return.
+            after (tuple[datetime, int] | None): The start and id of the
+                last reservation of the previous page.
+
+        Returns:
+            Iterable[Any]: The reservations ordered by start.
+        """
+
+        return await _history_page(
+            reservation_table.c.user_id == user_id,
+            filters,
+            limit,
+            after,
+        )
+
+    async def get_page_by_car(
+            self,
+            car_id: int,
+            filters: ReservationFilter,
+            limit: int,
+            after: tuple[datetime, int] | None = None,
+    ) -> Iterable[Any]:
+        """The method getting a page of the car's reservations.
+
+        Args:
+            car_id (int): The id of the car.
+            filters (ReservationFilter): The status and start window.
+            limit (int): The maximum number of reservations to return.
+            after (tuple[datetime, int] | None): The start and id of the
+                last reservation of the previous page.
+
+        Returns:
+            Iterable[Any]: The reservations ordered by start.
+        """
+
+        return await _history_page(
+            reservation_table.c.car_id == car_id,
+            filters,
+            limit,
+            after,
+        )
+
+    async def add_reservation(
+            self,
+            data: ReservationBroker,
+            idempotency_key: str | None = None,
+    ) -> Any | None:
+        """The method booking a car in a single transaction.
+
+        The idempotency key is claimed first: a concurrent request with
+        the same key waits on the claim and then replays the outcome of
+        the first one. The car row is share-locked so it cannot change
+        price or disappear while it is being booked. A request booking
+        nothing releases its key, and a claim released while it is read
+        is taken over once more.
+
+        Args:
+            data (ReservationBroker): The attributes of the reservation.
+            idempotency_key (str | None): The client's key making retries
+                return the original reservation.
+
+        Raises:
+            ReservationConflictError: If the car is booked in the period.
+            IdempotencyKeyReusedError: If the key was used for another
+                request.
+            IdempotencyKeyExpiredError: If the reservation made with the
+                key was deleted.
+            IdempotencyKeyBusyError: If the claim of the key kept being
+                released while it was read.
+
+        Returns:
+            Any | None: The newly created reservation, None if the car
+                does not exist.
+        """
+
+        async with database.transaction():
+            if idempotency_key is not None:
+                request_hash = _request_hash(data)
+
+                for _ in range(_CLAIM_ATTEMPTS):
+                    claimed = await database.fetch_one(
+                        insert(idempotency_key_table)
+                        .values(
+                            user_id=data.user_id,
+                            key=idempotency_key,
+                            request_hash=request_hash,
+                        )
+                        .on_conflict_do_nothing()
+                        .returning(idempotency_key_table.c.key)
+                    )
+                    if claimed is not None:
+                        break
+
+                    # Each statement reads a fresh snapshot, so the
+                    # conflicting claim may be gone again by now.
+                    stored = await database.fetch_one(
+                        idempotency_key_table.select().where(
+                            idempotency_key_table.c.user_id == data.user_id,
+                            idempotency_key_table.c.key == idempotency_key,
+                        )
+                    )
+                    if stored is not None:
+                        return await self._replay(stored, request_hash)
+                else:
+                    raise IdempotencyKeyBusyError(idempotency_key)
+
+            reservation = await self._write(
+                reservation_table.insert().values(
+                    **data.model_dump(),
+                    next_transition_at=sqlalchemy.func.least(
+                        sqlalchemy.func.now() + self._hold,
+                        data.reservation_start,
+                    ),
+                ),
+                data,
+            )
+
+            if idempotency_key is not None:
+                claim = (
+                    idempotency_key_table.c.user_id == data.user_id,
+                    idempotency_key_table.c.key == idempotency_key,
+                )
+                # Nothing was booked, so the key stays free for a retry.
+                if reservation is None:
+                    await database.execute(
+                        idempotency_key_table.delete().where(*claim)
+                    )
+                else:
+                    await database.execute(
+                        idempotency_key_table.update()
+                        .where(*claim)
+                        .values(reservation_id=reservation.id)
+                    )
+
+        return reservation
+
+    async def update_reservation(
+        self,
+        reservation_id: int,
+        data: ReservationIn,
+    ) -> Any | None:
+        """The method rebooking a reservation in a single transaction.
+
+        The status is checked in the UPDATE itself, so a reservation paid
+        in the meantime keeps its car, period and price.
+
+        Args:
+            reservation_id (int): The reservation id.
+            data (ReservationIn): The attributes of the reservation.
+
+        Raises:
+            ReservationConflictError: If the car is booked in the period.
+            ReservationNotEditableError: If the reservation is no longer
+                pending.
+
+        Returns:
+            Any | None: The updated reservation, None if it or the car
+                does not exist.
+        """
+
+        async with database.transaction():
+            reservation = await self._write(
+                reservation_table.update()
+                .where(
+                    reservation_table.c.id == reservation_id,
+                    reservation_table.c.status
+                    == ReservationStatus.PENDING.value,
+                )
+                .values(
+                    **data.model_dump(),
+                    next_transition_at=sqlalchemy.func.least(
+                        reservation_table.c.created_at + self._hold,
+                        data.reservation_start,
+                    ),
+                ),
+                data,
+            )
+
+            if reservation is None:
+                await _ensure_status(reservation_id, _EDITABLE)
+
+        return reservation
+
+    async def delete_reservation(self, reservation_id: int) -> bool:
+        """The method removing reservation from the data storage.
+
+        Args:
+            reservation_id (int): The reservation id.
+
+        Raises:
+            ReservationNotEditableError: If the reservation is no longer
+                pending.
+
+        Returns:
+            bool: Success of the operation.
+        """
+
+        query = (
+            reservation_table.delete()
+            .where(
+                reservation_table.c.id == reservation_id,
+                reservation_table.c.status == ReservationStatus.PENDING.value,
+            )
+            .returning(reservation_table.c.id)
+        )
+
+        async with database.transaction():
+            if await database.fetch_one(query) is not None:
+                return True
+
+            await _ensure_status(reservation_id, _EDITABLE)
+
+        return False
+
+    async def cancel_reservation(self, reservation_id: int) -> Any | None:
+        """The method cancelling a reservation in a single transaction.
+
+        The row and its payment are kept. An authorized charge is voided
+        from the outbox, and the capture queued with the confirmation
+        skips it.
+
+        Args:
+            reservation_id (int): The reservation id.
+
+        Raises:
+            ReservationNotEditableError: If the reservation has started
+                or ended.
+
+        Returns:
+            Any | None: The cancelled reservation, None if it does not
+                exist.
+        """
+
+        cancelled = (
+            reservation_table.update()
+            .where(
+                reservation_table.c.id == reservation_id,
+                reservation_table.c.status.in_(_CANCELLABLE),
+            )
+            .values(
+                status=ReservationStatus.CANCELLED.value,
+                next_transition_at=None,
+            )
+            .returning(*reservation_table.c)
+            .cte("cancelled")
+        )
+
+        async with database.transaction():
+            reservation = await database.fetch_one(_hydrated(cancelled))
+
+            if reservation is None:
+                await _ensure_status(reservation_id, _CANCELLABLE)
+                return None
+
+            voided = None
+            if reservation.payment__status == PaymentStatus.AUTHORIZED.value:
+                voided = await database.fetch_one(
+                    payment_table.update()
+                    .where(
+                        payment_table.c.id == reservation.payment__id,
+                        payment_table.c.status
+                        == PaymentStatus.AUTHORIZED.value,
+                    )
+                    .values(status=PaymentStatus.VOIDED.value)
+                    .returning(*payment_table.c)
+                )
+
+            if voided:
+                await self._outbox.add_events([
+                    OutboxEventIn(
+                        topic=OutboxTopic.PAYMENT_VOID,
+                        payload={"payment_id": voided.id},
+                    ),
+                ])
+
+        reservation = ReservationDTO.from_record(reservation)
+        if voided:
+            reservation.payment = PaymentDTO.from_record(voided)
+
+        return reservation
+
+    async def advance_reservations(
+            self,
+            limit: int,
+    ) -> dict[ReservationStatus, int]:
+        """The method applying one batch of each due status transition.
+
+        Every transition is a single UPDATE of up to `limit` rows found
+        through `ix_reservations_next_transition_at`. Rows locked by
+        another scheduler are skipped, so several can run at once.
+
+        Args:
+            limit (int): The maximum number of rows per transition.
+
+        Returns:
+            dict[ReservationStatus, int]: The number of reservations
+                moved into each status.
+        """
+
+        moved = {}
+
+        for source, target, next_transition_at in _TRANSITIONS:
+            due = (
+                sqlalchemy.select(reservation_table.c.id)
+                .where(
+                    reservation_table.c.next_transition_at
+                    <= sqlalchemy.func.now(),
+                    reservation_table.c.status == source.value,
+                )
+                .order_by(reservation_table.c.next_transition_at)
+                .limit(limit)
+                .with_for_update(skip_locked=True)
+            )
+            query = (
+                reservation_table.update()
+                .where(reservation_table.c.id.in_(due.scalar_subquery()))
+                .values(
+                    status=target.value,
+                    next_transition_at=next_transition_at,
+                )
+                .returning(
+                    reservation_table.c.id,
+                    reservation_table.c.user_id,
+                    reservation_table.c.car_id,
+                )
+            )
+
+            async with database.transaction():
+                reservations = await database.fetch_all(query)
+
+                if target == ReservationStatus.COMPLETED:
+                    await self._outbox.add_events(
+                        OutboxEventIn(
+                            topic=OutboxTopic.REVIEW_INVITATION,
+                            payload={
+                                "reservation_id": reservation.id,
+                                "user_id": str(reservation.user_id),
+                                "car_id": reservation.car_id,
+                            },
+                        )
+                        for reservation in reservations
+                    )
+
+            moved[target] = len(reservations)
+
+        return moved
+
+    async def get_transition_lag(self) -> float:
+        """The method measuring how late the oldest due transition is.
+
+        Returns:
+            float: The delay in seconds, 0 if nothing is overdue.
+        """
+
+        lag = await database.fetch_val(
+            sqlalchemy.select(
+                sqlalchemy.func.extract(
+                    "epoch",
+                    sqlalchemy.func.now()
+                    - sqlalchemy.func.min(
+                        reservation_table.c.next_transition_at,
+                    ),
+                ),
+            )
+            .where(reservation_table.c.next_transition_at.is_not(None))
+        )
+
+        return max(0.0, float(lag or 0))
+
+    async def _write(
+            self,
+            statement: Any,
+            data: ReservationIn,
+    ) -> ReservationDTO | None:
+        """The method pricing and writing a reservation of a locked car.
+
+        Must run inside a transaction.
+
+        Args:
+            statement (Any): The INSERT or UPDATE of the reservation.
+            data (ReservationIn): The booked car and period.
+
+        Raises:
+            ReservationConflictError: If the car is booked in the period.
+
+        Returns:
+            ReservationDTO | None: The written reservation, None if no row
+                or no car matched.
+        """
+
+        car = await database.fetch_one(
+            sqlalchemy.select(car_table.c.price_per_day)
+            .where(car_table.c.id == data.car_id)
+            .with_for_update(read=True)
+        )
+        if car is None:
+            return None
+
+        total_price = self._pricing.total_price(
+            car.price_per_day,
+            data.reservation_start,
+            data.reservation_end,
+        )
+
+        written = (
+            statement
+            .values(total_price=total_price)
+            .returning(*reservation_table.c)
+            .cte("written")
+        )
+
+        try:
+            reservation = await database.fetch_one(_hydrated(written))
+        except ExclusionViolationError as e:
+            raise ReservationConflictError(data.car_id) from e
+
+        return ReservationDTO.from_record(reservation) if reservation else None
+
+    async def _replay(
+            self,
+            stored: Any,
+            request_hash: str,
+    ) -> ReservationDTO | None:
+        """The method returning the outcome of an already used key.
+
+        Args:
+            stored (Any): The claim of the key.
+            request_hash (str): The fingerprint of the current request.
+
+        Raises:
+            IdempotencyKeyReusedError: If the key was used for another
+                request.
+            IdempotencyKeyExpiredError: If the reservation made with the
+                key was deleted.
+
+        Returns:
+            ReservationDTO | None: The original reservation.
+        """
+
+        if stored.request_hash != request_hash:
+            raise IdempotencyKeyReusedError(stored.key)
+
+        # A claim outlives its reservation with the reference cleared.
+        reservation = (
+            await self.get_by_id(stored.reservation_id)
+            if stored.reservation_id is not None
+            else None
+        )
+        if reservation is None:
+            raise IdempotencyKeyExpiredError(stored.key)
+
+        return reservation
+
+
+async def _ensure_status(
+        reservation_id: int,
+        allowed: tuple[str, ...],
+) -> None:
+    """A function telling a missing reservation from a settled one.
+
+    Args:
+        reservation_id (int): The id of the reservation.
+        allowed (tuple[str, ...]): The statuses allowing the change.
+
+    Raises:
+        ReservationNotEditableError: If the reservation exists in another
+            status.
+    """
+
+    status = await database.fetch_val(
+        sqlalchemy.select(reservation_table.c.status)
+        .where(reservation_table.c.id == reservation_id)
+    )
+
+    if status is not None and status not in allowed:
+        raise ReservationNotEditableError(reservation_id)
+
+
+async def _history_page(
+        owner: Any,
+        filters: ReservationFilter,
+        limit: int,
+        after: tuple[datetime, int] | None,
+) -> list[ReservationDTO]:
+    """A function reading one page of a user's or a car's history.
+
+    The page is chosen by a keyset scan of the owner's
+    `(reservation_start, id)` index, which also carries the status, so
+    only the rows on the page are read from the table and joined with
+    their relations. The cost follows the page size, not the history.
+
+    Args:
+        owner (Any): The condition selecting the user or the car.
+        filters (ReservationFilter): The status and start window.
+        limit (int): The maximum number of reservations to return.
+        after (tuple[datetime, int] | None): The start and id of the
+            last reservation of the previous page.
+
+    Returns:
+        list[ReservationDTO]: The reservations ordered by start.
+    """
+
+    columns = reservation_table.c
+    conditions = [owner]
+
+    if filters.status is not None:
+        conditions.append(columns.status == filters.status.value)
+    if filters.start_from is not None:
+        conditions.append(columns.reservation_start >= filters.start_from)
+    if filters.start_to is not None:
+        conditions.append(columns.reservation_start < filters.start_to)
+    if after is not None:
+        conditions.append(
+            sqlalchemy.tuple_(columns.reservation_start, columns.id)
+            > sqlalchemy.tuple_(*after)
+        )
+
+    page = (
+        sqlalchemy.select(columns.id)
+        .where(*conditions)
+        .order_by(columns.reservation_start, columns.id)
+        .limit(limit)
+    )
+    query = (
+        _hydrated(reservation_table)
+        .where(columns.id.in_(page.scalar_subquery()))
+        .order_by(columns.reservation_start, columns.id)
+    )
+    reservations = await database.fetch_all(query)
+
+    return ReservationDTO.from_records(reservations)
+
+
+def _hydrated(reservations: Any) -> sqlalchemy.Select:
+    """A function selecting reservations joined with their relations.
+
+    The car, the user and the payment come from the same row, so reading
+    any number of reservations is a single query.
+
+    Args:
+        reservations (Any): The reservations table, or a CTE returning
+            its rows.
+
+    Returns:
+        sqlalchemy.Select: The query with relation columns labelled
+            `<relation>__<column>`.
+    """
+
+    return (
+        sqlalchemy.select(
+            *(
+                reservations.c[column.name]
+                for column in reservation_table.c
+                if column.name in _RESERVATION_COLUMNS
+            ),
+            *_labelled("car", car_table.c),
+            *_labelled("user", (user_table.c.id, user_table.c.email)),
+            *_labelled("payment", payment_table.c),
+        )
+        .select_from(
+            reservations
+            .join(car_table, car_table.c.id == reservations.c.car_id)
+            .join(user_table, user_table.c.id == reservations.c.user_id)
+            .outerjoin(
+                payment_table,
+                payment_table.c.id == reservations.c.payment_id,
+            )
+        )
+    )
+
+
+def _labelled(relation: str, columns: Iterable[Any]) -> list[Any]:
+    """A function labelling columns of a joined relation.
+
+    Args:
+        relation (str): The name of the nested DTO field.
+        columns (Iterable[Any]): The columns of the relation.
+
+    Returns:
+        list[Any]: The labelled columns.
+    """
+
+    return [
+        column.label(f"{relation}{RELATION_SEPARATOR}{column.name}")
+        for column in columns
+    ]
+
+
+def _request_hash(data: ReservationBroker) -> str:
+    """A function fingerprinting a reservation request.
+
+    Args:
+        data (ReservationBroker): The attributes of the reservation.
+
+    Returns:
+        str: The hex SHA-256 of the canonical request.
+    """
+
+    return hashlib.sha256(data.model_dump_json().encode()).hexdigest()
@@ -0,0 +1,256 @@
+"""Module containing review repository implementation."""
+
+from typing import Any, Iterable
+
+import sqlalchemy
+from asyncpg.exceptions import UniqueViolationError  # type: ignore
+from pydantic import UUID4
+from sqlalchemy.dialects.postgresql import insert
+
+from src.core.domain.reservation import ReservationStatus
+from src.core.domain.review import ReviewBroker, ReviewExistsError, ReviewUpdate
+from src.core.repositories.ireview import IReviewRepository
+from src.db import (
+    car_review_stats_table,
+    database,
+    reservation_table,
+    review_table,
+)
+from src.infrastructure.dto.reviewdto import ReviewDTO
+
+
+class ReviewRepository(IReviewRepository):
+    """A class representing review DB repository.
+
+    Every write adjusts the `car_review_stats` row of the car in the same
+    transaction, so the count, sum and histogram of ratings always match
+    the reviews without aggregating them on read.
+    """
+
+    async def get_reviews(self) -> Iterable[Any]:
+        """The method getting all reviews from the data storage.
+
+        Returns:
+            Iterable[Any]: Reviews in the data storage.
+        """
+
+        query = review_table.select().order_by(review_table.c.id)
+        reviews = await database.fetch_all(query)
+
+        return [ReviewDTO.from_record(row) for row in reviews]
+
+    async def get_by_id(self, review_id: int) -> Any | None:
+        """The method getting review provided by id.
+
+        Args:
+            review_id (int): The id of the review.
+
+        Returns:
+            Any | None: The review details.
+        """
+
+        query = review_table.select().where(review_table.c.id == review_id)
+        review = await database.fetch_one(query)
+
+        return ReviewDTO.from_record(review) if review else None
+
+    async def get_review_by_car(self, car_id: int) -> Iterable[Any]:
+        """The method getting reviews assigned to particular car.
+
+        Args:
+            car_id (int): The id of the car.
+
+        Returns:
+            Iterable[Any]: Reviews assigned to a car, newest first.
+        """
+
+        query = (
+            review_table.select()
+            .where(review_table.c.car_id == car_id)
+            .order_by(review_table.c.id.desc())
+        )
+        reviews = await database.fetch_all(query)
+
+        return [ReviewDTO.from_record(row) for row in reviews]
+
+    async def get_review_by_user(self, user_id: UUID4) -> Iterable[Any]:
+        """The method getting reviews assigned to particular user.
+
+        Args:
+            user_id (UUID4): The id of the user.
+
+        Returns:
+            Iterable[Any]: Reviews assigned to a user, newest first.
+        """
+
+        query = (
+            review_table.select()
+            .where(review_table.c.user_id == user_id)
+            .order_by(review_table.c.id.desc())
+        )
+        reviews = await database.fetch_all(query)
+
+        return [ReviewDTO.from_record(row) for row in reviews]
+
+    async def add_review(self, data: ReviewBroker) -> Any | None:
+        """The method adding a review of the user's own reservation.
+
+        The review is inserted from the matching reservation row, so the
+        ownership check and the write are a single statement.
+
+        Args:
+            data (ReviewBroker): The details of the new review.
+
+        Raises:
+            ReviewExistsError: If the reservation is already reviewed.
+
+        Returns:
+            Any | None: The newly added review, None if the user has no
+                such reservation of the car.
+        """
+
+        reservation = (
+            sqlalchemy.select(
+                reservation_table.c.user_id,
+                reservation_table.c.car_id,
+                reservation_table.c.id,
+                sqlalchemy.literal(data.body, sqlalchemy.String),
+                sqlalchemy.literal(data.rating, sqlalchemy.SmallInteger),
+            )
+            .where(
+                reservation_table.c.id == data.reservation_id,
+                reservation_table.c.user_id == data.user_id,
+                reservation_table.c.car_id == data.car_id,
+                reservation_table.c.status
+                != ReservationStatus.CANCELLED.value,
+            )
+        )
+        query = (
+            review_table.insert()
+            .from_select(
+                ["user_id", "car_id", "reservation_id", "body", "rating"],
+                reservation,
+            )
+            .returning(*review_table.c)
+        )
+
+        async with database.transaction():
+            try:
+                review = await database.fetch_one(query)
+            except UniqueViolationError as e:
+                raise ReviewExistsError(data.reservation_id) from e
+
+            if review is None:
+                return None
+
+            await _adjust_stats(review.car_id, added=review.rating)
+
+        return ReviewDTO.from_record(review)
+
+    async def update_review(
+            self,
+            review_id: int,
+            data: ReviewUpdate,
+    ) -> Any | None:
+        """The method updating review data in the data storage.
+
+        The review row is locked first, so the rating moved between the
+        histogram buckets is the one being replaced.
+
+        Args:
+            review_id (int): The id of the review.
+            data (ReviewUpdate): The details of the updated review.
+
+        Returns:
+            Any | None: The updated review details.
+        """
+
+        async with database.transaction():
+            current = await database.fetch_one(
+                sqlalchemy.select(review_table.c.rating)
+                .where(review_table.c.id == review_id)
+                .with_for_update()
+            )
+            if current is None:
+                return None
+
+            review = await database.fetch_one(
+                review_table.update()
+                .where(review_table.c.id == review_id)
+                .values(**data.model_dump())
+                .returning(*review_table.c)
+            )
+
+            await _adjust_stats(
+                review.car_id,
+                added=review.rating,
+                removed=current.rating,
+            )
+
+        return ReviewDTO.from_record(review)
+
+    async def delete_review(self, review_id: int) -> bool:
+        """The method removing review from the data storage.
+
+        Args:
+            review_id (int): The id of the review.
+
+        Returns:
+            bool: Success of the operation.
+        """
+
+        async with database.transaction():
+            review = await database.fetch_one(
+                review_table.delete()
+                .where(review_table.c.id == review_id)
+                .returning(review_table.c.car_id, review_table.c.rating)
+            )
+            if review is None:
+                return False
+
+            await _adjust_stats(review.car_id, removed=review.rating)
+
+        return True
+
+
+async def _adjust_stats(
+        car_id: int,
+        added: int | None = None,
+        removed: int | None = None,
+) -> None:
+    """A function applying a rating change to the car's aggregate.
+
+    The counters are incremented in place by a single upsert, so
+    concurrent writes only serialize on the one aggregate row. Must run
+    inside the transaction writing the review.
+
+    Args:
+        car_id (int): The id of the reviewed car.
+        added (int | None): The rating that was added.
+        removed (int | None): The rating that was removed.
+    """
+
+    if added == removed:
+        return
+
+    deltas = {"review_count": 0, "rating_sum": 0}
+
+    for rating, sign in ((added, 1), (removed, -1)):
+        if rating is None:
+            continue
+        deltas["review_count"] += sign
+        deltas["rating_sum"] += sign * rating
+        deltas[f"rating_{rating}"] = deltas.get(f"rating_{rating}", 0) + sign
+
+    statement = insert(car_review_stats_table).values(car_id=car_id, **deltas)
+
+    await database.execute(
+        statement.on_conflict_do_update(
+            index_elements=[car_review_stats_table.c.car_id],
+            set_={
+                column: car_review_stats_table.c[column]
+                + statement.excluded[column]
+                for column in deltas
+            },
+        )
+    )
@@ -5,7 +5,7 @@ from typing import Any
 
 from pydantic import UUID5
 
-from src.infrastructure.utils.password import hash_password
+from src.infrastructure.utils.password import hash_password_async
 from src.core.domain.user import UserIn
 from src.core.repositories.iuser import IUserRepository
 from src.db import database, user_table
@@ -27,12 +27,15 @@ class UserRepository(IUserRepository):
         if await self.get_by_email(user.email):
             return None
 
-        user.password = hash_password(user.password)
+        password = await hash_password_async(user.user_password)
 
-        query = user_table.insert().values(**user.model_dump())
-        new_user_uuid = await database.execute(query)
+        query = (
+            user_table.insert()
+            .values(email=user.email, password=password)
+            .returning(*user_table.c)
+        )
 
-        return await self.get_by_uuid(new_user_uuid)
+        return await database.fetch_one(query)
 
     async def get_by_uuid(self, uuid: UUID5) -> Any | None:
         """A method getting user by UUID.
@@ -1,35 +1,98 @@
 """Module containing car service implementation."""
 
-from typing import Iterable
-
-from src.core.domain.car import Car, CarIn
+import pickle
+import tempfile
+from datetime import datetime
+from typing import IO, AsyncIterator, Callable, Collection, Iterable
+
+from pydantic import ValidationError
+
+from src.core.domain.car import (
+    Car,
+    CarIn,
+    CarSearch,
+    CarSortField,
+    CarVersionConflictError,
+    ImportMode,
+)
+from src.core.domain.pricing import Quote
 from src.core.repositories.icar import ICarRepository
-from src.infrastructure.dto.cardto import CarDTO
+from src.infrastructure.cache.icache import ICache
+from src.infrastructure.dto.cardto import (
+    CarDTO,
+    CarImportErrorDTO,
+    CarImportReportDTO,
+)
+from src.infrastructure.dto.pagedto import PageDTO
 from src.infrastructure.services.icar import ICarService
+from src.infrastructure.utils import consts
+from src.infrastructure.utils.bulk import ParsedRow
+from src.infrastructure.utils.cursor import decode_cursor, encode_cursor
+from src.infrastructure.utils.pricing import PricingEngine
 
 
 class CarService(ICarService):
     """A class implementing the car service."""
 
     _repository: ICarRepository
+    _cache: ICache
+    _pricing: PricingEngine
 
-    def __init__(self, repository: ICarRepository):
+    def __init__(
+            self,
+            repository: ICarRepository,
+            cache: ICache,
+            pricing: PricingEngine,
+    ):
         """The initializer of the `car service`.
 
         Args:
             repository (ICarRepository): The reference to the repository.
+            cache (ICache): The reference to the car cache.
+            pricing (PricingEngine): The engine pricing the rentals.
         """
 
         self._repository = repository
+        self._cache = cache
+        self._pricing = pricing
+
+    async def get_cars(
+            self,
+            limit: int,
+            cursor: str | None = None,
+            with_ratings: bool = False,
+    ) -> PageDTO[CarDTO]:
+        """The method getting a page of cars from the repository.
+
+        Args:
+            limit (int): The maximum number of cars on the page.
+            cursor (str | None): The opaque cursor of the previous page.
+            with_ratings (bool): Whether to include the review aggregate.
 
-    async def get_cars(self) -> Iterable[CarDTO]:
-        """The method getting all cars from the repository.
+        Raises:
+            ValueError: If the cursor is malformed.
 
         Returns:
-            Iterable[CarDTO]: All cars.
+            PageDTO[CarDTO]: The page of cars with the next cursor.
+        """
+
+        cars = await self._repository.get_all_cars(
+            limit=limit + 1,
+            after_id=_decode_after_id(cursor),
+            with_ratings=with_ratings,
+        )
+
+        return _paginate(cars, limit, lambda car: {"id": car.id})
+
+    async def stream_cars(self) -> AsyncIterator[CarDTO]:
+        """The method iterating over all cars without loading them at once.
+
+        Yields:
+            CarDTO: All cars.
         """
 
-        return await self._repository.get_all_cars()
+        async for car in self._repository.iterate_cars():
+            yield car
 
     async def get_car_by_id(self, car_id: int) -> CarDTO | None:
         """The method getting car provided by id.
@@ -41,7 +104,10 @@ class CarService(ICarService):
             CarDTO | None: The car details.
         """
 
-        return await self._repository.get_car_by_id(car_id)
+        return await self._cache.get_or_load(
+            _cache_key(car_id),
+            lambda: self._repository.get_car_by_id(car_id),
+        )
 
     async def get_car_by_brand(self, name: str) -> Iterable[Car]:
         """The method getting cars provided by brand.
@@ -67,6 +133,106 @@ class CarService(ICarService):
 
         return await self._repository.get_car_by_model(name)
 
+    async def search_cars(
+            self,
+            filters: CarSearch,
+            limit: int,
+            cursor: str | None = None,
+    ) -> PageDTO[CarDTO]:
+        """The method searching cars matching all provided filters.
+
+        Args:
+            filters (CarSearch): The search filters and sorting.
+            limit (int): The maximum number of cars on the page.
+            cursor (str | None): The opaque cursor of the previous page.
+
+        Raises:
+            ValueError: If the cursor is malformed.
+
+        Returns:
+            PageDTO[CarDTO]: The page of cars with the next cursor.
+        """
+
+        sort_by = filters.sort_by.value
+        after = None
+
+        if cursor:
+            values = decode_cursor(cursor)
+            after = (values.get("v"), values.get("id"))
+            if not isinstance(after[1], int) or not isinstance(
+                after[0], _SORT_TYPES[filters.sort_by],
+            ):
+                raise ValueError("invalid cursor")
+
+        cars = await self._repository.search_cars(
+            filters=filters,
+            limit=limit + 1,
+            after=after,
+        )
+
+        return _paginate(
+            cars,
+            limit,
+            lambda car: {"v": getattr(car, sort_by), "id": car.id},
+        )
+
+    async def get_available_cars(
+            self,
+            start: datetime,
+            end: datetime,
+            limit: int,
+            cursor: str | None = None,
+    ) -> PageDTO[CarDTO]:
+        """The method getting cars free for the whole period.
+
+        Args:
+            start (datetime): The start of the period.
+            end (datetime): The end of the period.
+            limit (int): The maximum number of cars on the page.
+            cursor (str | None): The opaque cursor of the previous page.
+
+        Raises:
+            ValueError: If the cursor is malformed.
+
+        Returns:
+            PageDTO[CarDTO]: The page of free cars with the next cursor.
+        """
+
+        cars = await self._repository.get_available_cars(
+            start=start,
+            end=end,
+            limit=limit + 1,
+            after_id=_decode_after_id(cursor),
+        )
+
+        return _paginate(cars, limit, lambda car: {"id": car.id})
+
+    async def quote_cars(
+            self,
+            car_ids: Iterable[int],
+            start: datetime,
+            end: datetime,
+    ) -> list[Quote]:
+        """The method pricing a rental of each of the cars.
+
+        The daily rates are read in one query and priced in memory.
+
+        Args:
+            car_ids (Iterable[int]): The ids of the cars.
+            start (datetime): The start of the rental.
+            end (datetime): The end of the rental.
+
+        Returns:
+            list[Quote]: The quotes of the existing cars.
+        """
+
+        prices = await self._repository.get_prices(car_ids)
+
+        return [
+            self._pricing.quote(price, start, end, car_id=car_id)
+            for car_id, price in sorted(prices.items())
+        ]
+
     async def add_car(self, data: Car) -> None:
         """The abstract adding new car to the data storage.
 
@@ -77,27 +243,137 @@ class CarService(ICarService):
             Any | None: The newly added car.
         """
 
-        return await self._repository.add_car(data)
+        new_car = await self._repository.add_car(data)
+
+        if new_car:
+            await self._cache.invalidate(_cache_key(new_car.id))
+
+        return new_car
+
+    async def import_cars(
+            self,
+            rows: AsyncIterator[ParsedRow],
+            mode: ImportMode,
+    ) -> CarImportReportDTO:
+        """The method validating and bulk loading uploaded cars.
+
+        Rows are validated against `CarIn` while the upload streams in,
+        and valid ones are spooled locally. The repository gets the
+        batches only once the whole upload has arrived, so no database
+        connection waits on a slow client.
+
+        Args:
+            rows (AsyncIterator[ParsedRow]): The parsed upload rows.
+            mode (ImportMode): Whether existing registrations are updated.
+
+        Raises:
+            CarRegistrationNotUniqueError: If the data storage does not
+                enforce unique registration numbers.
+
+        Returns:
+            CarImportReportDTO: The counts and per-row errors.
+        """
+
+        errors: list[CarImportErrorDTO] = []
+        rejected = 0
+
+        async def batches() -> AsyncIterator[list[CarIn]]:
+            nonlocal rejected
+            batch: list[CarIn] = []
+
+            async for row in rows:
+                error = row.error
+                if error is None:
+                    try:
+                        batch.append(CarIn.model_validate(row.data))
+                    except ValidationError as e:
+                        error = "; ".join(
+                            f"{'.'.join(map(str, detail['loc']))}: "
+                            f"{detail['msg']}"
+                            for detail in e.errors()
+                        )
+
+                if error is not None:
+                    rejected += 1
+                    if len(errors) < consts.MAX_IMPORT_ERRORS:
+                        errors.append(
+                            CarImportErrorDTO(line=row.line, error=error),
+                        )
+
+                if len(batch) >= consts.IMPORT_BATCH_SIZE:
+                    yield batch
+                    batch = []
+
+            if batch:
+                yield batch
+
+        with tempfile.SpooledTemporaryFile(
+            max_size=consts.IMPORT_SPOOL_BYTES,
+        ) as spool:
+            async for batch in batches():
+                pickle.dump(batch, spool)
+
+            spool.seek(0)
+            received, imported = await self._repository.import_cars(
+                _unspool(spool),
+                mode,
+            )
+
+        if mode == ImportMode.UPSERT:
+            await self._cache.invalidate_all()
+
+        return CarImportReportDTO(
+            received=received + rejected,
+            imported=imported,
+            skipped=received - imported,
+            rejected=rejected,
+            errors=errors,
+        )
+
+    async def export_cars(self) -> AsyncIterator[bytes]:
+        """The method streaming all cars as CSV.
+
+        Yields:
+            bytes: The CSV chunks.
+        """
+
+        async for chunk in self._repository.export_cars():
+            yield chunk
 
     async def update_car(
             self,
             car_id: int,
-            data: CarIn
+            data: CarIn,
+            versions: Collection[int] | None = None,
     ) -> Car | None:
         """The method updating car data in the data storage.
 
         Args:
             car_id (int): The id of the car.
             data (CarIn): The details of the updated car.
+            versions (Collection[int] | None): The versions the car must
+                currently have, any if None.
+
+        Raises:
+            CarVersionConflictError: If the car has another version.
 
         Returns:
-            Car | None: The updated car details.
+            Car | None: The updated car details, None if it does not exist.
         """
 
-        return await self._repository.update_car(
+        updated_car = await self._repository.update_car(
             car_id=car_id,
-            data=data
+            data=data,
+            versions=versions,
         )
+        if updated_car:
+            await self._cache.invalidate(_cache_key(car_id))
+        elif versions is not None and await self._repository.get_car_by_id(
+            car_id,
+        ):
+            raise CarVersionConflictError(car_id)
+
+        return updated_car
 
     async def delete_car(self, car_id: int) -> bool:
         """The method updating removing car from the data storage.
@@ -109,4 +385,94 @@ class CarService(ICarService):
             bool: Success of the operation.
         """
 
-        return await self._repository.delete_car(car_id)
+        deleted = await self._repository.delete_car(car_id)
+        if deleted:
+            await self._cache.invalidate(_cache_key(car_id))
+
+        return deleted
+
+
+_SORT_TYPES = {
+    CarSortField.ID: int,
+    CarSortField.PRICE_PER_DAY: (int, float),
+    CarSortField.YEAR: str,
+}
+
+
+async def _unspool(spool: IO[bytes]) -> AsyncIterator[list[CarIn]]:
+    """A function reading back the batches of a spooled upload.
+
+    Args:
+        spool (IO[bytes]): The file with the pickled batches.
+
+    Yields:
+        list[CarIn]: The validated cars.
+    """
+
+    while True:
+        try:
+            yield pickle.load(spool)
+        except EOFError:
+            return
+
+
+def _decode_after_id(cursor: str | None) -> int | None:
+    """A function reading the last seen car id from the cursor.
+
+    Args:
+        cursor (str | None): The opaque cursor of the previous page.
+
+    Raises:
+        ValueError: If the cursor is malformed.
+
+    Returns:
+        int | None: The id after which the page starts.
+    """
+
+    if not cursor:
+        return None
+
+    after_id = decode_cursor(cursor).get("id")
+    if not isinstance(after_id, int):
+        raise ValueError("invalid cursor")
+
+    return after_id
+
+
+def _paginate(
+        cars: Iterable[CarDTO],
+        limit: int,
+        cursor_values: Callable[[CarDTO], dict],
+) -> PageDTO[CarDTO]:
+    """A function cutting an over-fetched result into a page.
+
+    Args:
+        cars (Iterable[CarDTO]): Up to `limit + 1` cars.
+        limit (int): The size of the page.
+        cursor_values (Callable[[CarDTO], dict]): The keyset of a car.
+
+    Returns:
+        PageDTO[CarDTO]: The page with the cursor of its last car.
+    """
+
+    cars = list(cars)
+    next_cursor = None
+
+    if len(cars) > limit:
+        cars = cars[:limit]
+        next_cursor = encode_cursor(cursor_values(cars[-1]))
+
+    return PageDTO[CarDTO](items=cars, next_cursor=next_cursor)
+
+
+def _cache_key(car_id: int) -> str:
+    """A function building the cache key of the car.
+
+    Args:
+        car_id (int): The id of the car.
+
+    Returns:
+        str: The cache key.
+    """
+
+    return f"car:{car_id}"
@@ -1,21 +1,46 @@
 """Module containing car service abstractions."""
 
 from abc import ABC, abstractmethod
-from typing import Iterable
+from datetime import datetime
+from typing import AsyncIterator, Collection, Iterable
 
-from src.core.domain.car import Car, CarIn
-from src.infrastructure.dto.cardto import CarDTO
+from src.core.domain.car import Car, CarIn, CarSearch, ImportMode
+from src.core.domain.pricing import Quote
+from src.infrastructure.dto.cardto import CarDTO, CarImportReportDTO
+from src.infrastructure.dto.pagedto import PageDTO
+from src.infrastructure.utils.bulk import ParsedRow
 
 
 class ICarService(ABC):
     """A class representing a car repository."""
 
     @abstractmethod
-    async def get_cars(self) -> Iterable[CarDTO]:
-        """The method getting all cars from the repository.
+    async def get_cars(
+            self,
+            limit: int,
+            cursor: str | None = None,
+            with_ratings: bool = False,
+    ) -> PageDTO[CarDTO]:
+        """The method getting a page of cars from the repository.
+
+        Args:
+            limit (int): The maximum number of cars on the page.
+            cursor (str | None): The opaque cursor of the previous page.
+            with_ratings (bool): Whether to include the review aggregate.
+
+        Raises:
+            ValueError: If the cursor is malformed.
 
         Returns:
-            Iterable[CarDTO]: All cars.
+            PageDTO[CarDTO]: The page of cars with the next cursor.
+        """
+
+    @abstractmethod
+    def stream_cars(self) -> AsyncIterator[CarDTO]:
+        """The method iterating over all cars without loading them at once.
+
+        Returns:
+            AsyncIterator[CarDTO]: All cars.
         """
 
     @abstractmethod
@@ -50,6 +75,68 @@ class ICarService(ABC):
             Iterable[CarDTO]: The cars details.
         """
 
+    @abstractmethod
+    async def search_cars(
+            self,
+            filters: CarSearch,
+            limit: int,
+            cursor: str | None = None,
+    ) -> PageDTO[CarDTO]:
+        """The method searching cars matching all provided filters.
+
+        Args:
+            filters (CarSearch): The search filters and sorting.
+            limit (int): The maximum number of cars on the page.
+            cursor (str | None): The opaque cursor of the previous page.
+
+        Raises:
+            ValueError: If the cursor is malformed.
+
+        Returns:
+            PageDTO[CarDTO]: The page of cars with the next cursor.
+        """
+
+    @abstractmethod
+    async def get_available_cars(
+            self,
+            start: datetime,
+            end: datetime,
+            limit: int,
+            cursor: str | None = None,
+    ) -> PageDTO[CarDTO]:
+        """The method getting cars free for the whole period.
+
+        Args:
+            start (datetime): The start of the period.
+            end (datetime): The end of the period.
+            limit (int): The maximum number of cars on the page.
+            cursor (str | None): The opaque cursor of the previous page.
+
+        Raises:
+            ValueError: If the cursor is malformed.
+
+        Returns:
+            PageDTO[CarDTO]: The page of free cars with the next cursor.
+        """
+
+    @abstractmethod
+    async def quote_cars(
+            self,
+            car_ids: Iterable[int],
+            start: datetime,
+            end: datetime,
+    ) -> list[Quote]:
+        """The method pricing a rental of each of the cars.
+
+        Args:
+            car_ids (Iterable[int]): The ids of the cars.
+            start (datetime): The start of the rental.
+            end (datetime): The end of the rental.
+
+        Returns:
+            list[Quote]: The quotes of the existing cars.
+        """
+
     @abstractmethod
     async def add_car(self, data: CarIn) -> Car | None:
         """The method adding new car to the data storage.
@@ -61,20 +148,54 @@ class ICarService(ABC):
             Car | None: Full details of the newly added car.
         """
 
+    @abstractmethod
+    async def import_cars(
+            self,
+            rows: AsyncIterator[ParsedRow],
+            mode: ImportMode,
+    ) -> CarImportReportDTO:
+        """The method validating and bulk loading uploaded cars.
+
+        Args:
+            rows (AsyncIterator[ParsedRow]): The parsed upload rows.
+            mode (ImportMode): Whether existing registrations are updated.
+
+        Raises:
+            CarRegistrationNotUniqueError: If the data storage does not
+                enforce unique registration numbers.
+
+        Returns:
+            CarImportReportDTO: The counts and per-row errors.
+        """
+
+    @abstractmethod
+    def export_cars(self) -> AsyncIterator[bytes]:
+        """The method streaming all cars as CSV.
+
+        Returns:
+            AsyncIterator[bytes]: The CSV chunks.
+        """
+
     @abstractmethod
     async def update_car(
             self,
             car_id: int,
-            data: CarIn
+            data: CarIn,
+            versions: Collection[int] | None = None,
     ) -> Car | None:
         """The method updating car data in the data storage.
 
         Args:
             car_id (int): The id of the car.
             data (CarIn): The details of the updated car.
+            versions (Collection[int] | None): The versions the car must
+                currently have, any if None.
+
+        Raises:
+            CarVersionConflictError: If the car has another version.
 
         Returns:
-            Car | None: The updated car details.
+            Car | None: The updated car details, None if it does not exist.
         """
 
     @abstractmethod
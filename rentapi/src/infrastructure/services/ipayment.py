@@ -0,0 +1,122 @@
+"""Module containing payment service abstractions."""
+
+from abc import ABC, abstractmethod
+from typing import Any
+
+from src.infrastructure.dto.paymentdto import PaymentDTO
+from src.infrastructure.dto.reservationdto import ReservationDTO
+
+
+class IPaymentService(ABC):
+    """A class representing payment service."""
+
+    @abstractmethod
+    async def get_by_id(self, payment_id: int) -> PaymentDTO | None:
+        """The method getting payment assigned to particular id.
+
+        Args:
+            payment_id (int): The id of the payment.
+
+        Returns:
+            PaymentDTO | None: Payment assigned to an id.
+        """
+
+    @abstractmethod
+    async def pay_reservation(
+            self,
+            reservation: ReservationDTO,
+            payment_method: str,
+    ) -> PaymentDTO:
+        """The method charging the price of the reservation.
+
+        The payment is authorized and the reservation confirmed, while
+        the capture is dispatched from the outbox.
+
+        Args:
+            reservation (ReservationDTO): The reservation to pay for.
+            payment_method (str): The payment method token.
+
+        Raises:
+            ReservationNotPayableError: If the reservation does not await
+                a payment, also if it stopped awaiting it while paying.
+            PaymentDeclinedError: If the payment method was declined.
+            PaymentGatewayError: If the gateway rejected the call.
+
+        Returns:
+            PaymentDTO: The payment.
+        """
+
+    @abstractmethod
+    async def capture_payment(self, payment_id: int) -> PaymentDTO | None:
+        """The method collecting an authorized payment.
+
+        Args:
+            payment_id (int): The id of the payment.
+
+        Raises:
+            PaymentGatewayError: If the gateway rejected the call.
+
+        Returns:
+            PaymentDTO | None: The payment, None if it does not exist.
+        """
+
+    @abstractmethod
+    async def handle_capture(self, payload: dict[str, Any]) -> None:
+        """The method capturing the payment of an outbox event.
+
+        Args:
+            payload (dict[str, Any]): The id of the payment.
+
+        Raises:
+            PaymentGatewayError: If the gateway rejected the call.
+        """
+
+    @abstractmethod
+    async def void_payment(self, payment_id: int) -> PaymentDTO | None:
+        """The method releasing the charge of a voided payment.
+
+        Args:
+            payment_id (int): The id of the payment.
+
+        Raises:
+            PaymentGatewayError: If the gateway rejected the call.
+
+        Returns:
+            PaymentDTO | None: The payment, None if it does not exist.
+        """
+
+    @abstractmethod
+    async def handle_void(self, payload: dict[str, Any]) -> None:
+        """The method voiding the payment of an outbox event.
+
+        Args:
+            payload (dict[str, Any]): The id of the payment.
+
+        Raises:
+            PaymentGatewayError: If the gateway rejected the call.
+        """
+
+    @abstractmethod
+    async def refund_payment(self, payment_id: int) -> PaymentDTO | None:
+        """The method returning the charge of a refunded payment.
+
+        Args:
+            payment_id (int): The id of the payment.
+
+        Raises:
+            PaymentGatewayError: If the gateway rejected the call.
+
+        Returns:
+            PaymentDTO | None: The payment, None if it does not exist.
+        """
+
+    @abstractmethod
+    async def handle_refund(self, payload: dict[str, Any]) -> None:
+        """The method refunding the payment of an outbox event.
+
+        Args:
+            payload (dict[str, Any]): The id of the payment.
+
+        Raises:
+            PaymentGatewayError: If the gateway rejected the call.
+        """
@@ -2,13 +2,17 @@
 
 from abc import ABC, abstractmethod
 from typing import Iterable
-from pydantic import UUID1
-
-from src.core.domain.reservation import Reservation, ReservationBroker
+from pydantic import UUID4
+
+from src.core.domain.reservation import (
+    ReservationBroker,
+    ReservationFilter,
+    ReservationIn,
+)
+from src.infrastructure.dto.pagedto import PageDTO
 from src.infrastructure.dto.reservationdto import ReservationDTO
 
 
-
 class IReservationService(ABC):
     """A class representing reservation repository."""
 
@@ -21,63 +25,132 @@ class IReservationService(ABC):
         """
 
     @abstractmethod
-    async def get_by_car(self, car_id: int) -> ReservationDTO:
+    async def get_by_car(self, car_id: int) -> Iterable[ReservationDTO]:
         """The method getting reservations assigned to particular car.
 
         Args:
             car_id (int): The id of the car.
 
         Returns:
-            ReservationDTO: Reservation assigned to a car.
+            Iterable[ReservationDTO]: Reservations assigned to a car.
         """
 
     @abstractmethod
-    async def get_by_id(self, reservation_id: int) -> ReservationDTO:
+    async def get_by_id(self, reservation_id: int) -> ReservationDTO | None:
         """The method getting reservations assigned to particular id.
 
         Args:
             reservation_id (int): The id of the reservation.
 
         Returns:
-            ReservationDTO: Reservation assigned to an id.
+            ReservationDTO | None: Reservation assigned to an id.
         """
 
     @abstractmethod
-    async def get_by_user(self, user_id: UUID1) -> Iterable[ReservationDTO]:
+    async def get_by_user(self, user_id: UUID4) -> Iterable[ReservationDTO]:
         """The method getting reservations assigned to particular user.
 
         Args:
-            user_id (UUID1): The id of the user.
+            user_id (UUID4): The id of the user.
+
+        Returns:
+            Iterable[ReservationDTO]: Reservations assigned to a user.
+        """
+
+    @abstractmethod
+    async def get_user_history(
+            self,
+            user_id: UUID4,
+            filters: ReservationFilter,
+            limit: int,
+            cursor: str | None = None,
+    ) -> PageDTO[ReservationDTO]:
+        """The method getting a page of the user's reservations.
+
+        Args:
+            user_id (UUID4): The id of the user.
+            filters (ReservationFilter): The status and start window.
+            limit (int): The maximum number of reservations on the page.
+            cursor (str | None): The opaque cursor of the previous page.
+
+        Raises:
+            ValueError: If the cursor is malformed.
+
+        Returns:
+            PageDTO[ReservationDTO]: The page ordered by start with the
+                next cursor.
+        """
+
+    @abstractmethod
+    async def get_car_history(
+            self,
+            car_id: int,
+            filters: ReservationFilter,
+            limit: int,
+            cursor: str | None = None,
+    ) -> PageDTO[ReservationDTO]:
+        """The method getting a page of the car's reservations.
+
+        Args:
+            car_id (int): The id of the car.
+            filters (ReservationFilter): The status and start window.
+            limit (int): The maximum number of reservations on the page.
+            cursor (str | None): The opaque cursor of the previous page.
+
+        Raises:
+            ValueError: If the cursor is malformed.
 
         Returns:
-            ReservationDTO: Reservation assigned to a user.
+            PageDTO[ReservationDTO]: The page ordered by start with the
+                next cursor.
         """
 
     @abstractmethod
-    async def add_reservation(self, data: ReservationBroker) -> Reservation | None :
+    async def add_reservation(
+            self,
+            data: ReservationBroker,
+            idempotency_key: str | None = None,
+    ) -> ReservationDTO | None:
         """The method adding new reservation to the data storage.
 
         Args:
             data (ReservationBroker): The details of the new reservation.
+            idempotency_key (str | None): The client's key making retries
+                return the original reservation.
+
+        Raises:
+            ReservationConflictError: If the car is booked in the period.
+            IdempotencyKeyReusedError: If the key was used for another
+                request.
+            IdempotencyKeyExpiredError: If the reservation made with the
+                key was deleted.
+            IdempotencyKeyBusyError: If the claim of the key kept being
+                released while it was read.
 
         Returns:
-            Reservation | None: Full details of the newly added reservation.
+            ReservationDTO | None: Full details of the newly added
+                reservation, None if the car does not exist.
         """
 
     @abstractmethod
     async def update_reservation(
          self,
          reservation_id: int,
-         data: ReservationBroker
-    ) -> Reservation | None:
+         data: ReservationIn,
+    ) -> ReservationDTO | None:
         """The method updating reservation data in the data storage.
 
         Args:
             reservation_id (int): The id of the reservation.
-            data (ReservationBroker): The details of the updated reservation.
+            data (ReservationIn): The details of the updated reservation.
+
+        Raises:
+            ReservationConflictError: If the car is booked in the period.
+            ReservationNotEditableError: If the reservation is no longer
+                pending.
 
         Returns:
-            Reservation | None: The updated reservation details.
+            ReservationDTO | None: The updated reservation details.
         """
 
     @abstractmethod
@@ -87,6 +160,28 @@ class IReservationService(ABC):
         Args:
             reservation_id (int): The id of the reservation.
 
+        Raises:
+            ReservationNotEditableError: If the reservation is no longer
+                pending.
+
         Returns:
             bool: Success of the operation.
         """
+
+    @abstractmethod
+    async def cancel_reservation(
+            self,
+            reservation_id: int,
+    ) -> ReservationDTO | None:
+        """The method cancelling a pending or confirmed reservation.
+
+        Args:
+            reservation_id (int): The id of the reservation.
+
+        Raises:
+            ReservationNotEditableError: If the reservation has started
+                or ended.
+
+        Returns:
+            ReservationDTO | None: The cancelled reservation details.
+        """
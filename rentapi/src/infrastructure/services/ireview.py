@@ -0,0 +1,96 @@
+"""Module containing review service abstractions."""
+
+from abc import ABC, abstractmethod
+from typing import Iterable
+
+from pydantic import UUID4
+
+from src.core.domain.review import ReviewBroker, ReviewUpdate
+from src.infrastructure.dto.reviewdto import ReviewDTO
+
+
+class IReviewService(ABC):
+    """A class representing review service."""
+
+    @abstractmethod
+    async def get_all(self) -> Iterable[ReviewDTO]:
+        """The method getting all reviews from the repository.
+
+        Returns:
+            Iterable[ReviewDTO]: All reviews.
+        """
+
+    @abstractmethod
+    async def get_by_id(self, review_id: int) -> ReviewDTO | None:
+        """The method getting review assigned to particular id.
+
+        Args:
+            review_id (int): The id of the review.
+
+        Returns:
+            ReviewDTO | None: Review assigned to an id.
+        """
+
+    @abstractmethod
+    async def get_by_car(self, car_id: int) -> Iterable[ReviewDTO]:
+        """The method getting reviews assigned to particular car.
+
+        Args:
+            car_id (int): The id of the car.
+
+        Returns:
+            Iterable[ReviewDTO]: Reviews assigned to a car.
+        """
+
+    @abstractmethod
+    async def get_by_user(self, user_id: UUID4) -> Iterable[ReviewDTO]:
+        """The method getting reviews assigned to particular user.
+
+        Args:
+            user_id (UUID4): The id of the user.
+
+        Returns:
+            Iterable[ReviewDTO]: Reviews assigned to a user.
+        """
+
+    @abstractmethod
+    async def add_review(self, data: ReviewBroker) -> ReviewDTO | None:
+        """The method adding new review to the data storage.
+
+        Args:
+            data (ReviewBroker): The details of the new review.
+
+        Raises:
+            ReviewExistsError: If the reservation is already reviewed.
+
+        Returns:
+            ReviewDTO | None: The newly added review, None if the user has
+                no such reservation of the car.
+        """
+
+    @abstractmethod
+    async def update_review(
+            self,
+            review_id: int,
+            data: ReviewUpdate,
+    ) -> ReviewDTO | None:
+        """The method updating review data in the data storage.
+
+        Args:
+            review_id (int): The id of the review.
+            data (ReviewUpdate): The details of the updated review.
+
+        Returns:
+            ReviewDTO | None: The updated review details.
+        """
+
+    @abstractmethod
+    async def delete_review(self, review_id: int) -> bool:
+        """The method removing review from the data storage.
+
+        Args:
+            review_id (int): The id of the review.
+
+        Returns:
+            bool: Success of the operation.
+        """
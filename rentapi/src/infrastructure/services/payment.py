@@ -0,0 +1,247 @@
+"""Module containing payment service implementation."""
+
+from typing import Any
+
+from src.core.domain.payment import (
+    PaymentDeclinedError,
+    PaymentIn,
+    PaymentStatus,
+    ReservationNotPayableError,
+)
+from src.core.domain.reservation import ReservationStatus
+from src.core.repositories.ipayment import IPaymentRepository
+from src.infrastructure.dto.paymentdto import PaymentDTO
+from src.infrastructure.dto.reservationdto import ReservationDTO
+from src.infrastructure.payments.igateway import IPaymentGateway
+from src.infrastructure.services.ipayment import IPaymentService
+
+
+class PaymentService(IPaymentService):
+    """A class implementing the payment service."""
+
+    _repository: IPaymentRepository
+    _gateway: IPaymentGateway
+    _currency: str
+
+    def __init__(
+            self,
+            repository: IPaymentRepository,
+            gateway: IPaymentGateway,
+            currency: str,
+    ) -> None:
+        """The initializer of the `payment service`.
+
+        Args:
+            repository (IPaymentRepository): The reference to the
+                repository.
+            gateway (IPaymentGateway): The reference to the gateway.
+            currency (str): The ISO 4217 code of the charged currency.
+        """
+
+        self._repository = repository
+        self._gateway = gateway
+        self._currency = currency
+
+    async def get_by_id(self, payment_id: int) -> PaymentDTO | None:
+        """The method getting payment assigned to particular id.
+
+        Args:
+            payment_id (int): The id of the payment.
+
+        Returns:
+            PaymentDTO | None: Payment assigned to an id.
+        """
+
+        return await self._repository.get_by_id(payment_id)
+
+    async def pay_reservation(
+            self,
+            reservation: ReservationDTO,
+            payment_method: str,
+    ) -> PaymentDTO:
+        """The method charging the price of the reservation.
+
+        Only the authorization runs in the request. It confirms the
+        reservation, and the capture is left to the outbox dispatcher.
+        If the hold of the reservation expires while the gateway is
+        authorizing, the charge is voided or refunded from the outbox
+        instead.
+        The idempotency key is derived from the payment, and a retried
+        request reuses the payment in flight, so it never charges twice.
+
+        Args:
+            reservation (ReservationDTO): The reservation to pay for.
+            payment_method (str): The payment method token.
+
+        Raises:
+            ReservationNotPayableError: If the reservation does not await
+                a payment, also if it stopped awaiting it while paying.
+            PaymentDeclinedError: If the payment method was declined.
+            PaymentGatewayError: If the gateway rejected the call.
+
+        Returns:
+            PaymentDTO: The payment.
+        """
+
+        if reservation.status != ReservationStatus.PENDING:
+            raise ReservationNotPayableError(reservation.id)
+
+        payment = await self._repository.open_payment(PaymentIn(
+            price=reservation.total_price,
+            status=PaymentStatus.PENDING,
+            reservation_id=reservation.id,
+            user_id=reservation.user.id,
+        ))
+
+        if payment.status != PaymentStatus.PENDING:
+            return payment
+
+        try:
+            charge = await self._gateway.authorize(
+                amount=payment.price,
+                currency=self._currency,
+                payment_method=payment_method,
+                idempotency_key=f"payment-{payment.id}-authorize",
+                metadata={
+                    "payment_id": str(payment.id),
+                    "reservation_id": str(reservation.id),
+                },
+            )
+        except PaymentDeclinedError:
+            await self._repository.update_payment(
+                payment.id,
+                PaymentStatus.FAILED,
+            )
+            raise
+
+        payment = await self._repository.update_payment(
+            payment.id,
+            charge.status,
+            charge.id,
+        )
+
+        if payment.status in (PaymentStatus.VOIDED, PaymentStatus.REFUNDED):
+            raise ReservationNotPayableError(reservation.id)
+
+        return payment
+
+    async def capture_payment(self, payment_id: int) -> PaymentDTO | None:
+        """The method collecting an authorized payment.
+
+        Capturing is idempotent, so a redelivered request is harmless.
+
+        Args:
+            payment_id (int): The id of the payment.
+
+        Raises:
+            PaymentGatewayError: If the gateway rejected the call.
+
+        Returns:
+            PaymentDTO | None: The payment, None if it does not exist.
+        """
+
+        payment = await self._repository.get_by_id(payment_id)
+
+        if payment is None or payment.status != PaymentStatus.AUTHORIZED:
+            return payment
+
+        charge = await self._gateway.capture(
+            payment.gateway_id,
+            idempotency_key=f"payment-{payment.id}-capture",
+        )
+
+        return await self._repository.update_payment(
+            payment.id,
+            charge.status,
+            charge.id,
+        )
+
+    async def handle_capture(self, payload: dict[str, Any]) -> None:
+        """The method capturing the payment of an outbox event.
+
+        Args:
+            payload (dict[str, Any]): The id of the payment.
+
+        Raises:
+            PaymentGatewayError: If the gateway rejected the call.
+        """
+
+        await self.capture_payment(payload["payment_id"])
+
+    async def void_payment(self, payment_id: int) -> PaymentDTO | None:
+        """The method releasing the charge of a voided payment.
+
+        Voiding is idempotent, so a redelivered request is harmless.
+
+        Args:
+            payment_id (int): The id of the payment.
+
+        Raises:
+            PaymentGatewayError: If the gateway rejected the call.
+
+        Returns:
+            PaymentDTO | None: The payment, None if it does not exist.
+        """
+
+        payment = await self._repository.get_by_id(payment_id)
+
+        if payment is None or payment.gateway_id is None:
+            return payment
+
+        await self._gateway.void(
+            payment.gateway_id,
+            idempotency_key=f"payment-{payment.id}-void",
+        )
+
+        return payment
+
+    async def handle_void(self, payload: dict[str, Any]) -> None:
+        """The method voiding the payment of an outbox event.
+
+        Args:
+            payload (dict[str, Any]): The id of the payment.
+
+        Raises:
+            PaymentGatewayError: If the gateway rejected the call.
+        """
+
+        await self.void_payment(payload["payment_id"])
+
+    async def refund_payment(self, payment_id: int) -> PaymentDTO | None:
+        """The method returning the charge of a refunded payment.
+
+        Refunding is idempotent, so a redelivered request is harmless.
+
+        Args:
+            payment_id (int): The id of the payment.
+
+        Raises:
+            PaymentGatewayError: If the gateway rejected the call.
+
+        Returns:
+            PaymentDTO | None: The payment, None if it does not exist.
+        """
+
+        payment = await self._repository.get_by_id(payment_id)
+
+        if payment is None or payment.gateway_id is None:
+            return payment
+
+        await self._gateway.refund(
+            payment.gateway_id,
+            idempotency_key=f"payment-{payment.id}-refund",
+        )
+
+        return payment
+
+    async def handle_refund(self, payload: dict[str, Any]) -> None:
+        """The method refunding the payment of an outbox event.
+
+        Args:
+            payload (dict[str, Any]): The id of the payment.
+
+        Raises:
+            PaymentGatewayError: If the gateway rejected the call.
+        """
+
+        await self.refund_payment(payload["payment_id"])
@@ -0,0 +1,288 @@
+"""Module containing reservation service implementation."""
+
+from datetime import datetime
+from typing import Iterable
+
+from pydantic import UUID4
+
+from src.core.domain.reservation import (
+    ReservationBroker,
+    ReservationFilter,
+    ReservationIn,
+)
+from src.core.repositories.ireservation import IReservationRepository
+from src.infrastructure.dto.pagedto import PageDTO
+from src.infrastructure.dto.reservationdto import ReservationDTO
+from src.infrastructure.services.ireservation import IReservationService
+from src.infrastructure.utils.cursor import decode_cursor, encode_cursor
+
+
+class ReservationService(IReservationService):
+    """A class implementing the reservation service."""
+
+    _repository: IReservationRepository
+
+    def __init__(self, repository: IReservationRepository) -> None:
+        """The initializer of the `reservation service`.
+
+        Args:
+            repository (IReservationRepository): The reference to the
+                repository.
+        """
+
+        self._repository = repository
+
+    async def get_all(self) -> Iterable[ReservationDTO]:
+        """The method getting all reservation from the repository.
+
+        Returns:
+            Iterable[ReservationDTO]: All reservations.
+        """
+
+        return await self._repository.get_reservations()
+
+    async def get_by_car(self, car_id: int) -> Iterable[ReservationDTO]:
+        """The method getting reservations assigned to particular car.
+
+        Args:
+            car_id (int): The id of the car.
+
+        Returns:
+            Iterable[ReservationDTO]: Reservations assigned to a car.
+        """
+
+        return await self._repository.get_by_car(car_id)
+
+    async def get_by_id(self, reservation_id: int) -> ReservationDTO | None:
+        """The method getting reservations assigned to particular id.
+
+        Args:
+            reservation_id (int): The id of the reservation.
+
+        Returns:
+            ReservationDTO | None: Reservation assigned to an id.
+        """
+
+        return await self._repository.get_by_id(reservation_id)
+
+    async def get_by_user(self, user_id: UUID4) -> Iterable[ReservationDTO]:
+        """The method getting reservations assigned to particular user.
+
+        Args:
+            user_id (UUID4): The id of the user.
+
+        Returns:
+            Iterable[ReservationDTO]: Reservations assigned to a user.
+        """
+
+        return await self._repository.get_by_user(user_id)
+
+    async def get_user_history(
+            self,
+            user_id: UUID4,
+            filters: ReservationFilter,
+            limit: int,
+            cursor: str | None = None,
+    ) -> PageDTO[ReservationDTO]:
+        """The method getting a page of the user's reservations.
+
+        Args:
+            user_id (UUID4): The id of the user.
+            filters (ReservationFilter): The status and start window.
+            limit (int): The maximum number of reservations on the page.
+            cursor (str | None): The opaque cursor of the previous page.
+
+        Raises:
+            ValueError: If the cursor is malformed.
+
+        Returns:
+            PageDTO[ReservationDTO]: The page ordered by start with the
+                next cursor.
+        """
+
+        reservations = await self._repository.get_page_by_user(
+            user_id=user_id,
+            filters=filters,
+            limit=limit + 1,
+            after=_decode_after(cursor),
+        )
+
+        return _paginate(reservations, limit)
+
+    async def get_car_history(
+            self,
+            car_id: int,
+            filters: ReservationFilter,
+            limit: int,
+            cursor: str | None = None,
+    ) -> PageDTO[ReservationDTO]:
+        """The method getting a page of the car's reservations.
+
+        Args:
+            car_id (int): The id of the car.
+            filters (ReservationFilter): The status and start window.
+            limit (int): The maximum number of reservations on the page.
+            cursor (str | None): The opaque cursor of the previous page.
+
+        Raises:
+            ValueError: If the cursor is malformed.
+
+        Returns:
+            PageDTO[ReservationDTO]: The page ordered by start with the
+                next cursor.
+        """
+
+        reservations = await self._repository.get_page_by_car(
+            car_id=car_id,
+            filters=filters,
+            limit=limit + 1,
+            after=_decode_after(cursor),
+        )
+
+        return _paginate(reservations, limit)
+
+    async def add_reservation(
+            self,
+            data: ReservationBroker,
+            idempotency_key: str | None = None,
+    ) -> ReservationDTO | None:
+        """The method adding new reservation to the data storage.
+
+        Args:
+            data (ReservationBroker): The details of the new reservation.
+            idempotency_key (str | None): The client's key making retries
+                return the original reservation.
+
+        Raises:
+            ReservationConflictError: If the car is booked in the period.
+            IdempotencyKeyReusedError: If the key was used for another
+                request.
+            IdempotencyKeyExpiredError: If the reservation made with the
+                key was deleted.
+            IdempotencyKeyBusyError: If the claim of the key kept being
+                released while it was read.
+
+        Returns:
+            ReservationDTO | None: Full details of the newly added
+                reservation, None if the car does not exist.
+        """
+
+        return await self._repository.add_reservation(data, idempotency_key)
+
+    async def update_reservation(
+         self,
+         reservation_id: int,
+         data: ReservationIn,
+    ) -> ReservationDTO | None:
+        """The method updating reservation data in the data storage.
+
+        Args:
+            reservation_id (int): The id of the reservation.
+            data (ReservationIn): The details of the updated reservation.
+
+        Raises:
+            ReservationConflictError: If the car is booked in the period.
+            ReservationNotEditableError: If the reservation is no longer
+                pending.
+
+        Returns:
+            ReservationDTO | None: The updated reservation details.
+        """
+
+        return await self._repository.update_reservation(
+            reservation_id=reservation_id,
+            data=data,
+        )
+
+    async def delete_reservation(self, reservation_id: int) -> bool:
+        """The method updating removing reservation from the data storage.
+
+        Args:
+            reservation_id (int): The id of the reservation.
+
+        Raises:
+            ReservationNotEditableError: If the reservation is no longer
+                pending.
+
+        Returns:
+            bool: Success of the operation.
+        """
+
+        return await self._repository.delete_reservation(reservation_id)
+
+    async def cancel_reservation(
+            self,
+            reservation_id: int,
+    ) -> ReservationDTO | None:
+        """The method cancelling a pending or confirmed reservation.
+
+        Args:
+            reservation_id (int): The id of the reservation.
+
+        Raises:
+            ReservationNotEditableError: If the reservation has started
+                or ended.
+
+        Returns:
+            ReservationDTO | None: The cancelled reservation details.
+        """
+
+        return await self._repository.cancel_reservation(reservation_id)
+
+
+def _decode_after(cursor: str | None) -> tuple[datetime, int] | None:
+    """A function reading the last seen reservation from the cursor.
+
+    Args:
+        cursor (str | None): The opaque cursor of the previous page.
+
+    Raises:
+        ValueError: If the cursor is malformed.
+
+    Returns:
+        tuple[datetime, int] | None: The start and id after which the
+            page starts.
+    """
+
+    if not cursor:
+        return None
+
+    values = decode_cursor(cursor)
+    start, reservation_id = values.get("start"), values.get("id")
+    if not isinstance(start, str) or not isinstance(reservation_id, int):
+        raise ValueError("invalid cursor")
+
+    try:
+        return datetime.fromisoformat(start), reservation_id
+    except ValueError as e:
+        raise ValueError("invalid cursor") from e
+
+
+def _paginate(
+        reservations: Iterable[ReservationDTO],
+        limit: int,
+) -> PageDTO[ReservationDTO]:
+    """A function cutting an over-fetched result into a page.
+
+    Args:
+        reservations (Iterable[ReservationDTO]): Up to `limit + 1`
+            reservations.
+        limit (int): The size of the page.
+
+    Returns:
+        PageDTO[ReservationDTO]: The page with the cursor of its last
+            reservation.
+    """
+
+    reservations = list(reservations)
+    next_cursor = None
+
+    if len(reservations) > limit:
+        reservations = reservations[:limit]
+        last = reservations[-1]
+        next_cursor = encode_cursor({
+            "start": last.reservation_start.isoformat(),
+            "id": last.id,
+        })
+
+    return PageDTO[ReservationDTO](items=reservations, next_cursor=next_cursor)
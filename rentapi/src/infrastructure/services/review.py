@@ -0,0 +1,119 @@
+"""Module containing review service implementation."""
+
+from typing import Iterable
+
+from pydantic import UUID4
+
+from src.core.domain.review import ReviewBroker, ReviewUpdate
+from src.core.repositories.ireview import IReviewRepository
+from src.infrastructure.dto.reviewdto import ReviewDTO
+from src.infrastructure.services.ireview import IReviewService
+
+
+class ReviewService(IReviewService):
+    """A class implementing the review service."""
+
+    _repository: IReviewRepository
+
+    def __init__(self, repository: IReviewRepository) -> None:
+        """The initializer of the `review service`.
+
+        Args:
+            repository (IReviewRepository): The reference to the
+                repository.
+        """
+
+        self._repository = repository
+
+    async def get_all(self) -> Iterable[ReviewDTO]:
+        """The method getting all reviews from the repository.
+
+        Returns:
+            Iterable[ReviewDTO]: All reviews.
+        """
+
+        return await self._repository.get_reviews()
+
+    async def get_by_id(self, review_id: int) -> ReviewDTO | None:
+        """The method getting review assigned to particular id.
+
+        Args:
+            review_id (int): The id of the review.
+
+        Returns:
+            ReviewDTO | None: Review assigned to an id.
+        """
+
+        return await self._repository.get_by_id(review_id)
+
+    async def get_by_car(self, car_id: int) -> Iterable[ReviewDTO]:
+        """The method getting reviews assigned to particular car.
+
+        Args:
+            car_id (int): The id of the car.
+
+        Returns:
+            Iterable[ReviewDTO]: Reviews assigned to a car.
+        """
+
+        return await self._repository.get_review_by_car(car_id)
+
+    async def get_by_user(self, user_id: UUID4) -> Iterable[ReviewDTO]:
+        """The method getting reviews assigned to particular user.
+
+        Args:
+            user_id (UUID4): The id of the user.
+
+        Returns:
+            Iterable[ReviewDTO]: Reviews assigned to a user.
+        """
+
+        return await self._repository.get_review_by_user(user_id)
+
+    async def add_review(self, data: ReviewBroker) -> ReviewDTO | None:
+        """The method adding new review to the data storage.
+
+        Args:
+            data (ReviewBroker): The details of the new review.
+
+        Raises:
+            ReviewExistsError: If the reservation is already reviewed.
+
+        Returns:
+            ReviewDTO | None: The newly added review, None if the user has
+                no such reservation of the car.
+        """
+
+        return await self._repository.add_review(data)
+
+    async def update_review(
+            self,
+            review_id: int,
+            data: ReviewUpdate,
+    ) -> ReviewDTO | None:
+        """The method updating review data in the data storage.
+
+        Args:
+            review_id (int): The id of the review.
+            data (ReviewUpdate): The details of the updated review.
+
+        Returns:
+            ReviewDTO | None: The updated review details.
+        """
+
+        return await self._repository.update_review(
+            review_id=review_id,
+            data=data,
+        )
+
+    async def delete_review(self, review_id: int) -> bool:
+        """The method removing review from the data storage.
+
+        Args:
+            review_id (int): The id of the review.
+
+        Returns:
+            bool: Success of the operation.
+        """
+
+        return await self._repository.delete_review(review_id)
@@ -7,7 +7,7 @@ from src.core.repositories.iuser import IUserRepository
 from src.infrastructure.dto.userdto import UserDTO
 from src.infrastructure.dto.tokendto import TokenDTO
 from src.infrastructure.services.iuser import IUserService
-from src.infrastructure.utils.password import verify_password
+from src.infrastructure.utils.password import verify_password_async
 from src.infrastructure.utils.token import generate_user_token
 
 
@@ -42,7 +42,10 @@ class UserService(IUserService):
         """
 
         if user_data := await self._repository.get_by_email(user.email):
-            if verify_password(user.password, user_data.password):
+            if await verify_password_async(
+                user.user_password,
+                user_data.password,
+            ):
                 token_details = generate_user_token(user_data.id)
                 # trunk-ignore(bandit/B106)
                 return TokenDTO(token_type="Bearer", **token_details)
@@ -73,4 +76,4 @@ class UserService(IUserService):
             UserDTO | None: The user data, if found.
         """
 
-        return await self.get_by_email(email)
\ No newline at end of file
+        return await self._repository.get_by_email(email)
\ No newline at end of file
@@ -0,0 +1,108 @@
+"""A module containing helpers for parsing streamed bulk uploads."""
+
+import codecs
+import csv
+import json
+from typing import AsyncIterator, NamedTuple
+
+
+class ParsedRow(NamedTuple):
+    """A single row of an upload with its 1-based line number."""
+    line: int
+    data: dict | None
+    error: str | None = None
+
+
+async def iter_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[str]:
+    """A function splitting a byte stream into decoded text lines.
+
+    Args:
+        chunks (AsyncIterator[bytes]): The raw body chunks.
+
+    Yields:
+        str: The lines without line terminators.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8-sig")(errors="replace")
+    buffer = ""
+
+    async for chunk in chunks:
+        buffer += decoder.decode(chunk)
+        *lines, buffer = buffer.split("\n")
+        for line in lines:
+            yield line.rstrip("\r")
+
+    buffer += decoder.decode(b"", final=True)
+    if buffer:
+        yield buffer.rstrip("\r")
+
+
+async def parse_csv(lines: AsyncIterator[str]) -> AsyncIterator[ParsedRow]:
+    """A function parsing CSV lines with a header into rows.
+
+    Every record has to fit on one line. Empty cells become None.
+
+    Args:
+        lines (AsyncIterator[str]): The text lines of the upload.
+
+    Yields:
+        ParsedRow: The parsed rows.
+    """
+    header: list[str] | None = None
+    line_number = 0
+
+    async for line in lines:
+        line_number += 1
+        if not line.strip():
+            continue
+
+        try:
+            cells = next(csv.reader([line]))
+        except csv.Error as e:
+            yield ParsedRow(line_number, None, str(e))
+            continue
+
+        if header is None:
+            header = [cell.strip() for cell in cells]
+            continue
+
+        if len(cells) != len(header):
+            yield ParsedRow(
+                line_number,
+                None,
+                f"expected {len(header)} columns, got {len(cells)}",
+            )
+            continue
+
+        yield ParsedRow(
+            line_number,
+            {key: value or None for key, value in zip(header, cells)},
+        )
+
+
+async def parse_ndjson(lines: AsyncIterator[str]) -> AsyncIterator[ParsedRow]:
+    """A function parsing newline-delimited JSON objects into rows.
+
+    Args:
+        lines (AsyncIterator[str]): The text lines of the upload.
+
+    Yields:
+        ParsedRow: The parsed rows.
+    """
+    line_number = 0
+
+    async for line in lines:
+        line_number += 1
+        if not line.strip():
+            continue
+
+        try:
+            data = json.loads(line)
+        except json.JSONDecodeError as e:
+            yield ParsedRow(line_number, None, f"invalid JSON: {e.msg}")
+            continue
+
+        if not isinstance(data, dict):
+            yield ParsedRow(line_number, None, "expected a JSON object")
+            continue
+
+        yield ParsedRow(line_number, data)
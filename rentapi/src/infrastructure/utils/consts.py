@@ -3,3 +3,13 @@
 EXPIRATION_MINUTES = 60
 SECRET_KEY = "s3cr3t"  # TODO: random generation
 ALGORITHM = "HS256"
+TOKEN_TYPE = "confirmation"
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+STREAM_CHUNK_ROWS = 100
+
+IMPORT_BATCH_SIZE = 1000
+IMPORT_SPOOL_BYTES = 8 * 1024 * 1024
+MAX_IMPORT_ERRORS = 1000
+EXPORT_QUEUE_CHUNKS = 16
@@ -0,0 +1,44 @@
+"""A module containing helper functions for pagination cursors."""
+
+import base64
+import binascii
+import json
+
+
+def encode_cursor(values: dict) -> str:
+    """A function encoding keyset values into an opaque cursor.
+
+    Args:
+        values (dict): The keyset values of the last returned row.
+
+    Returns:
+        str: The url-safe cursor.
+    """
+    raw = json.dumps(values, separators=(",", ":"), default=str)
+
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> dict:
+    """A function decoding an opaque cursor into keyset values.
+
+    Args:
+        cursor (str): The cursor received from the client.
+
+    Raises:
+        ValueError: If the cursor is malformed.
+
+    Returns:
+        dict: The keyset values.
+    """
+    padded = cursor + "=" * (-len(cursor) % 4)
+
+    try:
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (binascii.Error, UnicodeDecodeError, json.JSONDecodeError) as e:
+        raise ValueError("invalid cursor") from e
+
+    if not isinstance(values, dict):
+        raise ValueError("invalid cursor")
+
+    return values
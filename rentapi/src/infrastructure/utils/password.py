@@ -1,9 +1,31 @@
 """A module containing password helper methods."""
 
+import asyncio
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable
+
 from passlib.context import CryptContext
+from prometheus_client import Histogram
+
+from src.config import config
+from src.infrastructure.utils.timing import timed
 
 pwd_context = CryptContext(schemes=["bcrypt"])
 
+PASSWORD_QUEUE_WAIT = Histogram(
+    "password_hash_queue_wait_seconds",
+    "Time password hashing jobs spend waiting for a free executor worker.",
+    buckets=(.001, .005, .01, .025, .05, .1, .25, .5, 1, 2.5, 5),
+)
+
+_executor: Executor | None = None
+_pending = 0
+
+
+class PasswordHasherBusyError(RuntimeError):
+    """Raised when too many password jobs are already waiting."""
+
 
 def hash_password(password: str) -> str:
     """A function generating has password.
@@ -27,4 +49,118 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     Returns:
         bool: True if the password matches the hash, False otherwise.
     """
-    return pwd_context.verify(plain_password, hashed_password)
\ No newline at end of file
+    return pwd_context.verify(plain_password, hashed_password)
+
+
+async def hash_password_async(password: str) -> str:
+    """A function hashing the password on the password executor.
+
+    Args:
+        password (str): A raw form of the password.
+
+    Raises:
+        PasswordHasherBusyError: If the executor queue is full.
+
+    Returns:
+        str: The hashed password.
+    """
+    return await _run(hash_password, password)
+
+
+async def verify_password_async(
+        plain_password: str,
+        hashed_password: str,
+) -> bool:
+    """A function verifying the password on the password executor.
+
+    Args:
+        plain_password (str): The raw password.
+        hashed_password (str): The hashed password.
+
+    Raises:
+        PasswordHasherBusyError: If the executor queue is full.
+
+    Returns:
+        bool: True if the password matches the hash, False otherwise.
+    """
+    return await _run(verify_password, plain_password, hashed_password)
+
+
+def shutdown_password_executor() -> None:
+    """A function stopping the password executor, if it was started."""
+    global _executor
+
+    if _executor is not None:
+        _executor.shutdown(wait=True, cancel_futures=True)
+        _executor = None
+
+
+async def _run(function: Callable[..., Any], *args: Any) -> Any:
+    """A function running a password job without blocking the event loop.
+
+    Args:
+        function (Callable[..., Any]): The module-level job function.
+        *args (Any): The job arguments.
+
+    Raises:
+        PasswordHasherBusyError: If the executor queue is full.
+
+    Returns:
+        Any: The job result.
+    """
+    global _pending
+
+    if _pending >= config.PASSWORD_WORKERS + config.PASSWORD_QUEUE_LIMIT:
+        raise PasswordHasherBusyError("password hashing queue is full")
+
+    _pending += 1
+    submitted = time.monotonic()
+    try:
+        with timed("bcrypt"):
+            started, result = await asyncio.get_running_loop().run_in_executor(
+                _get_executor(),
+                _timed,
+                function,
+                *args,
+            )
+    finally:
+        _pending -= 1
+
+    PASSWORD_QUEUE_WAIT.observe(max(started - submitted, 0.0))
+
+    return result
+
+
+def _timed(function: Callable[..., Any], *args: Any) -> tuple[float, Any]:
+    """A function executing the job and reporting when it started.
+
+    Args:
+        function (Callable[..., Any]): The job function.
+        *args (Any): The job arguments.
+
+    Returns:
+        tuple[float, Any]: The monotonic start time and the job result.
+    """
+    return time.monotonic(), function(*args)
+
+
+def _get_executor() -> Executor:
+    """A function lazily creating the bounded password executor.
+
+    Returns:
+        Executor: The thread or process pool configured in `AppConfig`.
+    """
+    global _executor
+
+    if _executor is None:
+        if config.PASSWORD_EXECUTOR == "process":
+            _executor = ProcessPoolExecutor(
+                max_workers=config.PASSWORD_WORKERS,
+            )
+        else:
+            _executor = ThreadPoolExecutor(
+                max_workers=config.PASSWORD_WORKERS,
+                thread_name_prefix="password",
+            )
+
+    return _executor
@@ -0,0 +1,214 @@
+"""A module containing the pricing engine.
+
+Rules are compiled once into a per-day table of season multipliers with
+prefix sums over it, so the season part of any quote costs two lookups,
+and into a sorted list of stay thresholds searched with bisection.
+"""
+
+import math
+from bisect import bisect_right
+from datetime import date, datetime, timedelta, timezone
+from itertools import accumulate
+from typing import Iterator
+
+from src.core.domain.pricing import PricingRules, Quote, SeasonRule
+
+
+class PricingEngine:
+    """A class pricing rentals with precompiled rules."""
+
+    def __init__(
+            self,
+            rules: PricingRules,
+            horizon_start: date | None = None,
+            horizon_years: int = 5,
+    ) -> None:
+        """The initializer of the `pricing engine`.
+
+        Days outside the compiled horizon are priced at the base rate.
+
+        Args:
+            rules (PricingRules): The season and length-of-stay rules.
+            horizon_start (date | None): The first day of the table.
+                Defaults to January 1st of the previous year.
+            horizon_years (int): The number of years in the table.
+        """
+
+        base = horizon_start or date(date.today().year - 1, 1, 1)
+        size = (date(base.year + horizon_years, 1, 1) - base).days
+        multipliers = [1.0] * size
+
+        for rule in rules.seasons:
+            for start, end in _occurrences(rule, base.year, horizon_years):
+                low = max(0, (start - base).days)
+                high = min(size, (end - base).days + 1)
+                for day in range(low, high):
+                    multipliers[day] *= rule.multiplier
+
+        discounts = sorted(rules.stay_discounts, key=lambda d: d.min_days)
+
+        self._base = base.toordinal()
+        self._size = size
+        self._prefix = list(accumulate(multipliers, initial=0.0))
+        self._stay_days = [discount.min_days for discount in discounts]
+        self._stay_factors = [1 - discount.discount for discount in discounts]
+
+    @classmethod
+    def from_file(
+            cls,
+            path: str | None,
+            horizon_years: int = 5,
+    ) -> "PricingEngine":
+        """A method compiling the rules stored in a JSON file, e.g.
+
+            {"seasons": [{"name": "summer", "start": "2026-07-01",
+                          "end": "2026-08-31", "multiplier": 1.3,
+                          "yearly": true}],
+             "stay_discounts": [{"min_days": 7, "discount": 0.1}]}
+
+        Args:
+            path (str | None): The path of the rules, base rates if None.
+            horizon_years (int): The number of years in the table.
+
+        Returns:
+            PricingEngine: The compiled engine.
+        """
+
+        if path is None:
+            return cls(PricingRules(), horizon_years=horizon_years)
+
+        with open(path, encoding="utf-8") as file:
+            rules = PricingRules.model_validate_json(file.read())
+
+        return cls(rules, horizon_years=horizon_years)
+
+    def day_units(self, first: date, days: int) -> float:
+        """The method summing the season multipliers of consecutive days.
+
+        Args:
+            first (date): The first billed day.
+            days (int): The number of billed days.
+
+        Returns:
+            float: The number of base-rate days the period is worth.
+        """
+
+        low = first.toordinal() - self._base
+        inside_low = min(max(low, 0), self._size)
+        inside_high = min(max(low + days, 0), self._size)
+
+        return (
+            self._prefix[inside_high] - self._prefix[inside_low]
+            + days - (inside_high - inside_low)
+        )
+
+    def stay_factor(self, days: int) -> float:
+        """The method finding the length-of-stay price factor.
+
+        Args:
+            days (int): The number of billed days.
+
+        Returns:
+            float: The factor of the largest applicable discount.
+        """
+
+        index = bisect_right(self._stay_days, days)
+
+        return self._stay_factors[index - 1] if index else 1.0
+
+    def total_price(
+            self,
+            price_per_day: float,
+            start: datetime,
+            end: datetime,
+    ) -> float:
+        """The method pricing a rental.
+
+        Args:
+            price_per_day (float): The base rate of the car.
+            start (datetime): The start of the rental.
+            end (datetime): The end of the rental.
+
+        Returns:
+            float: The price rounded to cents.
+        """
+
+        days = rental_days(start, end)
+        first = start.astimezone(timezone.utc).date()
+
+        return round(
+            price_per_day * self.day_units(first, days)
+            * self.stay_factor(days),
+            2,
+        )
+
+    def quote(
+            self,
+            price_per_day: float,
+            start: datetime,
+            end: datetime,
+            car_id: int | None = None,
+    ) -> Quote:
+        """The method pricing a rental with its breakdown.
+
+        Args:
+            price_per_day (float): The base rate of the car.
+            start (datetime): The start of the rental.
+            end (datetime): The end of the rental.
+            car_id (int | None): The id of the car.
+
+        Returns:
+            Quote: The quote.
+        """
+
+        return Quote(
+            car_id=car_id,
+            price_per_day=price_per_day,
+            days=rental_days(start, end),
+            total_price=self.total_price(price_per_day, start, end),
+        )
+
+
+def rental_days(start: datetime, end: datetime) -> int:
+    """A function counting the started days of a rental.
+
+    Args:
+        start (datetime): The start of the rental.
+        end (datetime): The end of the rental.
+
+    Returns:
+        int: The number of billed days.
+    """
+
+    return max(1, math.ceil((end - start) / timedelta(days=1)))
+
+
+def _occurrences(
+        rule: SeasonRule,
+        first_year: int,
+        years: int,
+) -> Iterator[tuple[date, date]]:
+    """A function listing the date ranges a season covers.
+
+    Args:
+        rule (SeasonRule): The season.
+        first_year (int): The first year of the horizon.
+        years (int): The number of years in the horizon.
+
+    Yields:
+        tuple[date, date]: The first and last day of each occurrence.
+    """
+
+    if not rule.yearly:
+        yield rule.start, rule.end
+        return
+
+    length = rule.end - rule.start
+
+    # One year earlier as well, for seasons running over New Year.
+    for year in range(first_year - 1, first_year + years):
+        try:
+            start = rule.start.replace(year=year)
+        except ValueError:
+            start = date(year, 2, 28)
+        yield start, start + length
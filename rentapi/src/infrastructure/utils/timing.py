@@ -0,0 +1,61 @@
+"""A module collecting per-request timings of DB and crypto work."""
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Iterator
+
+
+@dataclass
+class RequestTimings:
+    """Time spent in instrumented work while serving one request."""
+    db_queries: int = 0
+    db_seconds: float = 0.0
+    bcrypt_seconds: float = 0.0
+    jwt_seconds: float = 0.0
+
+
+current_timings: ContextVar[RequestTimings | None] = ContextVar(
+    "current_timings",
+    default=None,
+)
+
+
+def record_query(seconds: float) -> None:
+    """A function adding a DB query to the current request.
+
+    Args:
+        seconds (float): The duration of the query.
+    """
+    if (timings := current_timings.get()) is not None:
+        timings.db_queries += 1
+        timings.db_seconds += seconds
+
+
+@contextmanager
+def timed(kind: str) -> Iterator[None]:
+    """A context manager adding the block duration to the current request.
+
+    Nothing is measured outside of an instrumented request.
+
+    Args:
+        kind (str): Either "bcrypt" or "jwt".
+
+    Yields:
+        None: Control to the measured block.
+    """
+    if (timings := current_timings.get()) is None:
+        yield
+        return
+
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        attribute = f"{kind}_seconds"
+        setattr(
+            timings,
+            attribute,
+            getattr(timings, attribute) + time.perf_counter() - started,
+        )
@@ -1,16 +1,24 @@
 """A module containing helper functions for token generation."""
 
+import hashlib
 from datetime import datetime, timedelta, timezone
 
-from jose import jwt
-from pydantic import UUID4
+from jose import JWTError, jwt
+from pydantic import UUID4, ValidationError
 
+from src.config import config
+from src.infrastructure.cache.memory import LRUStore
+from src.infrastructure.dto.tokendto import TokenPayloadDTO
+from src.infrastructure.utils.timing import timed
 from src.infrastructure.utils.consts import (
     EXPIRATION_MINUTES,
     ALGORITHM,
     SECRET_KEY,
+    TOKEN_TYPE,
 )
 
+decoded_tokens = LRUStore(max_size=config.TOKEN_CACHE_SIZE)
+
 
 def generate_user_token(user_uuid: UUID4) -> dict:
     """A function returning JWT token for user.
@@ -22,7 +30,47 @@ def generate_user_token(user_uuid: UUID4) -> dict:
         dict: The token details.
     """
     expire = datetime.now(timezone.utc) + timedelta(minutes=EXPIRATION_MINUTES)
-    jwt_data = {"sub": str(user_uuid), "exp": expire, "type": "confirmation"}
-    encoded_jwt = jwt.encode(jwt_data, key=SECRET_KEY, algorithm=ALGORITHM)
+    jwt_data = {"sub": str(user_uuid), "exp": expire, "type": TOKEN_TYPE}
+    with timed("jwt"):
+        encoded_jwt = jwt.encode(jwt_data, key=SECRET_KEY, algorithm=ALGORITHM)
+
+    return {"user_token": encoded_jwt, "expires": expire}
+
+
+def decode_user_token(token: str) -> TokenPayloadDTO:
+    """A function verifying the JWT token of the user.
+
+    Verified payloads are kept in a bounded LRU keyed by the token digest
+    until the token expires, so repeated requests skip signature checks.
+
+    Args:
+        token (str): The encoded JWT token.
+
+    Raises:
+        ValueError: If the token is invalid or expired.
+
+    Returns:
+        TokenPayloadDTO: The verified token claims.
+    """
+    digest = hashlib.sha256(token.encode()).digest()
+
+    if (payload := decoded_tokens.get(digest)) is not None:
+        return payload
+
+    try:
+        with timed("jwt"):
+            claims = jwt.decode(token, key=SECRET_KEY, algorithms=[ALGORITHM])
+        payload = TokenPayloadDTO(**claims)
+    except (JWTError, ValidationError) as e:
+        raise ValueError("invalid token") from e
+
+    if payload.type != TOKEN_TYPE:
+        raise ValueError("invalid token")
+
+    ttl = (payload.exp - datetime.now(timezone.utc)).total_seconds()
+    if ttl <= 0:
+        raise ValueError("token expired")
+
+    decoded_tokens.set(digest, payload, ttl=ttl)
 
-    return {"user_token": encoded_jwt, "expires": expire}
\ No newline at end of file
+    return payload
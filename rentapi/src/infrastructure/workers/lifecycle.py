@@ -0,0 +1,94 @@
+"""Module containing the reservation lifecycle scheduler."""
+
+import asyncio
+import logging
+from contextlib import suppress
+
+from prometheus_client import Counter, Gauge
+
+from src.core.repositories.ireservation import IReservationRepository
+
+RESERVATION_TRANSITIONS = Counter(
+    "reservation_transitions",
+    "Reservations moved by the lifecycle scheduler.",
+    ["status"],
+)
+RESERVATION_LIFECYCLE_LAG = Gauge(
+    "reservation_lifecycle_lag_seconds",
+    "How late the oldest due reservation transition is.",
+    multiprocess_mode="livemax",
+)
+
+logger = logging.getLogger(__name__)
+
+
+class ReservationLifecycleScheduler:
+    """A class moving reservations whose next transition is due.
+
+    Each tick is a few set-based UPDATEs rather than a check per row.
+    Any number of schedulers may run at once; locked rows are skipped and
+    every UPDATE re-checks the status it moves from.
+    """
+
+    _repository: IReservationRepository
+    _batch_size: int
+    _tick_interval: float
+
+    def __init__(
+            self,
+            repository: IReservationRepository,
+            batch_size: int,
+            tick_interval: float,
+    ) -> None:
+        """The initializer of the `reservation lifecycle scheduler`.
+
+        Args:
+            repository (IReservationRepository): The reference to the
+                repository.
+            batch_size (int): The rows moved per transition at once.
+            tick_interval (float): The sleep when nothing is left due.
+        """
+
+        self._repository = repository
+        self._batch_size = batch_size
+        self._tick_interval = tick_interval
+
+    async def run(self, stop: asyncio.Event) -> None:
+        """The method advancing reservations until stopped.
+
+        A full batch is followed by the next one right away, so a backlog
+        drains without waiting for the following tick.
+
+        Args:
+            stop (asyncio.Event): The event ending the loop.
+        """
+
+        while not stop.is_set():
+            try:
+                moved = await self.tick()
+            except Exception:  # pylint: disable=broad-except
+                logger.exception("reservation lifecycle tick failed")
+                moved = 0
+
+            if moved < self._batch_size:
+                with suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(stop.wait(), self._tick_interval)
+
+    async def tick(self) -> int:
+        """The method applying one batch of every due transition.
+
+        Returns:
+            int: The largest number of rows moved by a single transition.
+        """
+
+        moved = await self._repository.advance_reservations(self._batch_size)
+
+        for status, count in moved.items():
+            if count:
+                RESERVATION_TRANSITIONS.labels(status.value).inc(count)
+
+        RESERVATION_LIFECYCLE_LAG.set(
+            await self._repository.get_transition_lag(),
+        )
+
+        return max(moved.values(), default=0)
@@ -0,0 +1,120 @@
+"""Module containing the publisher of in-process metrics.
+
+Under gunicorn every worker keeps its own metrics. With
+`PROMETHEUS_MULTIPROC_DIR` set, `prometheus_client` writes counters,
+histograms and gauges to files shared by the workers, and `/metrics`
+aggregates them. Custom collectors only see the process answering the
+scrape, so their samples are copied into shared gauges instead.
+"""
+
+import asyncio
+import logging
+import os
+from contextlib import suppress
+from typing import Iterable
+
+from prometheus_client import Gauge
+from prometheus_client.registry import Collector
+
+logger = logging.getLogger(__name__)
+
+
+def is_multiprocess() -> bool:
+    """A function telling whether metrics are shared between processes.
+
+    Returns:
+        bool: True if `PROMETHEUS_MULTIPROC_DIR` is set.
+    """
+
+    return bool(os.environ.get("PROMETHEUS_MULTIPROC_DIR"))
+
+
+class MetricsPublisher:
+    """A class copying samples of collectors into multiprocess gauges.
+
+    The gauges sum the values of the live workers, so pool sizes and
+    cache counters cover the whole server, and a stopped worker's share
+    disappears with it. Counters are exported as gauges this way.
+    """
+
+    _collectors: list[Collector]
+    _interval: float
+    _gauges: dict[str, Gauge]
+
+    def __init__(
+            self,
+            collectors: Iterable[Collector],
+            interval: float,
+    ) -> None:
+        """The initializer of the `metrics publisher`.
+
+        Args:
+            collectors (Iterable[Collector]): The in-process collectors.
+            interval (float): The seconds between two copies.
+        """
+
+        self._collectors = list(collectors)
+        self._interval = interval
+        self._gauges = {}
+
+    async def run(self, stop: asyncio.Event) -> None:
+        """The method publishing the samples until stopped.
+
+        Args:
+            stop (asyncio.Event): The event ending the loop.
+        """
+
+        while not stop.is_set():
+            try:
+                self.publish()
+            except Exception:  # pylint: disable=broad-except
+                logger.exception("metrics publishing failed")
+
+            with suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(stop.wait(), self._interval)
+
+    def publish(self) -> None:
+        """The method copying the current samples into the gauges."""
+
+        for collector in self._collectors:
+            for family in collector.collect():
+                for sample in family.samples:
+                    gauge = self._gauge(
+                        sample.name,
+                        family.documentation,
+                        tuple(sample.labels),
+                    )
+                    if sample.labels:
+                        gauge = gauge.labels(**sample.labels)
+                    gauge.set(sample.value)
+
+    def _gauge(
+            self,
+            name: str,
+            documentation: str,
+            labels: tuple[str, ...],
+    ) -> Gauge:
+        """The method getting the gauge mirroring a sample.
+
+        The gauges are left out of the default registry, whose
+        collectors already export the same names.
+
+        Args:
+            name (str): The name of the sample.
+            documentation (str): The help text of the metric.
+            labels (tuple[str, ...]): The label names of the sample.
+
+        Returns:
+            Gauge: The gauge.
+        """
+
+        if name not in self._gauges:
+            self._gauges[name] = Gauge(
+                name,
+                documentation,
+                labels,
+                registry=None,
+                multiprocess_mode="livesum",
+            )
+
+        return self._gauges[name]
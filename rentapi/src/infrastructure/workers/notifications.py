@@ -0,0 +1,31 @@
+"""Module containing the customer notification handlers of the outbox.
+
+The app has no mail delivery yet, so the notifications are written to
+the `src.notifications` log, which a log shipper can forward.
+"""
+
+import logging
+from typing import Any
+
+logger = logging.getLogger("src.notifications")
+
+
+async def notify_reservation_confirmed(payload: dict[str, Any]) -> None:
+    """A function telling the customer the reservation is confirmed.
+
+    Args:
+        payload (dict[str, Any]): The ids of the reservation and user.
+    """
+
+    logger.info("reservation confirmed", extra=payload)
+
+
+async def invite_review(payload: dict[str, Any]) -> None:
+    """A function asking the customer to review a finished rental.
+
+    Args:
+        payload (dict[str, Any]): The ids of the reservation, car and
+            user.
+    """
+
+    logger.info("review invitation", extra=payload)
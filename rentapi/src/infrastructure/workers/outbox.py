@@ -0,0 +1,152 @@
+"""Module containing the outbox dispatcher."""
+
+import asyncio
+import logging
+import random
+from contextlib import suppress
+from typing import Any, Awaitable, Callable, Mapping
+
+from prometheus_client import Counter
+
+from src.core.domain.outbox import OutboxEvent
+from src.core.repositories.ioutbox import IOutboxRepository
+
+Handler = Callable[[dict[str, Any]], Awaitable[None]]
+
+OUTBOX_EVENTS = Counter(
+    "outbox_events",
+    "Outbox events handled by the dispatcher.",
+    ["topic", "outcome"],
+)
+
+logger = logging.getLogger(__name__)
+
+
+class OutboxDispatcher:
+    """A class running side effects recorded in the outbox.
+
+    Events are delivered at least once, so handlers must be idempotent.
+    Any number of dispatchers may run at once; they claim disjoint
+    batches.
+    """
+
+    _repository: IOutboxRepository
+    _handlers: Mapping[str, Handler]
+    _batch_size: int
+    _lease: float
+    _max_attempts: int
+    _base_delay: float
+    _max_delay: float
+    _poll_interval: float
+
+    def __init__(
+            self,
+            repository: IOutboxRepository,
+            handlers: Mapping[str, Handler],
+            batch_size: int,
+            lease: float,
+            max_attempts: int,
+            base_delay: float,
+            max_delay: float,
+            poll_interval: float,
+    ) -> None:
+        """The initializer of the `outbox dispatcher`.
+
+        Args:
+            repository (IOutboxRepository): The reference to the
+                repository.
+            handlers (Mapping[str, Handler]): The handlers by topic.
+            batch_size (int): The number of events claimed at once.
+            lease (float): The time to process a batch in seconds.
+            max_attempts (int): The attempts before giving up on an event.
+            base_delay (float): Backoff of the first retry in seconds.
+            max_delay (float): Upper bound of a single backoff.
+            poll_interval (float): The sleep when no events are due.
+        """
+
+        self._repository = repository
+        self._handlers = handlers
+        self._batch_size = batch_size
+        self._lease = lease
+        self._max_attempts = max_attempts
+        self._base_delay = base_delay
+        self._max_delay = max_delay
+        self._poll_interval = poll_interval
+
+    async def run(self, stop: asyncio.Event) -> None:
+        """The method dispatching batches until stopped.
+
+        A full batch is followed by the next one right away, so a backlog
+        drains as fast as the handlers allow.
+
+        Args:
+            stop (asyncio.Event): The event ending the loop.
+        """
+
+        while not stop.is_set():
+            try:
+                dispatched = await self.dispatch_batch()
+            except Exception:  # pylint: disable=broad-except
+                logger.exception("outbox dispatch failed")
+                dispatched = 0
+
+            if dispatched < self._batch_size:
+                with suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(stop.wait(), self._poll_interval)
+
+    async def dispatch_batch(self) -> int:
+        """The method claiming and handling one batch of due events.
+
+        Returns:
+            int: The number of claimed events.
+        """
+
+        events = list(await self._repository.claim_events(
+            self._batch_size,
+            self._lease,
+        ))
+        handled = await asyncio.gather(*(self._handle(e) for e in events))
+
+        await self._repository.complete_events([
+            event.id for event, done in zip(events, handled) if done
+        ])
+
+        return len(events)
+
+    async def _handle(self, event: OutboxEvent) -> bool:
+        """The method running the handler of an event.
+
+        Args:
+            event (OutboxEvent): The claimed event.
+
+        Returns:
+            bool: Whether the event was handled.
+        """
+
+        topic = event.topic.value
+
+        try:
+            await self._handlers[topic](event.payload)
+        except Exception as e:  # pylint: disable=broad-except
+            error = repr(e)
+            extra = {"event_id": event.id, "topic": topic, "error": error}
+
+            if event.attempts >= self._max_attempts:
+                logger.error("outbox event failed", extra=extra)
+                OUTBOX_EVENTS.labels(topic, "failed").inc()
+                await self._repository.fail_event(event.id, error)
+            else:
+                logger.warning("outbox event will be retried", extra=extra)
+                OUTBOX_EVENTS.labels(topic, "retried").inc()
+                await self._repository.retry_event(
+                    event.id,
+                    error,
+                    random.uniform(0, min(
+                        self._max_delay,
+                        self._base_delay * 2 ** event.attempts,
+                    )),
+                )
+            return False
+
+        OUTBOX_EVENTS.labels(topic, "handled").inc()
+        return True
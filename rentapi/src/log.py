@@ -0,0 +1,112 @@
+"""A module configuring structured, non-blocking logging."""
+
+import json
+import logging
+import queue
+import random
+import sys
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+
+from src.config import config
+
+request_id: ContextVar[str | None] = ContextVar("request_id", default=None)
+
+_RECORD_ATTRIBUTES = frozenset(vars(logging.LogRecord(
+    "", logging.INFO, "", 0, "", None, None,
+))) | {"message", "asctime", "request_id", "sample_rate", "taskName"}
+
+
+class RequestContextFilter(logging.Filter):
+    """A filter tagging records with the current request id."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.request_id = request_id.get()
+        return True
+
+
+class SamplingFilter(logging.Filter):
+    """A filter keeping records logged with `sample_rate` at that rate."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        rate = getattr(record, "sample_rate", None)
+
+        return rate is None or random.random() < rate
+
+
+class JsonFormatter(logging.Formatter):
+    """A formatter rendering records as single-line JSON objects."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "time": datetime.fromtimestamp(
+                record.created,
+                tz=timezone.utc,
+            ).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+
+        if rid := getattr(record, "request_id", None):
+            entry["request_id"] = rid
+
+        entry.update(
+            (key, value) for key, value in vars(record).items()
+            if key not in _RECORD_ATTRIBUTES
+        )
+
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+
+        return json.dumps(entry, default=str)
+
+
+class _QueueHandler(QueueHandler):
+    """A queue handler keeping records intact for the JSON formatter."""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+def setup_logging() -> QueueListener:
+    """A function routing all logs through a queue to a JSON stream.
+
+    Records are filtered and tagged on the caller's side, while
+    formatting and the write to stdout happen in the listener thread, so
+    the event loop never blocks on log I/O.
+
+    Returns:
+        QueueListener: The started listener, to be stopped on shutdown.
+    """
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+
+    handler = _QueueHandler(log_queue)
+    handler.addFilter(RequestContextFilter())
+    handler.addFilter(SamplingFilter())
+
+    root = logging.getLogger()
+    root.handlers[:] = [handler]
+    root.setLevel(config.LOG_LEVEL)
+
+    for name in ("uvicorn", "uvicorn.error", "uvicorn.access"):
+        uvicorn_logger = logging.getLogger(name)
+        uvicorn_logger.handlers.clear()
+        uvicorn_logger.propagate = True
+
+    # Replaced by the sampled, correlated `src.access` records.
+    logging.getLogger("uvicorn.access").disabled = True
+
+    logging.getLogger("databases").setLevel(
+        "DEBUG" if config.TEST_MODE and config.DB_ECHO
+        else config.LOG_SQL_LEVEL,
+    )
+
+    output = logging.StreamHandler(sys.stdout)
+    output.setFormatter(JsonFormatter())
+
+    listener = QueueListener(log_queue, output, respect_handler_level=True)
+    listener.start()
+
+    return listener
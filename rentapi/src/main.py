@@ -1,33 +1,108 @@
 """Main module of the app"""
 
+import asyncio
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
 from fastapi import FastAPI, HTTPException, Request, Response
 from fastapi.exception_handlers import http_exception_handler
+from fastapi.responses import JSONResponse, ORJSONResponse
+from prometheus_client import REGISTRY
 
 from src.api.routers.car import router as car_router
+from src.api.routers.health import router as health_router
+from src.api.routers.metrics import router as metrics_router
+from src.api.routers.payment import router as payment_router
+from src.api.routers.reservation import router as reservation_router
+from src.api.routers.review import router as review_router
 from src.api.routers.user import router as user_router
+from src.api.utils.compression import CompressionMiddleware
+from src.api.utils.request_id import RequestIdMiddleware
+from src.api.utils.timing import TimingMiddleware
+from src.config import config
 from src.container import Container
-from src.db import database, init_db
+from src.db import database, pool_collector, wait_for_db
+from src.infrastructure.cache.collector import CacheCollector
+from src.infrastructure.utils.token import decoded_tokens
+from src.infrastructure.workers.metrics import (
+    MetricsPublisher,
+    is_multiprocess,
+)
+from src.log import setup_logging
+from src.pool import PoolTimeoutError
+from src.infrastructure.utils.password import (
+    PasswordHasherBusyError,
+    shutdown_password_executor,
+)
 
 container = Container()
 container.wire(modules=[
     "src.api.routers.car",
+    "src.api.routers.payment",
+    "src.api.routers.reservation",
+    "src.api.routers.review",
     "src.api.routers.user",
+    "src.api.utils.auth",
     ])
 
+cache_collector = CacheCollector({
+    "car": lambda: container.car_cache().stats(),
+    "token": decoded_tokens.stats,
+})
+REGISTRY.register(cache_collector)
+
 @asynccontextmanager
-async def lifespan(_: FastAPI) -> AsyncGenerator:
+async def lifespan(application: FastAPI) -> AsyncGenerator:
     """Lifespan function working on app startup."""
-    await init_db()
-    await database.connect()
+    listener = setup_logging()
+    application.state.ready = False
+    container.pricing_engine()
+    await wait_for_db()
+    stop = asyncio.Event()
+    workers = []
+    if config.OUTBOX_DISPATCHER_ENABLED:
+        workers.append(asyncio.create_task(
+            container.outbox_dispatcher().run(stop),
+        ))
+    if config.LIFECYCLE_SCHEDULER_ENABLED:
+        workers.append(asyncio.create_task(
+            container.lifecycle_scheduler().run(stop),
+        ))
+    if config.METRICS_ENABLED and is_multiprocess():
+        workers.append(asyncio.create_task(MetricsPublisher(
+            [pool_collector, cache_collector],
+            config.METRICS_PUBLISH_INTERVAL,
+        ).run(stop)))
+    application.state.ready = True
     yield
+    application.state.ready = False
+    stop.set()
+    await asyncio.gather(*workers)
     await database.disconnect()
+    await container.payment_gateway().aclose()
+    shutdown_password_executor()
+    listener.stop()
 
-app = FastAPI(lifespan=lifespan)
+app = FastAPI(lifespan=lifespan, default_response_class=ORJSONResponse)
 app.include_router(car_router, prefix="/car")
+app.include_router(reservation_router, prefix="/reservation")
+app.include_router(review_router, prefix="/review")
+app.include_router(payment_router, prefix="/payment")
 app.include_router(user_router, prefix="")
+app.include_router(metrics_router, prefix="")
+app.include_router(health_router, prefix="")
+
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=config.COMPRESSION_MINIMUM_SIZE,
+    gzip_level=config.COMPRESSION_GZIP_LEVEL,
+    brotli_quality=config.COMPRESSION_BROTLI_QUALITY,
+)
+
+if config.METRICS_ENABLED:
+    app.add_middleware(TimingMiddleware)
+
+app.add_middleware(RequestIdMiddleware)
 
 @app.exception_handler(HTTPException)
 async def http_exception_handle_logging(
@@ -43,4 +118,27 @@ async def http_exception_handle_logging(
     Returns:
         Response: The HTTP response.
     """
-    return await http_exception_handler(request, exception)
\ No newline at end of file
+    return await http_exception_handler(request, exception)
+
+
+@app.exception_handler(PasswordHasherBusyError)
+@app.exception_handler(PoolTimeoutError)
+async def overload_handler(
+    _: Request,
+    exception: PasswordHasherBusyError | PoolTimeoutError,
+) -> Response:
+    """A function shedding load when a bounded resource is saturated.
+
+    Args:
+        _ (Request): The incoming HTTP request.
+        exception (PasswordHasherBusyError | PoolTimeoutError): A related
+            exception.
+
+    Returns:
+        Response: The 503 HTTP response.
+    """
+    return JSONResponse(
+        status_code=503,
+        content={"detail": str(exception)},
+        headers={"Retry-After": "1"},
+    )
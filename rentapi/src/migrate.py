@@ -0,0 +1,51 @@
+"""A module running schema migrations.
+
+The schema is managed by Alembic and upgraded once per deploy, before
+any worker starts:
+
+    python -m src.migrate upgrade head
+
+Databases created before the migrations existed, by the app's former
+`metadata.create_all`, are adopted by the same command: the baseline
+revision only creates the tables and indexes they lack and adds the
+unique constraint on `cars.registration_number`, refusing to run while
+registration numbers are duplicated. Stamping skips all of that, so
+`python -m src.migrate stamp 0001` is only for a database known to
+match the baseline exactly.
+
+Any other Alembic command works the same way, e.g.
+`python -m src.migrate revision --autogenerate -m "add column"`.
+"""
+
+import os
+import sys
+
+from alembic.config import CommandLine, Config
+
+SCRIPT_LOCATION = os.path.join(os.path.dirname(__file__), "migrations")
+
+
+def main(argv: list[str] | None = None) -> None:
+    """A function running an Alembic command against the app database.
+
+    The configuration is built in code, so no `alembic.ini` has to ship
+    with the app.
+
+    Args:
+        argv (list[str] | None, optional): Alembic command line
+            arguments. Defaults to `sys.argv[1:]`.
+    """
+
+    cli = CommandLine(prog="python -m src.migrate")
+    options = cli.parser.parse_args(sys.argv[1:] if argv is None else argv)
+
+    if not hasattr(options, "cmd"):
+        cli.parser.error("too few arguments")
+
+    alembic_config = Config(cmd_opts=options)
+    alembic_config.set_main_option("script_location", SCRIPT_LOCATION)
+    cli.run_cmd(alembic_config, options)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""Alembic environment running migrations over asyncpg."""
+
+import asyncio
+import logging
+
+from alembic import context
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import NullPool
+
+from src.db import db_uri, metadata
+
+logging.basicConfig(level=logging.INFO, format="%(levelname)s %(message)s")
+
+
+def run_migrations_offline() -> None:
+    """Emit the migration SQL without connecting to the database."""
+
+    context.configure(
+        url=db_uri,
+        target_metadata=metadata,
+        literal_binds=True,
+        dialect_opts={"paramstyle": "named"},
+    )
+
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def do_run_migrations(connection: Connection) -> None:
+    """Run the migrations over an open connection."""
+
+    context.configure(connection=connection, target_metadata=metadata)
+
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+async def run_migrations_online() -> None:
+    """Run the migrations over a single unpooled connection."""
+
+    engine = create_async_engine(db_uri, poolclass=NullPool)
+
+    try:
+        async with engine.connect() as connection:
+            await connection.run_sync(do_run_migrations)
+    finally:
+        await engine.dispose()
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    asyncio.run(run_migrations_online())
@@ -0,0 +1,269 @@
+"""Initial schema: cars, users and reservations.
+
+Databases created by the app's former `metadata.create_all` already
+have some of these tables. They are kept with their rows, and only the
+missing tables, indexes and the unique registration constraint are
+created, so `upgrade head` adopts them. Adopted tables are marked with a
+comment, and downgrading leaves them in place.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-18 00:00:00
+"""
+
+from alembic import context, op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+ADOPTED = "Adopted by revision 0001."
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute("CREATE EXTENSION IF NOT EXISTS btree_gist")
+    existing = _existing_tables()
+
+    for table in existing & {"cars", "users", "reservations"}:
+        op.create_table_comment(table, ADOPTED)
+
+    if "cars" in existing:
+        _ensure_unique_registration()
+    else:
+        op.create_table(
+            "cars",
+            sa.Column("id", sa.Integer, primary_key=True),
+            sa.Column("brand", sa.String),
+            sa.Column("model", sa.String),
+            sa.Column("year", sa.String),
+            sa.Column("price_per_day", sa.Float),
+            sa.Column("registration_number", sa.String, unique=True),
+            sa.Column("mileage", sa.Integer, nullable=True),
+            sa.Column("fuel_type", sa.String, nullable=True),
+            sa.Column("gearbox", sa.String, nullable=True),
+            sa.Column("seats", sa.String, nullable=True),
+            sa.Column("description", sa.String, nullable=True),
+        )
+    op.create_index(
+        "ix_cars_fuel_type",
+        "cars",
+        ["fuel_type"],
+        if_not_exists=True,
+    )
+    op.create_index(
+        "ix_cars_gearbox",
+        "cars",
+        ["gearbox"],
+        if_not_exists=True,
+    )
+    op.create_index(
+        "ix_cars_seats",
+        "cars",
+        ["seats"],
+        if_not_exists=True,
+    )
+    op.create_index(
+        "ix_cars_year_id",
+        "cars",
+        ["year", "id"],
+        if_not_exists=True,
+    )
+    op.create_index(
+        "ix_cars_price_per_day_id",
+        "cars",
+        ["price_per_day", "id"],
+        if_not_exists=True,
+    )
+    op.create_index(
+        "ix_cars_brand_trgm",
+        "cars",
+        ["brand"],
+        postgresql_using="gin",
+        postgresql_ops={"brand": "gin_trgm_ops"},
+        if_not_exists=True,
+    )
+    op.create_index(
+        "ix_cars_model_trgm",
+        "cars",
+        ["model"],
+        postgresql_using="gin",
+        postgresql_ops={"model": "gin_trgm_ops"},
+        if_not_exists=True,
+    )
+
+    if "users" not in existing:
+        op.create_table(
+            "users",
+            sa.Column(
+                "id",
+                postgresql.UUID(as_uuid=True),
+                primary_key=True,
+                server_default=sa.text("gen_random_uuid()"),
+            ),
+            sa.Column("email", sa.String, unique=True),
+            sa.Column("password", sa.String),
+        )
+
+    if "reservations" not in existing:
+        op.create_table(
+            "reservations",
+            sa.Column("id", sa.Integer, primary_key=True),
+            sa.Column(
+                "user_id",
+                postgresql.UUID(as_uuid=True),
+                sa.ForeignKey("users.id"),
+                nullable=False,
+            ),
+            sa.Column(
+                "car_id",
+                sa.Integer,
+                sa.ForeignKey("cars.id"),
+                nullable=False,
+            ),
+            sa.Column("payment_id", sa.Integer, nullable=True),
+            sa.Column(
+                "reservation_start",
+                sa.DateTime(timezone=True),
+                nullable=False,
+            ),
+            sa.Column(
+                "reservation_end",
+                sa.DateTime(timezone=True),
+                nullable=False,
+            ),
+            sa.Column(
+                "period",
+                postgresql.TSTZRANGE,
+                sa.Computed(
+                    "tstzrange(reservation_start, reservation_end, '[)')",
+                    persisted=True,
+                ),
+            ),
+            sa.Column(
+                "status",
+                sa.String,
+                nullable=False,
+                server_default="Pending Payment",
+            ),
+            sa.Column("total_price", sa.Float, nullable=False),
+            sa.Column(
+                "created_at",
+                sa.DateTime(timezone=True),
+                server_default=sa.func.now(),
+            ),
+            sa.CheckConstraint(
+                "reservation_end > reservation_start",
+                name="ck_reservations_period",
+            ),
+            postgresql.ExcludeConstraint(
+                ("car_id", "="),
+                ("period", "&&"),
+                name="ex_reservations_car_period",
+                using="gist",
+                where=sa.text("status <> 'Cancelled'"),
+            ),
+        )
+
+
+def downgrade() -> None:
+    adopted = _adopted_tables()
+
+    for table in ("reservations", "users", "cars"):
+        if table in adopted:
+            op.drop_table_comment(table, existing_comment=ADOPTED)
+        else:
+            op.drop_table(table)
+
+    if "cars" in adopted:
+        for index in _CAR_INDEXES:
+            op.drop_index(index, table_name="cars", if_exists=True)
+
+
+_CAR_INDEXES = (
+    "ix_cars_fuel_type",
+    "ix_cars_gearbox",
+    "ix_cars_seats",
+    "ix_cars_year_id",
+    "ix_cars_price_per_day_id",
+    "ix_cars_brand_trgm",
+    "ix_cars_model_trgm",
+)
+
+
+def _existing_tables() -> set[str]:
+    """A function listing the tables already in the database.
+
+    Returns:
+        set[str]: The table names, empty when rendering SQL offline.
+    """
+
+    if context.is_offline_mode():
+        return set()
+
+    return set(sa.inspect(op.get_bind()).get_table_names())
+
+
+def _adopted_tables() -> set[str]:
+    """A function listing the tables adopted rather than created.
+
+    Returns:
+        set[str]: The table names, empty when rendering SQL offline.
+    """
+
+    if context.is_offline_mode():
+        return set()
+
+    inspector = sa.inspect(op.get_bind())
+
+    return {
+        table
+        for table in inspector.get_table_names()
+        if inspector.get_table_comment(table).get("text") == ADOPTED
+    }
+
+
+def _ensure_unique_registration() -> None:
+    """A function adding the unique registration constraint to `cars`.
+
+    The former `create_all` made the column without it, while imports
+    upsert on it and new cars rely on it to reject duplicates.
+
+    Raises:
+        RuntimeError: If registration numbers are already duplicated.
+    """
+
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    unique = [
+        constraint["column_names"]
+        for constraint in inspector.get_unique_constraints("cars")
+    ] + [
+        index["column_names"]
+        for index in inspector.get_indexes("cars")
+        if index["unique"]
+    ]
+    if ["registration_number"] in unique:
+        return
+
+    duplicates = bind.execute(sa.text(
+        "SELECT registration_number FROM cars "
+        "WHERE registration_number IS NOT NULL "
+        "GROUP BY registration_number HAVING count(*) > 1 "
+        "ORDER BY registration_number LIMIT 10"
+    )).scalars().all()
+    if duplicates:
+        raise RuntimeError(
+            "cannot adopt the cars table: registration numbers "
+            f"{', '.join(duplicates)} are used by several cars; make them "
+            "unique and run the upgrade again"
+        )
+
+    op.create_unique_constraint(
+        "cars_registration_number_key",
+        "cars",
+        ["registration_number"],
+    )
@@ -0,0 +1,35 @@
+"""Track a version and modification time per car.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18 00:00:00
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "cars",
+        sa.Column("version", sa.Integer, nullable=False, server_default="1"),
+    )
+    op.add_column(
+        "cars",
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.func.now(),
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("cars", "updated_at")
+    op.drop_column("cars", "version")
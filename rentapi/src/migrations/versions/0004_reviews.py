@@ -0,0 +1,85 @@
+"""Add reviews and per-car review aggregates.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-18 00:00:00
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision = "0004"
+down_revision = "0003"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "reviews",
+        sa.Column("id", sa.Integer, primary_key=True),
+        sa.Column(
+            "user_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("users.id", ondelete="SET NULL"),
+            nullable=True,
+        ),
+        sa.Column(
+            "car_id",
+            sa.Integer,
+            sa.ForeignKey("cars.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column(
+            "reservation_id",
+            sa.Integer,
+            sa.ForeignKey("reservations.id", ondelete="SET NULL"),
+            nullable=True,
+            unique=True,
+        ),
+        sa.Column("body", sa.String, nullable=False),
+        sa.Column("rating", sa.SmallInteger, nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+        ),
+        sa.CheckConstraint(
+            "rating BETWEEN 1 AND 5",
+            name="ck_reviews_rating",
+        ),
+    )
+    op.create_index("ix_reviews_car_id_id", "reviews", ["car_id", "id"])
+    op.create_index("ix_reviews_user_id_id", "reviews", ["user_id", "id"])
+
+    op.create_table(
+        "car_review_stats",
+        sa.Column(
+            "car_id",
+            sa.Integer,
+            sa.ForeignKey("cars.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column(
+            "review_count",
+            sa.Integer,
+            nullable=False,
+            server_default="0",
+        ),
+        sa.Column("rating_sum", sa.Integer, nullable=False, server_default="0"),
+        *(
+            sa.Column(
+                f"rating_{rating}",
+                sa.Integer,
+                nullable=False,
+                server_default="0",
+            )
+            for rating in range(1, 6)
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("car_review_stats")
+    op.drop_table("reviews")
@@ -0,0 +1,75 @@
+"""Add payments referenced by reservations.
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-18 00:00:00
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision = "0005"
+down_revision = "0004"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "payments",
+        sa.Column("id", sa.Integer, primary_key=True),
+        sa.Column(
+            "reservation_id",
+            sa.Integer,
+            sa.ForeignKey("reservations.id", ondelete="SET NULL"),
+            nullable=True,
+        ),
+        sa.Column(
+            "user_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("users.id"),
+            nullable=False,
+        ),
+        sa.Column("price", sa.Float, nullable=False),
+        sa.Column(
+            "status",
+            sa.String,
+            nullable=False,
+            server_default="Pending",
+        ),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+        ),
+    )
+    op.create_index(
+        "ix_payments_reservation_id",
+        "payments",
+        ["reservation_id"],
+    )
+
+    # Reservations written before this revision may carry ids of payments
+    # that were never stored.
+    op.execute(
+        "UPDATE reservations SET payment_id = NULL "
+        "WHERE payment_id IS NOT NULL"
+    )
+    op.create_foreign_key(
+        "fk_reservations_payment_id",
+        "reservations",
+        "payments",
+        ["payment_id"],
+        ["id"],
+        ondelete="SET NULL",
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint(
+        "fk_reservations_payment_id",
+        "reservations",
+        type_="foreignkey",
+    )
+    op.drop_table("payments")
@@ -0,0 +1,33 @@
+"""Reference gateway charges and allow one open payment per reservation.
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-18 00:00:00
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0006"
+down_revision = "0005"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "payments",
+        sa.Column("gateway_id", sa.String, nullable=True),
+    )
+    op.create_index(
+        "ux_payments_reservation_open",
+        "payments",
+        ["reservation_id"],
+        unique=True,
+        postgresql_where=sa.text("status <> 'Failed'"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ux_payments_reservation_open", table_name="payments")
+    op.drop_column("payments", "gateway_id")
@@ -0,0 +1,52 @@
+"""Schedule automatic reservation status transitions.
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-18 00:00:00
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0008"
+down_revision = "0007"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "reservations",
+        sa.Column(
+            "next_transition_at",
+            sa.DateTime(timezone=True),
+            nullable=True,
+        ),
+    )
+    # Unpaid holds get the default RESERVATION_HOLD_TTL.
+    op.execute(
+        """
+        UPDATE reservations SET next_transition_at = CASE status
+            WHEN 'Pending Payment' THEN LEAST(
+                created_at + interval '900 seconds',
+                reservation_start
+            )
+            WHEN 'Confirmed' THEN reservation_start
+            WHEN 'In Progress' THEN reservation_end
+        END
+        """
+    )
+    op.create_index(
+        "ix_reservations_next_transition_at",
+        "reservations",
+        ["next_transition_at"],
+        postgresql_where=sa.text("next_transition_at IS NOT NULL"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_reservations_next_transition_at",
+        table_name="reservations",
+    )
+    op.drop_column("reservations", "next_transition_at")
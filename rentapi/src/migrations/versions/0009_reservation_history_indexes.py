@@ -0,0 +1,39 @@
+"""Index reservation histories of users and cars.
+
+Revision ID: 0009
+Revises: 0008
+Create Date: 2026-10-18 00:00:00
+"""
+
+from alembic import op
+
+revision = "0009"
+down_revision = "0008"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_reservations_user_id_start_id",
+        "reservations",
+        ["user_id", "reservation_start", "id"],
+        postgresql_include=["status"],
+    )
+    op.create_index(
+        "ix_reservations_car_id_start_id",
+        "reservations",
+        ["car_id", "reservation_start", "id"],
+        postgresql_include=["status"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_reservations_car_id_start_id",
+        table_name="reservations",
+    )
+    op.drop_index(
+        "ix_reservations_user_id_start_id",
+        table_name="reservations",
+    )
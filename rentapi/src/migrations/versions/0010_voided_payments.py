@@ -0,0 +1,36 @@
+"""Leave voided payments out of the open payment of a reservation.
+
+Revision ID: 0010
+Revises: 0009
+Create Date: 2026-10-18 00:00:00
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0010"
+down_revision = "0009"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.drop_index("ux_payments_reservation_open", table_name="payments")
+    op.create_index(
+        "ux_payments_reservation_open",
+        "payments",
+        ["reservation_id"],
+        unique=True,
+        postgresql_where=sa.text("status NOT IN ('Failed', 'Voided')"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ux_payments_reservation_open", table_name="payments")
+    op.create_index(
+        "ux_payments_reservation_open",
+        "payments",
+        ["reservation_id"],
+        unique=True,
+        postgresql_where=sa.text("status <> 'Failed'"),
+    )
@@ -0,0 +1,43 @@
+"""Keep idempotency keys of deleted reservations.
+
+Revision ID: 0011
+Revises: 0010
+Create Date: 2026-10-18 00:00:00
+"""
+
+from alembic import op
+
+revision = "0011"
+down_revision = "0010"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    _replace_reservation_fk("SET NULL")
+
+
+def downgrade() -> None:
+    _replace_reservation_fk("CASCADE")
+
+
+def _replace_reservation_fk(ondelete: str) -> None:
+    """A function recreating the reference to the reservation.
+
+    Args:
+        ondelete (str): The action on a deleted reservation.
+    """
+
+    op.drop_constraint(
+        "idempotency_keys_reservation_id_fkey",
+        "idempotency_keys",
+        type_="foreignkey",
+    )
+    op.create_foreign_key(
+        "idempotency_keys_reservation_id_fkey",
+        "idempotency_keys",
+        "reservations",
+        ["reservation_id"],
+        ["id"],
+        ondelete=ondelete,
+    )
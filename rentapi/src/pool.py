@@ -0,0 +1,214 @@
+"""A module providing the tuned asyncpg connection pool backend."""
+
+import time
+from contextlib import contextmanager
+from typing import Any, AsyncGenerator, Iterator
+
+from databases import Database
+from databases.backends.postgres import PostgresBackend, PostgresConnection
+from prometheus_client import Counter, Histogram
+from prometheus_client.core import GaugeMetricFamily
+from prometheus_client.registry import Collector
+from sqlalchemy.sql import ClauseElement
+
+from src.infrastructure.utils.timing import record_query
+
+POOL_ACQUIRE_WAIT = Histogram(
+    "db_pool_acquire_wait_seconds",
+    "Time spent waiting for a connection from the pool.",
+    buckets=(.0005, .001, .005, .01, .025, .05, .1, .25, .5, 1, 2.5, 5),
+)
+QUERY_DURATION = Histogram(
+    "db_query_duration_seconds",
+    "Time spent executing DB queries.",
+    buckets=(.0005, .001, .0025, .005, .01, .025, .05, .1, .25, .5, 1),
+)
+POOL_ACQUIRE_TIMEOUTS = Counter(
+    "db_pool_acquire_timeouts",
+    "Connection acquisitions that exceeded the acquire timeout.",
+)
+
+
+class PoolTimeoutError(TimeoutError):
+    """Raised when no pooled connection became free in time."""
+
+
+class TunedPostgresBackend(PostgresBackend):
+    """An asyncpg backend with acquire timeout and saturation tracking."""
+
+    def __init__(
+            self,
+            database_url: Any,
+            acquire_timeout: float | None = None,
+            **options: Any,
+    ) -> None:
+        """The initializer of the `tuned backend`.
+
+        Args:
+            database_url (Any): The URL of the database.
+            acquire_timeout (float | None): Seconds to wait for a connection.
+            **options (Any): Options passed to `asyncpg.create_pool`.
+        """
+
+        super().__init__(database_url, **options)
+        self.acquire_timeout = acquire_timeout
+        self.waiting = 0
+
+    def connection(self) -> "TunedPostgresConnection":
+        return TunedPostgresConnection(self, self._dialect)
+
+
+class TunedPostgresConnection(PostgresConnection):
+    """A connection acquiring from the pool with a bounded wait."""
+
+    _database: TunedPostgresBackend
+
+    async def acquire(self) -> None:
+        """The method acquiring a pooled connection.
+
+        Raises:
+            PoolTimeoutError: If the pool stays saturated past the timeout.
+        """
+
+        assert self._connection is None, "Connection is already acquired"
+        assert self._database._pool is not None, "DatabaseBackend is not running"
+
+        backend = self._database
+        backend.waiting += 1
+        started = time.perf_counter()
+
+        try:
+            self._connection = await backend._pool.acquire(
+                timeout=backend.acquire_timeout,
+            )
+        except TimeoutError as e:
+            POOL_ACQUIRE_TIMEOUTS.inc()
+            raise PoolTimeoutError("database connection pool exhausted") from e
+        finally:
+            backend.waiting -= 1
+            POOL_ACQUIRE_WAIT.observe(time.perf_counter() - started)
+
+    async def fetch_all(self, query: ClauseElement) -> Any:
+        started = time.perf_counter()
+        try:
+            return await super().fetch_all(query)
+        finally:
+            _observe_query(started)
+
+    async def fetch_one(self, query: ClauseElement) -> Any:
+        started = time.perf_counter()
+        try:
+            return await super().fetch_one(query)
+        finally:
+            _observe_query(started)
+
+    async def execute(self, query: ClauseElement) -> Any:
+        started = time.perf_counter()
+        try:
+            return await super().execute(query)
+        finally:
+            _observe_query(started)
+
+    async def execute_many(self, queries: list[ClauseElement]) -> None:
+        started = time.perf_counter()
+        try:
+            await super().execute_many(queries)
+        finally:
+            _observe_query(started)
+
+    async def iterate(
+            self,
+            query: ClauseElement,
+    ) -> AsyncGenerator[Any, None]:
+        started = time.perf_counter()
+        try:
+            async for record in super().iterate(query):
+                yield record
+        finally:
+            _observe_query(started)
+
+
+@contextmanager
+def observed_query() -> Iterator[None]:
+    """A context manager recording a raw asyncpg call as a query.
+
+    Calls made on `raw_connection`, such as the COPY paths, bypass the
+    `databases` API timed above and are wrapped in this instead.
+    """
+
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        _observe_query(started)
+
+
+def _observe_query(started: float) -> None:
+    """A function recording a finished query in metrics and the request.
+
+    Args:
+        started (float): The `perf_counter` value when the query began.
+    """
+
+    duration = time.perf_counter() - started
+    QUERY_DURATION.observe(duration)
+    record_query(duration)
+
+
+class TunedDatabase(Database):
+    """The application database using the tuned asyncpg backend."""
+
+    SUPPORTED_BACKENDS = {
+        **Database.SUPPORTED_BACKENDS,
+        "postgresql": "src.pool:TunedPostgresBackend",
+        "postgres": "src.pool:TunedPostgresBackend",
+    }
+
+    def pool_stats(self) -> dict[str, int]:
+        """The method reporting the pool saturation.
+
+        Returns:
+            dict[str, int]: The pool sizes and number of waiting acquirers.
+        """
+
+        backend = self._backend
+        pool = getattr(backend, "_pool", None)
+
+        if pool is None:
+            return {}
+
+        return {
+            "size": pool.get_size(),
+            "idle": pool.get_idle_size(),
+            "in_use": pool.get_size() - pool.get_idle_size(),
+            "min_size": pool.get_min_size(),
+            "max_size": pool.get_max_size(),
+            "waiting": getattr(backend, "waiting", 0),
+        }
+
+
+class PoolCollector(Collector):
+    """A Prometheus collector exporting the pool saturation gauges."""
+
+    def __init__(self, database: TunedDatabase) -> None:
+        """The initializer of the `pool collector`.
+
+        Args:
+            database (TunedDatabase): The observed database.
+        """
+
+        self._database = database
+
+    def collect(self) -> Any:
+        """The method yielding the current pool gauges.
+
+        Yields:
+            GaugeMetricFamily: One gauge per pool statistic.
+        """
+
+        for name, value in self._database.pool_stats().items():
+            yield GaugeMetricFamily(
+                f"db_pool_{name}",
+                f"Connection pool {name.replace('_', ' ')}.",
+                value=value,
+            )
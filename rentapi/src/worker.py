@@ -0,0 +1,41 @@
+"""Entry point of a background worker.
+
+Runs the outbox dispatcher and the reservation lifecycle scheduler
+without serving HTTP, so background work is processed apart from the
+API and scales by starting more workers:
+
+    python -m src.worker
+"""
+
+import asyncio
+import signal
+
+from src.container import Container
+from src.db import database, wait_for_db
+from src.log import setup_logging
+
+
+async def main() -> None:
+    """The function running the worker until SIGINT or SIGTERM."""
+    listener = setup_logging()
+    container = Container()
+    stop = asyncio.Event()
+
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(signum, stop.set)
+
+    await wait_for_db()
+    try:
+        await asyncio.gather(
+            container.outbox_dispatcher().run(stop),
+            container.lifecycle_scheduler().run(stop),
+        )
+    finally:
+        await database.disconnect()
+        await container.payment_gateway().aclose()
+        listener.stop()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
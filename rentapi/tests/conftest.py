@@ -0,0 +1,283 @@
+"""Fixtures shared by the test suite."""
+
+import sys
+from contextlib import asynccontextmanager
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Any, AsyncIterator, Callable, Iterator
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.dialects import postgresql
+
+import src.db
+from src.api.utils.auth import get_current_user
+from src.infrastructure.dto.userdto import UserDTO
+from src.infrastructure.payments.http import HttpPaymentGateway
+from src.main import app, container
+
+
+class Row(dict):
+    """A result row readable by column name, attribute and `_mapping`."""
+
+    def __getattr__(self, name: str) -> Any:
+        try:
+            return self[name]
+        except KeyError as e:
+            raise AttributeError(name) from e
+
+    @property
+    def _mapping(self) -> "Row":
+        return self
+
+
+class RecordingRawConnection:
+    """An asyncpg connection recording the calls of the COPY paths."""
+
+    calls: list[tuple[str, Any]]
+    copy_output: list[bytes]
+
+    def __init__(self) -> None:
+        self.calls = []
+        self.copy_output = []
+
+    async def execute(self, query: str, *args: Any) -> str:
+        self.calls.append(("execute", query))
+        return "INSERT 0 0"
+
+    async def copy_records_to_table(
+            self,
+            table_name: str,
+            *,
+            records: list,
+            **kwargs: Any,
+    ) -> str:
+        self.calls.append(("copy_records_to_table", records))
+        return f"COPY {len(records)}"
+
+    async def copy_from_query(
+            self,
+            query: str,
+            *args: Any,
+            output: Callable,
+            **kwargs: Any,
+    ) -> str:
+        self.calls.append(("copy_from_query", query))
+        for chunk in self.copy_output:
+            await output(chunk)
+        return f"COPY {len(self.copy_output)}"
+
+
+class RecordingConnection:
+    """A `databases` connection exposing a recording raw connection."""
+
+    def __init__(self, raw_connection: RecordingRawConnection) -> None:
+        self.raw_connection = raw_connection
+
+    async def __aenter__(self) -> "RecordingConnection":
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        return None
+
+    @asynccontextmanager
+    async def transaction(self) -> AsyncIterator[None]:
+        yield
+
+
+class RecordingDatabase:
+    """A database recording every statement sent to the server.
+
+    Each statement is answered by `responder(sql, kind)`, where `kind` is
+    the name of the called method, so tests can count round-trips
+    without a running server. The bound values of every statement are
+    kept in `parameters`.
+    """
+
+    statements: list[str]
+    parameters: list[dict[str, Any]]
+    responder: Callable[[str, str], Any]
+    raw_connection: RecordingRawConnection
+
+    def __init__(self) -> None:
+        self.statements = []
+        self.parameters = []
+        self.responder = lambda sql, kind: None
+        self.raw_connection = RecordingRawConnection()
+
+    def connection(self) -> RecordingConnection:
+        return RecordingConnection(self.raw_connection)
+
+    async def fetch_all(self, query: Any, values: Any = None) -> list:
+        return self._run(query, "fetch_all") or []
+
+    async def fetch_one(self, query: Any, values: Any = None) -> Any:
+        return self._run(query, "fetch_one")
+
+    async def fetch_val(
+            self,
+            query: Any,
+            values: Any = None,
+            column: Any = 0,
+    ) -> Any:
+        return self._run(query, "fetch_val")
+
+    async def execute(self, query: Any, values: Any = None) -> Any:
+        return self._run(query, "execute")
+
+    async def iterate(self, query: Any, values: Any = None) -> AsyncIterator:
+        for row in self._run(query, "iterate") or []:
+            yield row
+
+    @asynccontextmanager
+    async def transaction(self) -> AsyncIterator[None]:
+        yield
+
+    def _run(self, query: Any, kind: str) -> Any:
+        if isinstance(query, str):
+            sql, parameters = query, {}
+        else:
+            compiled = query.compile(dialect=postgresql.dialect())
+            sql, parameters = str(compiled), compiled.params
+        self.statements.append(sql)
+        self.parameters.append(parameters)
+
+        return self.responder(sql, kind)
+
+
+@pytest.fixture
+def database(monkeypatch: pytest.MonkeyPatch) -> RecordingDatabase:
+    """A recording database installed in every module using `database`."""
+
+    recording = RecordingDatabase()
+    original = src.db.database
+
+    for name, module in list(sys.modules.items()):
+        if (
+            name.startswith("src.")
+            and getattr(module, "database", None) is original
+        ):
+            monkeypatch.setattr(module, "database", recording)
+
+    return recording
+
+
+@pytest.fixture
+def client(database: RecordingDatabase) -> TestClient:
+    """A client of the app without its lifespan, backed by `database`."""
+
+    container.reset_singletons()
+
+    return TestClient(app)
+
+
+@pytest.fixture
+def user() -> Iterator[UserDTO]:
+    """The user every request of `client` is authenticated as."""
+
+    current = UserDTO(id=uuid.uuid4(), email="driver@example.com")
+    app.dependency_overrides[get_current_user] = lambda: current
+
+    yield current
+
+    app.dependency_overrides.pop(get_current_user, None)
+
+
+def payment_gateway(transport: httpx.AsyncBaseTransport) -> HttpPaymentGateway:
+    """A function building a gateway client without retries.
+
+    Args:
+        transport (httpx.AsyncBaseTransport): The transport replacing the
+            network.
+
+    Returns:
+        HttpPaymentGateway: The client.
+    """
+
+    return HttpPaymentGateway(
+        base_url="http://payment-gateway",
+        api_key=None,
+        timeout=1.0,
+        connect_timeout=1.0,
+        retries=1,
+        base_delay=0.0,
+        max_delay=0.0,
+        max_connections=1,
+        transport=transport,
+    )
+
+
+def car_row(car_id: int = 1, **values: Any) -> Row:
+    """A function building a `cars` row.
+
+    Args:
+        car_id (int): The id of the car.
+        **values (Any): The columns to override.
+
+    Returns:
+        Row: The row.
+    """
+
+    return Row({
+        "id": car_id,
+        "brand": "Skoda",
+        "model": "Octavia",
+        "year": "2021",
+        "price_per_day": 150.0,
+        "registration_number": f"WA{car_id:05d}",
+        "mileage": None,
+        "fuel_type": None,
+        "gearbox": None,
+        "seats": None,
+        "description": None,
+        "version": 1,
+        "updated_at": datetime(2026, 1, 1, tzinfo=timezone.utc),
+        **values,
+    })
+
+
+def reservation_row(
+        reservation_id: int = 1,
+        user_id: uuid.UUID | None = None,
+        status: str = "Pending Payment",
+        payment_status: str | None = None,
+) -> Row:
+    """A function building a reservation row joined with its relations.
+
+    Args:
+        reservation_id (int): The id of the reservation.
+        user_id (uuid.UUID | None): The id of the owner.
+        status (str): The status of the reservation.
+        payment_status (str | None): The status of the LEFT JOINed
+            payment, None if the reservation has none.
+
+    Returns:
+        Row: The row.
+    """
+
+    start = datetime(2026, 6, 1, tzinfo=timezone.utc)
+    user_id = user_id or uuid.uuid4()
+    paid = payment_status is not None
+    payment = {
+        "id": reservation_id if paid else None,
+        "reservation_id": reservation_id if paid else None,
+        "user_id": user_id if paid else None,
+        "price": 300.0 if paid else None,
+        "status": payment_status,
+        "gateway_id": None,
+        "created_at": start if paid else None,
+    }
+
+    return Row({
+        "id": reservation_id,
+        "reservation_start": start,
+        "reservation_end": start + timedelta(days=2),
+        "status": status,
+        "total_price": 300.0,
+        "created_at": start,
+        **{f"car__{k}": v for k, v in car_row(reservation_id).items()},
+        "user__id": user_id,
+        "user__email": "driver@example.com",
+        **{f"payment__{k}": v for k, v in payment.items()},
+    })
@@ -0,0 +1,92 @@
+"""Bulk import and export of cars over COPY."""
+
+from typing import Any
+
+import pytest
+from asyncpg.exceptions import InvalidColumnReferenceError
+from fastapi.testclient import TestClient
+from prometheus_client import REGISTRY
+
+from tests.conftest import RecordingDatabase
+
+HEADER = (
+    "brand,model,year,price_per_day,registration_number,"
+    "mileage,fuel_type,gearbox,seats,description"
+)
+
+
+def test_export_lets_asyncpg_build_the_copy(
+        client: TestClient,
+        database: RecordingDatabase,
+) -> None:
+    database.raw_connection.copy_output = [b"id,brand\n", b"1,Skoda\n"]
+    queries = REGISTRY.get_sample_value("db_query_duration_seconds_count")
+
+    response = client.get("/car/export")
+
+    assert response.status_code == 200
+    assert response.content == b"id,brand\n1,Skoda\n"
+    (kind, query), = database.raw_connection.calls
+    assert kind == "copy_from_query"
+    assert query.startswith("SELECT ")
+    assert REGISTRY.get_sample_value(
+        "db_query_duration_seconds_count",
+    ) == queries + 1
+
+
+def test_import_copies_the_spooled_upload(
+        client: TestClient,
+        database: RecordingDatabase,
+) -> None:
+    body = "\n".join([
+        HEADER,
+        "Skoda,Octavia,2021,150,WA00001,,,,,",
+        "Skoda,Fabia,2020,not-a-price,WA00002,,,,,",
+        "Kia,Ceed,2022,120.5,WA00003,1000,petrol,,,",
+    ])
+
+    response = client.post(
+        "/car/import",
+        content=body,
+        headers={"content-type": "text/csv"},
+    )
+
+    assert response.status_code == 200
+    assert response.json()["rejected"] == 1
+    copies = [
+        records for kind, records in database.raw_connection.calls
+        if kind == "copy_records_to_table"
+    ]
+    assert [car[4] for batch in copies for car in batch] == [
+        "WA00001",
+        "WA00003",
+    ]
+    assert copies[0][1][5] == 1000
+
+
+def test_import_without_unique_registrations_fails_loudly(
+        client: TestClient,
+        database: RecordingDatabase,
+        monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    raw = database.raw_connection
+    execute = raw.execute
+
+    async def merge(query: str, *args: Any) -> str:
+        if query.startswith("INSERT INTO cars"):
+            raise InvalidColumnReferenceError(
+                "there is no unique or exclusion constraint matching the "
+                "ON CONFLICT specification",
+            )
+        return await execute(query, *args)
+
+    monkeypatch.setattr(raw, "execute", merge)
+
+    response = client.post(
+        "/car/import",
+        content="\n".join([HEADER, "Skoda,Octavia,2021,150,WA00001,,,,,"]),
+        headers={"content-type": "text/csv"},
+    )
+
+    assert response.status_code == 503
+    assert "unique registration numbers" in response.json()["detail"]
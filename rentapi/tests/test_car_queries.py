@@ -0,0 +1,47 @@
+"""Round-trip counts of the car write endpoints."""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from tests.conftest import RecordingDatabase, car_row
+
+CAR = {
+    "brand": "Skoda",
+    "model": "Octavia",
+    "year": "2021",
+    "price_per_day": 150.0,
+    "registration_number": "WA00001",
+    "mileage": None,
+    "fuel_type": None,
+    "gearbox": None,
+    "seats": None,
+    "description": None,
+}
+
+
+@pytest.mark.parametrize(
+    ("method", "path", "body", "found", "status"),
+    [
+        ("POST", "/car/create", CAR, True, 201),
+        ("PUT", "/car/1", CAR, True, 201),
+        ("PUT", "/car/1", CAR, False, 404),
+        ("DELETE", "/car/1", None, True, 204),
+        ("DELETE", "/car/1", None, False, 404),
+    ],
+)
+def test_car_write_is_one_statement(
+        client: TestClient,
+        database: RecordingDatabase,
+        method: str,
+        path: str,
+        body: dict | None,
+        found: bool,
+        status: int,
+) -> None:
+    database.responder = lambda sql, kind: car_row() if found else None
+
+    response = client.request(method, path, json=body)
+
+    assert response.status_code == status
+    assert len(database.statements) == 1
+    assert "RETURNING" in database.statements[0]
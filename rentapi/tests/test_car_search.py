@@ -0,0 +1,36 @@
+"""Keyset pagination of the car search."""
+
+from fastapi.testclient import TestClient
+
+from tests.conftest import RecordingDatabase, car_row
+
+
+def test_sorted_search_skips_cars_without_sort_value(
+        client: TestClient,
+        database: RecordingDatabase,
+) -> None:
+    database.responder = lambda sql, kind: [
+        car_row(1, price_per_day=100.0),
+        car_row(2, price_per_day=120.0),
+    ]
+
+    first = client.get(
+        "/car/search",
+        params={"sort_by": "price_per_day", "limit": 1},
+    )
+    second = client.get(
+        "/car/search",
+        params={
+            "sort_by": "price_per_day",
+            "limit": 1,
+            "after": first.json()["next_cursor"],
+        },
+    )
+
+    assert first.status_code == 200
+    assert second.status_code == 200
+    assert all(
+        "cars.price_per_day IS NOT NULL" in sql
+        for sql in database.statements
+    )
+    assert "(cars.price_per_day, cars.id) >" in database.statements[1]
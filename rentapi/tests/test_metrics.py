@@ -0,0 +1,60 @@
+"""Metrics shared between the gunicorn workers."""
+
+from fastapi.testclient import TestClient
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily
+
+from src.infrastructure.workers.metrics import MetricsPublisher
+
+
+class PoolStub:
+    """A collector reporting fixed pool samples."""
+
+    def __init__(self) -> None:
+        self.size = 3
+
+    def collect(self):
+        size = GaugeMetricFamily(
+            "rentapi_stub_pool_size",
+            "Connections in the pool.",
+            labels=["pool"],
+        )
+        size.add_metric(["main"], self.size)
+        yield size
+
+        waits = CounterMetricFamily("rentapi_stub_pool_waits", "Waits.")
+        waits.add_metric([], 7)
+        yield waits
+
+
+def gauge_values(publisher: MetricsPublisher) -> dict:
+    """A function reading the published gauges by sample and labels."""
+
+    return {
+        (sample.name, tuple(sample.labels.items())): sample.value
+        for gauge in publisher._gauges.values()
+        for family in gauge.collect()
+        for sample in family.samples
+    }
+
+
+def test_publisher_mirrors_collector_samples() -> None:
+    stub = PoolStub()
+    publisher = MetricsPublisher([stub], interval=1)
+
+    publisher.publish()
+    stub.size = 5
+    publisher.publish()
+
+    assert gauge_values(publisher) == {
+        ("rentapi_stub_pool_size", (("pool", "main"),)): 5,
+        ("rentapi_stub_pool_waits_total", ()): 7,
+    }
+
+
+def test_metrics_endpoint_exports_default_registry(
+        client: TestClient,
+) -> None:
+    response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert "cache_entries" in response.text
@@ -0,0 +1,146 @@
+"""Payments arriving after the hold of their reservation expired."""
+
+import asyncio
+import uuid
+from typing import Iterator
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+from src.core.domain.payment import PaymentGatewayError, PaymentStatus
+from src.infrastructure.dto.userdto import UserDTO
+from src.infrastructure.payments.fake import create_fake_gateway
+from src.infrastructure.payments.http import HttpPaymentGateway
+from src.main import container
+from tests.conftest import (
+    RecordingDatabase,
+    Row,
+    payment_gateway,
+    reservation_row,
+)
+
+
+def fake_gateway() -> HttpPaymentGateway:
+    """A function building a client of the in-process stand-in."""
+
+    return payment_gateway(httpx.ASGITransport(app=create_fake_gateway()))
+
+
+@pytest.fixture
+def gateway() -> Iterator[None]:
+    """The stand-in gateway used by the payment service."""
+
+    with container.payment_gateway.override(fake_gateway()):
+        yield
+
+
+@pytest.mark.usefixtures("gateway")
+def test_payment_after_expired_hold_is_voided(
+        client: TestClient,
+        database: RecordingDatabase,
+        user: UserDTO,
+) -> None:
+    updates = iter([PaymentStatus.AUTHORIZED, PaymentStatus.VOIDED])
+
+    def payment(status: PaymentStatus) -> Row:
+        return Row(
+            id=3,
+            reservation_id=7,
+            user_id=user.id,
+            price=300.0,
+            status=status.value,
+            gateway_id="pi_fake_1",
+            created_at=None,
+        )
+
+    def respond(sql: str, kind: str) -> Row | None:
+        if sql.startswith("SELECT") and "FROM reservations" in sql:
+            return reservation_row(7, user.id)
+        if sql.startswith("INSERT INTO payments"):
+            return payment(PaymentStatus.PENDING)
+        if sql.startswith("UPDATE payments"):
+            return payment(next(updates))
+        return None
+
+    database.responder = respond
+
+    response = client.post(
+        "/payment/reservation/7",
+        json={"payment_method": "pm_card_visa"},
+    )
+
+    assert response.status_code == 409
+    assert database.statements[-1].startswith("INSERT INTO outbox")
+    assert "payment.void" in database.parameters[-1].values()
+
+
+def test_voided_charge_cannot_be_captured() -> None:
+    async def run() -> None:
+        gateway = fake_gateway()
+        charge = await gateway.authorize(
+            amount=300.0,
+            currency="pln",
+            payment_method="pm_card_visa",
+            idempotency_key="payment-1-authorize",
+        )
+
+        voided = await gateway.void(charge.id, "payment-1-void")
+
+        assert voided.status == PaymentStatus.VOIDED
+        with pytest.raises(PaymentGatewayError):
+            await gateway.capture(charge.id, "payment-1-capture")
+        await gateway.aclose()
+
+    asyncio.run(run())
+
+
+def test_captured_payment_after_expired_hold_is_refunded(
+        database: RecordingDatabase,
+) -> None:
+    def respond(sql: str, kind: str) -> Row | None:
+        if sql.startswith("UPDATE payments"):
+            return Row(
+                id=3,
+                reservation_id=7,
+                user_id=uuid.uuid4(),
+                price=300.0,
+                status=database.parameters[-1]["status"],
+                gateway_id="pi_fake_1",
+                created_at=None,
+            )
+        return None
+
+    database.responder = respond
+
+    payment = asyncio.run(container.payment_repository().update_payment(
+        3,
+        PaymentStatus.COMPLETED,
+        "pi_fake_1",
+    ))
+
+    assert payment.status == PaymentStatus.REFUNDED
+    assert "payment.refund" in database.parameters[-1].values()
+
+
+def test_captured_charge_is_refunded_once() -> None:
+    async def run() -> None:
+        gateway = fake_gateway()
+        charge = await gateway.authorize(
+            amount=300.0,
+            currency="pln",
+            payment_method="pm_card_visa",
+            idempotency_key="payment-1-authorize",
+        )
+        await gateway.capture(charge.id, "payment-1-capture")
+
+        refunded = await gateway.refund(charge.id, "payment-1-refund")
+        replayed = await gateway.refund(charge.id, "payment-1-refund")
+
+        assert refunded == replayed
+        assert refunded.status == PaymentStatus.REFUNDED
+        with pytest.raises(PaymentGatewayError):
+            await gateway.refund(charge.id, "payment-1-refund-again")
+        await gateway.aclose()
+
+    asyncio.run(run())
@@ -0,0 +1,135 @@
+"""Changes of reservations by their owner."""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+import httpx
+from fastapi.testclient import TestClient
+
+from src.infrastructure.dto.userdto import UserDTO
+from src.main import container
+from tests.conftest import (
+    RecordingDatabase,
+    Row,
+    car_row,
+    payment_gateway,
+    reservation_row,
+)
+
+
+def responder(user: UserDTO, **written: Any):
+    """A function answering the reads of a confirmed reservation.
+
+    Args:
+        user (UserDTO): The owner of the reservation.
+        **written (Any): The rows returned by the written CTEs.
+
+    Returns:
+        Callable: The responder of `RecordingDatabase`.
+    """
+
+    def respond(sql: str, kind: str) -> Any:
+        if kind == "fetch_val":
+            return "Confirmed"
+        if sql.startswith("WITH"):
+            return written.get(sql.split()[1])
+        if sql.startswith("SELECT") and "FROM reservations" in sql:
+            return reservation_row(7, user.id, "Confirmed", "Authorized")
+        if sql.startswith("SELECT") and "FROM cars" in sql:
+            return car_row()
+        if sql.startswith(("UPDATE payments", "SELECT payments")):
+            return Row(
+                id=7,
+                reservation_id=7,
+                user_id=user.id,
+                price=300.0,
+                status="Voided",
+                gateway_id="pi_fake_1",
+                created_at=None,
+            )
+        return None
+
+    return respond
+
+
+def test_paid_reservation_cannot_be_rebooked(
+        client: TestClient,
+        database: RecordingDatabase,
+        user: UserDTO,
+) -> None:
+    database.responder = responder(user)
+    start = datetime.now(timezone.utc) + timedelta(days=1)
+
+    response = client.put(
+        "/reservation/7",
+        json={
+            "car_id": 1,
+            "reservation_start": start.isoformat(),
+            "reservation_end": (start + timedelta(days=9)).isoformat(),
+        },
+    )
+
+    update = next(s for s in database.statements if s.startswith("WITH"))
+    assert response.status_code == 409
+    assert "reservations.status = " in update
+
+
+def test_paid_reservation_cannot_be_deleted(
+        client: TestClient,
+        database: RecordingDatabase,
+        user: UserDTO,
+) -> None:
+    database.responder = responder(user)
+
+    response = client.delete("/reservation/7")
+
+    delete = next(s for s in database.statements if s.startswith("DELETE"))
+    assert response.status_code == 409
+    assert "reservations.status = " in delete
+
+
+def test_cancelling_paid_reservation_voids_its_charge(
+        client: TestClient,
+        database: RecordingDatabase,
+        user: UserDTO,
+) -> None:
+    database.responder = responder(
+        user,
+        cancelled=reservation_row(7, user.id, "Cancelled", "Authorized"),
+    )
+
+    response = client.post("/reservation/7/cancel")
+
+    assert response.status_code == 200
+    assert response.json()["status"] == "Cancelled"
+    assert response.json()["payment"]["status"] == "Voided"
+    assert not any(s.startswith("DELETE") for s in database.statements)
+    assert database.statements[-1].startswith("INSERT INTO outbox")
+    assert "payment.void" in database.parameters[-1].values()
+
+
+def test_queued_capture_skips_cancelled_reservation(
+        client: TestClient,
+        database: RecordingDatabase,
+        user: UserDTO,
+) -> None:
+    database.responder = responder(
+        user,
+        cancelled=reservation_row(7, user.id, "Cancelled", "Authorized"),
+    )
+    calls = []
+    gateway = payment_gateway(httpx.MockTransport(
+        lambda request: calls.append(request) or httpx.Response(500),
+    ))
+
+    assert client.post("/reservation/7/cancel").status_code == 200
+
+    database.statements.clear()
+    with container.payment_gateway.override(gateway):
+        asyncio.run(
+            container.payment_service().handle_capture({"payment_id": 7}),
+        )
+
+    assert calls == []
+    assert len(database.statements) == 1
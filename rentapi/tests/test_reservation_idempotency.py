@@ -0,0 +1,111 @@
+"""Idempotency keys of reservation creation."""
+
+from datetime import datetime, timedelta, timezone
+
+from fastapi.testclient import TestClient
+from httpx import Response
+
+from src.infrastructure.dto.userdto import UserDTO
+from tests.conftest import RecordingDatabase, Row, car_row, reservation_row
+
+
+def test_booking_a_missing_car_releases_the_key(
+        client: TestClient,
+        database: RecordingDatabase,
+        user: UserDTO,
+) -> None:
+    start = datetime.now(timezone.utc) + timedelta(days=1)
+
+    def respond(sql: str, kind: str) -> Row | None:
+        if sql.startswith("INSERT INTO idempotency_keys"):
+            return Row(key="retry-1")
+        return None
+
+    database.responder = respond
+
+    response = client.post(
+        "/reservation/create",
+        json={
+            "car_id": 404,
+            "reservation_start": start.isoformat(),
+            "reservation_end": (start + timedelta(days=2)).isoformat(),
+        },
+        headers={"Idempotency-Key": "retry-1"},
+    )
+
+    assert response.status_code == 404
+    assert database.statements[-1].startswith("DELETE FROM idempotency_keys")
+
+
+def booking(client: TestClient) -> Response:
+    """A function retrying the booking of the first car.
+
+    Args:
+        client (TestClient): The client of the app.
+
+    Returns:
+        Response: The response of the app.
+    """
+
+    start = datetime.now(timezone.utc) + timedelta(days=1)
+
+    return client.post(
+        "/reservation/create",
+        json={
+            "car_id": 1,
+            "reservation_start": start.isoformat(),
+            "reservation_end": (start + timedelta(days=2)).isoformat(),
+        },
+        headers={"Idempotency-Key": "retry-1"},
+    )
+
+
+def test_claim_released_during_replay_is_taken_over(
+        client: TestClient,
+        database: RecordingDatabase,
+        user: UserDTO,
+) -> None:
+    claims = iter([None, Row(key="retry-1")])
+
+    def respond(sql: str, kind: str) -> Row | None:
+        if sql.startswith("INSERT INTO idempotency_keys"):
+            return next(claims)
+        if sql.startswith("SELECT") and "FROM cars" in sql:
+            return car_row()
+        if sql.startswith("WITH written"):
+            return reservation_row(7, user.id)
+        return None
+
+    database.responder = respond
+
+    response = booking(client)
+
+    assert response.status_code == 201
+    assert response.json()["id"] == 7
+
+
+def test_replay_of_deleted_reservation_is_gone(
+        client: TestClient,
+        database: RecordingDatabase,
+        user: UserDTO,
+) -> None:
+    claim = {}
+
+    def respond(sql: str, kind: str) -> Row | None:
+        if sql.startswith("INSERT INTO idempotency_keys"):
+            claim.update(database.parameters[-1])
+            return None
+        if sql.startswith("SELECT") and "FROM idempotency_keys" in sql:
+            return Row(
+                key="retry-1",
+                request_hash=claim["request_hash"],
+                reservation_id=None,
+            )
+        return None
+
+    database.responder = respond
+
+    response = booking(client)
+
+    assert response.status_code == 410
+    assert not any(s.startswith("WITH written") for s in database.statements)
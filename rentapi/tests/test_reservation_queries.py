@@ -0,0 +1,41 @@
+"""Round-trip counts of the reservation reads."""
+
+import asyncio
+import uuid
+
+import pytest
+
+from src.main import container
+from tests.conftest import RecordingDatabase, reservation_row
+
+USER_ID = uuid.uuid4()
+
+
+@pytest.mark.parametrize("rows", [1, 200])
+@pytest.mark.parametrize("method", ["get_by_user", "get_reservations"])
+def test_reservation_list_is_one_query(
+        database: RecordingDatabase,
+        method: str,
+        rows: int,
+) -> None:
+    database.responder = lambda sql, kind: [
+        reservation_row(
+            i,
+            USER_ID,
+            "Confirmed" if i % 2 == 0 else "Pending Payment",
+            "Completed" if i % 2 == 0 else None,
+        )
+        for i in range(1, rows + 1)
+    ]
+    repository = container.reservation_repository()
+    args = (USER_ID,) if method == "get_by_user" else ()
+
+    reservations = asyncio.run(getattr(repository, method)(*args))
+
+    assert len(reservations) == rows
+    assert len(database.statements) == 1
+    assert reservations[0].car.id == 1
+    assert reservations[0].user.id == USER_ID
+    assert reservations[0].payment is None
+    if rows > 1:
+        assert reservations[1].payment.id == 2
@@ -0,0 +1,154 @@
+"""Concurrency stress test of reservation creation against Postgres.
+
+Many clients book a handful of cars for random, heavily overlapping
+periods at once, and part of the requests are retried with the same
+`Idempotency-Key`. The test truncates the database configured with the
+usual `DB_*` variables, so it only runs with `DB_TESTS=1` and a migrated
+disposable database, e.g. the Compose `db` service:
+
+    DB_TESTS=1 DB_HOST=localhost DB_NAME=app DB_USER=postgres \\
+        DB_PASSWORD=pass python -m pytest tests/test_reservation_stress.py
+"""
+
+import asyncio
+import collections
+import os
+import random
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import httpx
+import pytest
+
+from src.db import car_table, database
+from src.main import app
+
+CARS = 5
+DAYS = 30
+REQUESTS = 2000
+CONCURRENCY = 64
+RETRY_RATIO = 0.2
+
+OVERLAPS = """
+    SELECT count(*)
+    FROM reservations a
+    JOIN reservations b
+      ON a.car_id = b.car_id
+     AND a.id < b.id
+     AND a.period && b.period
+    WHERE a.status <> 'Cancelled' AND b.status <> 'Cancelled'
+"""
+
+pytestmark = pytest.mark.skipif(
+    os.environ.get("DB_TESTS") != "1",
+    reason="set DB_TESTS=1 to run against a disposable Postgres",
+)
+
+
+def booking(rng: random.Random) -> dict:
+    """A function drawing a random booking within the test horizon.
+
+    Args:
+        rng (random.Random): The source of the car and the period.
+
+    Returns:
+        dict: The reservation request body.
+    """
+    start = datetime.now(timezone.utc).replace(
+        minute=0, second=0, microsecond=0,
+    ) + timedelta(days=1, hours=rng.randint(0, DAYS * 24))
+
+    return {
+        "car_id": rng.randint(1, CARS),
+        "reservation_start": start.isoformat(),
+        "reservation_end": (
+            start + timedelta(hours=rng.randint(1, 72))
+        ).isoformat(),
+    }
+
+
+async def stress(rng: random.Random) -> tuple[collections.Counter, dict]:
+    """A function firing concurrent bookings at the app.
+
+    Args:
+        rng (random.Random): The source of the bookings.
+
+    Returns:
+        tuple[collections.Counter, dict]: The response statuses and the
+            reservation ids created under each key.
+    """
+    statuses: collections.Counter = collections.Counter()
+    by_key: dict[str, set[int]] = collections.defaultdict(set)
+    pending = [(booking(rng), str(uuid.uuid4())) for _ in range(REQUESTS)]
+    pending += rng.sample(pending, int(len(pending) * RETRY_RATIO))
+    rng.shuffle(pending)
+
+    await database.execute(
+        "TRUNCATE cars, reservations, users RESTART IDENTITY CASCADE"
+    )
+    await database.execute(car_table.insert().values([
+        {
+            "brand": "Stress",
+            "model": "Test",
+            "year": "2024",
+            "price_per_day": 100.0,
+            "registration_number": f"STRESS{i:04d}",
+        }
+        for i in range(CARS)
+    ]))
+
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app),
+        base_url="http://stress",
+    ) as client:
+        credentials = {
+            "email": "stress@example.com",
+            "user_password": "stress-password",
+        }
+        await client.post("/register", json=credentials)
+        token = (await client.post("/token", json=credentials)).json()
+        client.headers["Authorization"] = f"Bearer {token['user_token']}"
+
+        remaining = iter(pending)
+
+        async def worker() -> None:
+            for body, key in remaining:
+                response = await client.post(
+                    "/reservation/create",
+                    json=body,
+                    headers={"Idempotency-Key": key},
+                )
+                statuses[response.status_code] += 1
+                if response.status_code == 201:
+                    by_key[key].add(response.json()["id"])
+
+        await asyncio.gather(*(worker() for _ in range(CONCURRENCY)))
+
+    return statuses, by_key
+
+
+def test_concurrent_bookings_never_overlap() -> None:
+    async def run() -> tuple[collections.Counter, dict, int, int]:
+        try:
+            await database.connect()
+        except OSError as e:
+            pytest.skip(f"database is not available: {e}")
+
+        try:
+            statuses, by_key = await stress(random.Random(0))
+            overlaps = await database.fetch_val(OVERLAPS)
+            stored = await database.fetch_val(
+                "SELECT count(*) FROM reservations",
+            )
+        finally:
+            await database.disconnect()
+
+        return statuses, by_key, overlaps, stored
+
+    statuses, by_key, overlaps, stored = asyncio.run(run())
+
+    assert overlaps == 0
+    assert all(len(ids) == 1 for ids in by_key.values())
+    assert stored == len(by_key)
+    assert set(statuses) <= {201, 409, 503}
+    assert statuses[201] > 0